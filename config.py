@@ -93,6 +93,9 @@ SHOPIFY_DEFAULT_AUTHOR = os.getenv("SHOPIFY_DEFAULT_AUTHOR", "")
 # Whether to automatically sync to Shopify when saving posts
 SHOPIFY_SYNC_ON_PUBLISH = os.getenv("SHOPIFY_SYNC_ON_PUBLISH", "true").lower() == "true"
 
+# Max articles processed concurrently during Shopify -> Supabase post imports
+SHOPIFY_IMPORT_CONCURRENCY = int(os.getenv("SHOPIFY_IMPORT_CONCURRENCY", "10"))
+
 # ===========================================
 # WordPress Sync Configuration
 # ===========================================
@@ -117,6 +120,9 @@ WORDPRESS_SYNC_ON_PUBLISH = os.getenv("WORDPRESS_SYNC_ON_PUBLISH", "true").lower
 # Options: yoast, rankmath, aioseo, seopress, flavor, none
 WORDPRESS_SEO_PLUGIN = os.getenv("WORDPRESS_SEO_PLUGIN", "none")
 
+# Max posts synced concurrently by the bulk WordPress sync commands
+WORDPRESS_SYNC_CONCURRENCY = int(os.getenv("WORDPRESS_SYNC_CONCURRENCY", "8"))
+
 # ===========================================
 # Link Building Configuration
 # ===========================================
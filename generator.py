@@ -68,6 +68,28 @@ from tools.write_tools import WRITE_TOOLS
 from tools.idea_tools import IDEA_TOOLS, get_pending_idea_count
 from tools.image_tools import IMAGE_TOOLS
 from tools.link_tools import LINK_TOOLS, BACKFILL_LINK_TOOLS
+from tools.http_session import close_http_session, get_http_session
+
+try:
+    import uvloop  # Optional: faster event loop for the network-heavy commands
+except ImportError:
+    uvloop = None  # Not installed, or Windows - use asyncio's default loop
+
+
+def run_async(coro):
+    """
+    Run a coroutine with asyncio.run() (uvloop.run() when installed),
+    closing the shared HTTP session before the event loop shuts down.
+    """
+    async def _run():
+        try:
+            return await coro
+        finally:
+            await close_http_session()
+
+    if uvloop is not None:
+        return uvloop.run(_run())
+    return asyncio.run(_run())
 
 
 async def health_check(verbose: bool = False) -> dict:
@@ -82,17 +104,17 @@ async def health_check(verbose: bool = False) -> dict:
 
     # Check Supabase connectivity
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?select=id&limit=1",
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    errors.append(f"Supabase error: HTTP {resp.status}")
-                elif verbose:
-                    print("✓ Supabase connected")
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?select=id&limit=1",
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as resp:
+            if resp.status != 200:
+                errors.append(f"Supabase error: HTTP {resp.status}")
+            elif verbose:
+                print("✓ Supabase connected")
     except Exception as e:
         errors.append(f"Supabase unreachable: {str(e)}")
 
@@ -912,7 +934,6 @@ async def backfill_links_single(
     Returns:
         Result dict with success status
     """
-    import aiohttp
     from config import SUPABASE_URL, get_supabase_headers
 
     if not ENABLE_LINK_BUILDING:
@@ -924,42 +945,42 @@ async def backfill_links_single(
         return {"success": False, "error": "No post identifier provided"}
 
     # Fetch the post
-    async with aiohttp.ClientSession() as session:
-        headers = get_supabase_headers()
-
-        if post_id:
-            query = f"id=eq.{post_id}"
-        else:
-            query = f"slug=eq.{post_slug}"
+    session = await get_http_session()
+    headers = get_supabase_headers()
 
-        async with session.get(
-            f"{SUPABASE_URL}/rest/v1/blog_posts?{query}&select=id,slug,title,status",
-            headers=headers
-        ) as resp:
-            if resp.status != 200:
-                print(f"Error fetching post: HTTP {resp.status}")
-                return {"success": False, "error": "Failed to fetch post"}
-            posts = await resp.json()
-
-        if not posts:
-            print(f"Post not found")
-            return {"success": False, "error": "Post not found"}
+    if post_id:
+        query = f"id=eq.{post_id}"
+    else:
+        query = f"slug=eq.{post_slug}"
 
-        post = posts[0]
+    async with session.get(
+        f"{SUPABASE_URL}/rest/v1/blog_posts?{query}&select=id,slug,title,status",
+        headers=headers
+    ) as resp:
+        if resp.status != 200:
+            print(f"Error fetching post: HTTP {resp.status}")
+            return {"success": False, "error": "Failed to fetch post"}
+        posts = await resp.json()
 
-        # Count current internal links
-        async with session.get(
-            f"{SUPABASE_URL}/rest/v1/blog_post_links?post_id=eq.{post['id']}&link_type=eq.internal&select=id",
-            headers={**headers, "Prefer": "count=exact"}
-        ) as resp:
-            content_range = resp.headers.get("content-range", "")
-            current_links = 0
-            if "/" in content_range:
-                try:
-                    total = content_range.split("/")[1]
-                    current_links = int(total) if total != "*" else 0
-                except (ValueError, IndexError):
-                    pass
+    if not posts:
+        print(f"Post not found")
+        return {"success": False, "error": "Post not found"}
+
+    post = posts[0]
+
+    # Count current internal links
+    async with session.get(
+        f"{SUPABASE_URL}/rest/v1/blog_post_links?post_id=eq.{post['id']}&link_type=eq.internal&select=id",
+        headers={**headers, "Prefer": "count=exact"}
+    ) as resp:
+        content_range = resp.headers.get("content-range", "")
+        current_links = 0
+        if "/" in content_range:
+            try:
+                total = content_range.split("/")[1]
+                current_links = int(total) if total != "*" else 0
+            except (ValueError, IndexError):
+                pass
 
     # Build post info for the backfill prompt
     post_info = {
@@ -1444,7 +1465,7 @@ Examples:
     # Health check (skip for status-only commands)
     skip_health_check = args.status or args.shopify_status or args.shopify_status_categories or args.wordpress_status or args.wordpress_status_categories
     if not skip_health_check:
-        health = asyncio.run(health_check(verbose=args.verbose))
+        health = run_async(health_check(verbose=args.verbose))
         if not health["success"]:
             print("Health check failed:")
             for error in health["errors"]:
@@ -1453,7 +1474,7 @@ Examples:
 
     # Run appropriate mode
     if args.status:
-        asyncio.run(get_queue_status())
+        run_async(get_queue_status())
 
     # Shopify sync commands
     elif args.shopify_sync_categories:
@@ -1461,7 +1482,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import sync_all_categories
-        result = asyncio.run(sync_all_categories(force=args.force))
+        result = run_async(sync_all_categories(force=args.force))
         print(f"\nSynced: {result['synced']} | Failed: {result['failed']} | Skipped: {result['skipped']}")
 
     elif args.shopify_sync_category:
@@ -1469,7 +1490,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import sync_category_by_slug
-        success = asyncio.run(sync_category_by_slug(args.shopify_sync_category, force=args.force))
+        success = run_async(sync_category_by_slug(args.shopify_sync_category, force=args.force))
         sys.exit(0 if success else 1)
 
     elif args.shopify_sync:
@@ -1477,7 +1498,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import sync_post_by_slug
-        success = asyncio.run(sync_post_by_slug(args.shopify_sync, force=args.force))
+        success = run_async(sync_post_by_slug(args.shopify_sync, force=args.force))
         sys.exit(0 if success else 1)
 
     elif args.shopify_sync_id:
@@ -1485,7 +1506,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import sync_post_by_id
-        success = asyncio.run(sync_post_by_id(args.shopify_sync_id, force=args.force))
+        success = run_async(sync_post_by_id(args.shopify_sync_id, force=args.force))
         sys.exit(0 if success else 1)
 
     elif args.shopify_sync_all:
@@ -1507,7 +1528,7 @@ Examples:
             print("Aborted.")
             sys.exit(0)
         from tools.shopify_sync import sync_all_posts
-        result = asyncio.run(sync_all_posts(force=args.force))
+        result = run_async(sync_all_posts(force=args.force))
         print(f"\nSynced: {result['synced']} | Failed: {result['failed']} | Skipped: {result['skipped']}")
 
     elif args.shopify_sync_recent:
@@ -1515,7 +1536,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import sync_recent
-        result = asyncio.run(sync_recent(args.shopify_sync_recent, force=args.force))
+        result = run_async(sync_recent(args.shopify_sync_recent, force=args.force))
         print(f"\nSynced: {result['synced']} | Failed: {result['failed']} | Skipped: {result['skipped']}")
 
     elif args.shopify_sync_slugs:
@@ -1539,13 +1560,13 @@ Examples:
 
         for slug in slugs:
             # First check if post exists
-            post = asyncio.run(get_post_by_slug(slug))
+            post = run_async(get_post_by_slug(slug))
             if not post:
                 print(f"Post not found: {slug}")
                 not_found.append(slug)
                 continue
 
-            success = asyncio.run(sync_post_by_slug(slug, force=args.force))
+            success = run_async(sync_post_by_slug(slug, force=args.force))
             if success:
                 synced.append(slug)
             else:
@@ -1576,21 +1597,21 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import show_sync_status
-        asyncio.run(show_sync_status())
+        run_async(show_sync_status())
 
     elif args.shopify_status_categories:
         if not ENABLE_SHOPIFY_SYNC:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import show_category_sync_status
-        asyncio.run(show_category_sync_status())
+        run_async(show_category_sync_status())
 
     elif args.shopify_import_categories:
         if not ENABLE_SHOPIFY_SYNC:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import import_categories_from_shopify
-        result = asyncio.run(import_categories_from_shopify(force_pull=args.force_pull))
+        result = run_async(import_categories_from_shopify(force_pull=args.force_pull))
         print(f"\nImported: {result['imported']} | Updated: {result['updated']} | Skipped: {result['skipped']}")
 
     elif args.shopify_import_tags:
@@ -1598,7 +1619,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import import_tags_from_shopify
-        result = asyncio.run(import_tags_from_shopify(force_pull=args.force_pull))
+        result = run_async(import_tags_from_shopify(force_pull=args.force_pull))
         print(f"\nImported: {result['imported']} | Updated: {result['updated']} | Skipped: {result['skipped']}")
 
     elif args.shopify_import_posts:
@@ -1620,7 +1641,7 @@ Examples:
                 print("Aborted.")
                 sys.exit(0)
         from tools.shopify_sync import import_posts_from_shopify
-        result = asyncio.run(import_posts_from_shopify(force_pull=args.force_pull))
+        result = run_async(import_posts_from_shopify(force_pull=args.force_pull))
         print(f"\nImported: {result['imported']} | Updated: {result['updated']} | Skipped: {result['skipped']}")
 
     elif args.shopify_import_post:
@@ -1628,7 +1649,7 @@ Examples:
             print("Shopify sync is not enabled. Set ENABLE_SHOPIFY_SYNC=true in .env")
             sys.exit(1)
         from tools.shopify_sync import import_single_post_from_shopify
-        success = asyncio.run(import_single_post_from_shopify(args.shopify_import_post))
+        success = run_async(import_single_post_from_shopify(args.shopify_import_post))
         if not success:
             sys.exit(1)
 
@@ -1655,7 +1676,7 @@ Examples:
             print("Aborted.")
             sys.exit(0)
         from tools.shopify_sync import import_all_from_shopify
-        result = asyncio.run(import_all_from_shopify(force_pull=args.force_pull))
+        result = run_async(import_all_from_shopify(force_pull=args.force_pull))
         print(f"\n=== Shopify Import Summary ===")
         print(f"Categories - Imported: {result['categories']['imported']} | Updated: {result['categories']['updated']} | Skipped: {result['categories']['skipped']}")
         print(f"Tags       - Imported: {result['tags']['imported']} | Updated: {result['tags']['updated']} | Skipped: {result['tags']['skipped']}")
@@ -1667,7 +1688,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import sync_all_categories as wp_sync_all_categories
-        result = asyncio.run(wp_sync_all_categories(force=args.force))
+        result = run_async(wp_sync_all_categories(force=args.force))
         print(f"\nSynced: {result['synced']} | Failed: {result['failed']} | Skipped: {result['skipped']}")
 
     elif args.wordpress_sync_category:
@@ -1675,7 +1696,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import sync_category_by_slug as wp_sync_category_by_slug
-        success = asyncio.run(wp_sync_category_by_slug(args.wordpress_sync_category, force=args.force))
+        success = run_async(wp_sync_category_by_slug(args.wordpress_sync_category, force=args.force))
         sys.exit(0 if success else 1)
 
     elif args.wordpress_sync:
@@ -1683,7 +1704,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import sync_post_by_slug as wp_sync_post_by_slug
-        success = asyncio.run(wp_sync_post_by_slug(args.wordpress_sync, force=args.force))
+        success = run_async(wp_sync_post_by_slug(args.wordpress_sync, force=args.force))
         sys.exit(0 if success else 1)
 
     elif args.wordpress_sync_id:
@@ -1691,7 +1712,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import sync_post_by_id as wp_sync_post_by_id
-        success = asyncio.run(wp_sync_post_by_id(args.wordpress_sync_id, force=args.force))
+        success = run_async(wp_sync_post_by_id(args.wordpress_sync_id, force=args.force))
         sys.exit(0 if success else 1)
 
     elif args.wordpress_sync_all:
@@ -1699,7 +1720,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import sync_all_posts as wp_sync_all_posts
-        result = asyncio.run(wp_sync_all_posts(force=args.force))
+        result = run_async(wp_sync_all_posts(force=args.force))
         print(f"\nSynced: {result['synced']} | Failed: {result['failed']} | Skipped: {result['skipped']}")
 
     elif args.wordpress_sync_recent:
@@ -1707,7 +1728,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import sync_recent as wp_sync_recent
-        result = asyncio.run(wp_sync_recent(args.wordpress_sync_recent, force=args.force))
+        result = run_async(wp_sync_recent(args.wordpress_sync_recent, force=args.force))
         print(f"\nSynced: {result['synced']} | Failed: {result['failed']} | Skipped: {result['skipped']}")
 
     elif args.wordpress_status:
@@ -1715,21 +1736,21 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import show_sync_status as wp_show_sync_status
-        asyncio.run(wp_show_sync_status())
+        run_async(wp_show_sync_status())
 
     elif args.wordpress_status_categories:
         if not ENABLE_WORDPRESS_SYNC:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import show_category_sync_status as wp_show_category_sync_status
-        asyncio.run(wp_show_category_sync_status())
+        run_async(wp_show_category_sync_status())
 
     elif args.wordpress_import_categories:
         if not ENABLE_WORDPRESS_SYNC:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import import_categories_from_wordpress
-        result = asyncio.run(import_categories_from_wordpress(force_pull=args.force_pull))
+        result = run_async(import_categories_from_wordpress(force_pull=args.force_pull))
         print(f"\nImported: {result['imported']} | Updated: {result['updated']} | Skipped: {result['skipped']}")
 
     elif args.wordpress_import_tags:
@@ -1737,7 +1758,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import import_tags_from_wordpress
-        result = asyncio.run(import_tags_from_wordpress(force_pull=args.force_pull))
+        result = run_async(import_tags_from_wordpress(force_pull=args.force_pull))
         print(f"\nImported: {result['imported']} | Updated: {result['updated']} | Skipped: {result['skipped']}")
 
     elif args.wordpress_import_posts:
@@ -1745,7 +1766,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import import_posts_from_wordpress
-        result = asyncio.run(import_posts_from_wordpress(force_pull=args.force_pull))
+        result = run_async(import_posts_from_wordpress(force_pull=args.force_pull))
         print(f"\nImported: {result['imported']} | Updated: {result['updated']} | Skipped: {result['skipped']}")
 
     elif args.wordpress_import_all:
@@ -1753,7 +1774,7 @@ Examples:
             print("WordPress sync is not enabled. Set ENABLE_WORDPRESS_SYNC=true in .env")
             sys.exit(1)
         from tools.wordpress_sync import import_all_from_wordpress
-        result = asyncio.run(import_all_from_wordpress(force_pull=args.force_pull))
+        result = run_async(import_all_from_wordpress(force_pull=args.force_pull))
         print(f"\n=== WordPress Import Summary ===")
         print(f"Categories - Imported: {result['categories']['imported']} | Updated: {result['categories']['updated']} | Skipped: {result['categories']['skipped']}")
         print(f"Tags       - Imported: {result['tags']['imported']} | Updated: {result['tags']['updated']} | Skipped: {result['tags']['skipped']}")
@@ -1761,7 +1782,7 @@ Examples:
 
     elif args.autonomous:
         print(f"Autonomous Mode: Processing up to {args.count} idea(s) from queue")
-        results = asyncio.run(process_idea_queue(count=args.count, verbose=args.verbose))
+        results = run_async(process_idea_queue(count=args.count, verbose=args.verbose))
 
         # Summary
         print("\n" + "="*50)
@@ -1774,27 +1795,27 @@ Examples:
 
     elif args.backfill_images:
         print(f"Backfill Mode: Generating images for up to {args.count} post(s)")
-        asyncio.run(backfill_images(count=args.count, verbose=args.verbose))
+        run_async(backfill_images(count=args.count, verbose=args.verbose))
 
     elif args.backfill_images_all:
         print("Backfill Mode: Generating images for ALL posts without them")
-        asyncio.run(backfill_images(count=1000, verbose=args.verbose))
+        run_async(backfill_images(count=1000, verbose=args.verbose))
 
     elif args.backfill_links:
         print(f"Backfill Mode: Adding links to up to {args.count} post(s)")
-        asyncio.run(backfill_links(count=args.count, verbose=args.verbose))
+        run_async(backfill_links(count=args.count, verbose=args.verbose))
 
     elif args.backfill_links_all:
         print("Backfill Mode: Adding links to ALL posts that need them")
-        asyncio.run(backfill_links(count=1000, verbose=args.verbose))
+        run_async(backfill_links(count=1000, verbose=args.verbose))
 
     elif args.backfill_links_id:
         print(f"Backfill Mode: Adding links to post ID '{args.backfill_links_id}'")
-        asyncio.run(backfill_links_single(post_id=args.backfill_links_id, verbose=args.verbose))
+        run_async(backfill_links_single(post_id=args.backfill_links_id, verbose=args.verbose))
 
     elif args.backfill_links_slug:
         print(f"Backfill Mode: Adding links to post '{args.backfill_links_slug}'")
-        asyncio.run(backfill_links_single(post_slug=args.backfill_links_slug, verbose=args.verbose))
+        run_async(backfill_links_single(post_slug=args.backfill_links_slug, verbose=args.verbose))
 
     elif args.cleanup_links_all:
         print("Cleanup Mode: Removing internal links from ALL published posts")
@@ -1804,14 +1825,14 @@ Examples:
             print("Cancelled.")
             sys.exit(0)
         from tools.link_tools import cleanup_internal_links
-        results = asyncio.run(cleanup_internal_links(all_posts=True))
+        results = run_async(cleanup_internal_links(all_posts=True))
         total_removed = sum(r.get("removed", 0) for r in results if r.get("success"))
         print(f"\nCleaned {len(results)} posts, removed {total_removed} internal links")
 
     elif args.cleanup_links_id:
         from tools.link_tools import remove_internal_links_from_post
         print(f"Cleanup Mode: Removing internal links from post ID '{args.cleanup_links_id}'")
-        result = asyncio.run(remove_internal_links_from_post(args.cleanup_links_id))
+        result = run_async(remove_internal_links_from_post(args.cleanup_links_id))
         if result.get("success"):
             print(f"Removed {result.get('removed', 0)} internal links from {result.get('post_slug', 'post')}")
         else:
@@ -1820,7 +1841,7 @@ Examples:
     elif args.cleanup_links:
         from tools.link_tools import cleanup_internal_links
         print(f"Cleanup Mode: Removing internal links from '{args.cleanup_links}'")
-        results = asyncio.run(cleanup_internal_links(post_slugs=[args.cleanup_links]))
+        results = run_async(cleanup_internal_links(post_slugs=[args.cleanup_links]))
         if results and results[0].get("success"):
             print(f"Removed {results[0].get('removed', 0)} internal links")
         else:
@@ -1829,7 +1850,7 @@ Examples:
     elif args.remove_link:
         from tools.link_tools import remove_single_link_by_id
         print(f"Cleanup Mode: Removing single link with ID '{args.remove_link}'")
-        result = asyncio.run(remove_single_link_by_id(args.remove_link))
+        result = run_async(remove_single_link_by_id(args.remove_link))
         if result.get("success"):
             print(f"Removed link from '{result.get('post_slug', 'post')}'")
             print(f"  URL: {result.get('url', 'N/A')}")
@@ -1843,7 +1864,7 @@ Examples:
     elif args.cleanup_image:
         from tools.image_tools import cleanup_post_image
         print(f"Cleanup Mode: Removing featured image from '{args.cleanup_image}'")
-        result = asyncio.run(cleanup_post_image(post_slug=args.cleanup_image, verbose=args.verbose))
+        result = run_async(cleanup_post_image(post_slug=args.cleanup_image, verbose=args.verbose))
         if result.get("success"):
             print(f"Cleaned up image for '{result.get('post_slug')}'")
             print(f"Storage path: {result.get('storage_path')}")
@@ -1853,7 +1874,7 @@ Examples:
     elif args.cleanup_image_id:
         from tools.image_tools import cleanup_post_image
         print(f"Cleanup Mode: Removing featured image from post ID '{args.cleanup_image_id}'")
-        result = asyncio.run(cleanup_post_image(post_id=args.cleanup_image_id, verbose=args.verbose))
+        result = run_async(cleanup_post_image(post_id=args.cleanup_image_id, verbose=args.verbose))
         if result.get("success"):
             print(f"Cleaned up image for '{result.get('post_slug')}'")
             print(f"Storage path: {result.get('storage_path')}")
@@ -1864,7 +1885,7 @@ Examples:
         from tools.image_tools import refresh_post_image
         print(f"Refresh Mode: Replacing featured image for '{args.refresh_image}'")
         print("="*50)
-        result = asyncio.run(refresh_post_image(post_slug=args.refresh_image, verbose=args.verbose))
+        result = run_async(refresh_post_image(post_slug=args.refresh_image, verbose=args.verbose))
         print("="*50)
         if result.get("success"):
             print(f"SUCCESS: New image for '{result.get('post_slug')}'")
@@ -1879,7 +1900,7 @@ Examples:
         from tools.image_tools import refresh_post_image
         print(f"Refresh Mode: Replacing featured image for post ID '{args.refresh_image_id}'")
         print("="*50)
-        result = asyncio.run(refresh_post_image(post_id=args.refresh_image_id, verbose=args.verbose))
+        result = run_async(refresh_post_image(post_id=args.refresh_image_id, verbose=args.verbose))
         print("="*50)
         if result.get("success"):
             print(f"SUCCESS: New image for '{result.get('post_slug')}'")
@@ -1891,13 +1912,13 @@ Examples:
                 print("Run --backfill-images to generate a new image later.")
 
     elif args.interactive:
-        asyncio.run(interactive_mode(verbose=args.verbose))
+        run_async(interactive_mode(verbose=args.verbose))
 
     elif args.batch:
-        asyncio.run(generate_batch(args.batch, verbose=args.verbose))
+        run_async(generate_batch(args.batch, verbose=args.verbose))
 
     elif args.topic:
-        result = asyncio.run(generate_blog_post(args.topic, verbose=args.verbose))
+        result = run_async(generate_blog_post(args.topic, verbose=args.verbose))
 
         if result["success"]:
             print(f"\nBlog post created successfully!")
@@ -0,0 +1,166 @@
+"""
+HTTP Session - Shared, pooled aiohttp session
+
+Opening a new aiohttp.ClientSession for every request pays a fresh
+TCP + TLS handshake each time. Helpers that talk to Supabase, Shopify
+or WordPress can use get_http_session() instead so keep-alive
+connections and DNS lookups are reused for the whole command.
+
+Shopify GraphQL goes through this session too. Its concurrency is
+bounded by the store's query cost bucket rather than by connections, so
+a small pool of keep-alive HTTP/1.1 connections (limit_per_host) is
+enough - no separate HTTP/2 client is needed.
+
+The CLI runs each command in its own asyncio.run(), so the session is
+tied to the event loop that created it and rebuilt when a different
+loop asks for one. Call close_http_session() before the loop exits
+(generator.run_async does this) to release connections cleanly.
+"""
+
+import asyncio
+import json
+import random
+from typing import Optional
+import aiohttp
+
+try:
+    import orjson  # Optional: faster JSON encode/decode for request and response bodies
+except ImportError:
+    orjson = None
+
+
+def _json_serialize(obj) -> str:
+    """Serialize json= request bodies, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_dumps(payload) -> bytes:
+    """Serialize a request body to compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data):
+    """
+    Parse a JSON response body, bytes or str (orjson when available).
+
+    Use as `json_loads(await resp.read())`, or `await resp.json(loads=json_loads)`
+    where aiohttp's content-type check is wanted.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session for the running event loop.
+
+    The session carries no default headers or timeout - callers pass
+    their own per request, exactly as they would with a private session.
+    aiohttp already sends Accept-Encoding: gzip, deflate and decompresses
+    responses, so callers need not ask for compression themselves.
+    Do not close the returned session; use close_http_session().
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # Connections stay open between requests, so a repeat call to the
+        # same host skips DNS, TCP and TLS setup. aiohttp already shares one
+        # default SSLContext across connections; ALPN is left at http/1.1
+        # since aiohttp cannot speak h2.
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,  # Seconds - outlasts a typical sync run
+                keepalive_timeout=300,
+            ),
+            json_serialize=_json_serialize,
+        )
+        _session_loop = loop
+
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared session, if one is open on the running event loop."""
+    global _session, _session_loop
+
+    if (
+        _session is not None
+        and not _session.closed
+        and _session_loop is asyncio.get_running_loop()
+    ):
+        await _session.close()
+
+    _session = None
+    _session_loop = None
+
+
+# Transient statuses worth retrying (rate limited / upstream unavailable)
+RETRY_STATUSES = (429, 502, 503, 504)
+MAX_RETRY_DELAY = 30.0
+
+# Methods safe to replay after a 502/503/504 - the server may already have
+# acted on the first attempt. Other requests (e.g. a POST that creates a row)
+# are only retried on 429, which means the request was refused outright.
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PATCH")
+
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before the next attempt: Retry-After if given, else jittered 2^attempt."""
+    # Jitter keeps concurrent workers that failed together from retrying in lockstep
+    backoff = 2 ** attempt + random.random()
+    retry_after = resp.headers.get("Retry-After")
+    try:
+        delay = float(retry_after) if retry_after else backoff
+    except ValueError:
+        # Retry-After may also be an HTTP date - fall back to backoff
+        delay = backoff
+    return min(delay, MAX_RETRY_DELAY)
+
+
+async def request_with_retry(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    max_attempts: int = 5,
+    idempotent: Optional[bool] = None,
+    **kwargs,
+) -> aiohttp.ClientResponse:
+    """
+    Send a request, retrying 429/5xx-unavailable responses with backoff.
+
+    5xx responses are only retried for idempotent requests - by default
+    those in IDEMPOTENT_METHODS. Pass idempotent=True for a POST that is
+    safe to replay (e.g. an upsert or a read-only query), or False to
+    limit any request to 429 retries.
+
+    Honors the server's Retry-After header when present. The final
+    response is returned whatever its status, so callers keep their
+    usual status checks:
+
+        async with await request_with_retry(session, "GET", url, headers=h) as resp:
+            ...
+    """
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    retry_statuses = RETRY_STATUSES if idempotent else (429,)
+
+    for attempt in range(max_attempts):
+        resp = await session.request(method, url, **kwargs)
+        if resp.status not in retry_statuses or attempt == max_attempts - 1:
+            return resp
+
+        delay = _retry_delay(resp, attempt)
+        resp.release()
+        await asyncio.sleep(delay)
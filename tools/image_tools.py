@@ -28,6 +28,7 @@ from config import (
     SUPABASE_SERVICE_KEY,
     SUPABASE_STORAGE_BUCKET,
 )
+from tools.http_session import get_http_session
 
 # Aspect ratio to height calculation
 ASPECT_RATIOS = {
@@ -342,17 +343,17 @@ async def delete_image_from_storage(file_path: str) -> bool:
         return True  # Nothing to delete
 
     try:
-        async with aiohttp.ClientSession() as session:
-            storage_url = f"{SUPABASE_URL}/storage/v1/object/{SUPABASE_STORAGE_BUCKET}/{file_path}"
+        session = await get_http_session()
+        storage_url = f"{SUPABASE_URL}/storage/v1/object/{SUPABASE_STORAGE_BUCKET}/{file_path}"
 
-            headers = {
-                "apikey": SUPABASE_SERVICE_KEY,
-                "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
-            }
+        headers = {
+            "apikey": SUPABASE_SERVICE_KEY,
+            "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
+        }
 
-            async with session.delete(storage_url, headers=headers) as resp:
-                # 200 = deleted, 404 = didn't exist (both are fine)
-                return resp.status in [200, 204, 404]
+        async with session.delete(storage_url, headers=headers) as resp:
+            # 200 = deleted, 404 = didn't exist (both are fine)
+            return resp.status in [200, 204, 404]
     except Exception:
         return False
 
@@ -389,25 +390,25 @@ async def get_post_for_image_cleanup(post_id: str = None, post_slug: str = None)
         Post dict with id, slug, title, featured_image, blog_categories(slug)
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            from tools.write_tools import get_supabase_headers
-            headers = get_supabase_headers()
-
-            if post_id:
-                query = f"id=eq.{post_id}"
-            elif post_slug:
-                query = f"slug=eq.{post_slug}"
-            else:
-                return None
-
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?{query}&select=id,slug,title,excerpt,featured_image,featured_image_alt,blog_categories(slug)&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
+        session = await get_http_session()
+        from tools.write_tools import get_supabase_headers
+        headers = get_supabase_headers()
+
+        if post_id:
+            query = f"id=eq.{post_id}"
+        elif post_slug:
+            query = f"slug=eq.{post_slug}"
+        else:
+            return None
+
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?{query}&select=id,slug,title,excerpt,featured_image,featured_image_alt,blog_categories(slug)&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json()
+                return posts[0] if posts else None
+            return None
     except Exception:
         return None
 
@@ -416,23 +417,23 @@ async def clear_post_image_fields(post_id: str) -> bool:
     """Set featured_image and featured_image_alt to NULL in the database."""
     from datetime import datetime, timezone
     try:
-        async with aiohttp.ClientSession() as session:
-            from tools.write_tools import get_supabase_headers
-            headers = get_supabase_headers()
-
-            # Use JSON null to set fields to NULL, update timestamp to trigger webhooks
-            update_data = {
-                "featured_image": None,
-                "featured_image_alt": None,
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }
+        session = await get_http_session()
+        from tools.write_tools import get_supabase_headers
+        headers = get_supabase_headers()
+
+        # Use JSON null to set fields to NULL, update timestamp to trigger webhooks
+        update_data = {
+            "featured_image": None,
+            "featured_image_alt": None,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
 
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json=update_data
+        ) as resp:
+            return resp.status in [200, 204]
     except Exception:
         return False
 
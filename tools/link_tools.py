@@ -24,6 +24,7 @@ from config import (
     LINK_SUGGESTIONS_LIMIT,
     ANTHROPIC_API_KEY,
 )
+from tools.http_session import get_http_session
 
 
 def build_internal_url(slug: str, category_slug: str = None) -> str:
@@ -271,74 +272,74 @@ Respond with ONLY a JSON array:
 [{{"score": 8, "anchors": ["specific phrase 1", "specific phrase 2"], "anti": ["avoid1"], "intent": "core concept"}}, {{"score": 2, "anchors": [], "anti": [], "intent": ""}}]"""
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": ANTHROPIC_API_KEY,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": "claude-3-5-haiku-20241022",
-                    "max_tokens": 800,
-                    "messages": [{"role": "user", "content": prompt}]
-                },
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                if resp.status != 200:
-                    # On error, fall back to regex patterns (no anti-patterns available)
-                    for c in candidates:
-                        c["anchor_patterns"] = extract_anchor_patterns(c["title"])
-                        c["anti_patterns"] = []
-                        c["semantic_intent"] = ""
-                    return candidates
-
-                result = await resp.json()
-                response_text = result.get("content", [{}])[0].get("text", "")
-
-                # Parse the JSON array
-                response_text = response_text.strip()
-                if response_text.startswith("```"):
-                    response_text = response_text.split("\n", 1)[-1].rsplit("```", 1)[0]
-
-                evaluations = json.loads(response_text)
-
-                if not isinstance(evaluations, list) or len(evaluations) != len(candidates):
-                    # Invalid response, fall back (no anti-patterns available)
-                    for c in candidates:
-                        c["anchor_patterns"] = extract_anchor_patterns(c["title"])
-                        c["anti_patterns"] = []
-                        c["semantic_intent"] = ""
-                    return candidates
-
-                # Filter to relevant candidates and add AI-generated patterns
-                relevant = []
-                for candidate, evaluation in zip(candidates, evaluations):
-                    score = evaluation.get("score", 0)
-                    anchors = evaluation.get("anchors", [])
-                    anti_patterns = evaluation.get("anti", [])
-                    semantic_intent = evaluation.get("intent", "")
-
-                    if isinstance(score, (int, float)) and score >= 8:
-                        # Filter anchors to only quality ones
-                        quality_anchors = filter_quality_anchors(anchors)
-
-                        # Fall back to extracted patterns if no quality anchors
-                        if not quality_anchors:
-                            quality_anchors = filter_quality_anchors(extract_anchor_patterns(candidate["title"]))
-
-                        # Skip candidate entirely if no quality anchors available
-                        if not quality_anchors:
-                            continue
-
-                        candidate["relevance_score"] = score
-                        candidate["anchor_patterns"] = quality_anchors
-                        candidate["anti_patterns"] = anti_patterns if anti_patterns else []
-                        candidate["semantic_intent"] = semantic_intent
-                        relevant.append(candidate)
-
-                return relevant
+        session = await get_http_session()
+        async with session.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": ANTHROPIC_API_KEY,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": "claude-3-5-haiku-20241022",
+                "max_tokens": 800,
+                "messages": [{"role": "user", "content": prompt}]
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status != 200:
+                # On error, fall back to regex patterns (no anti-patterns available)
+                for c in candidates:
+                    c["anchor_patterns"] = extract_anchor_patterns(c["title"])
+                    c["anti_patterns"] = []
+                    c["semantic_intent"] = ""
+                return candidates
+
+            result = await resp.json()
+            response_text = result.get("content", [{}])[0].get("text", "")
+
+            # Parse the JSON array
+            response_text = response_text.strip()
+            if response_text.startswith("```"):
+                response_text = response_text.split("\n", 1)[-1].rsplit("```", 1)[0]
+
+            evaluations = json.loads(response_text)
+
+            if not isinstance(evaluations, list) or len(evaluations) != len(candidates):
+                # Invalid response, fall back (no anti-patterns available)
+                for c in candidates:
+                    c["anchor_patterns"] = extract_anchor_patterns(c["title"])
+                    c["anti_patterns"] = []
+                    c["semantic_intent"] = ""
+                return candidates
+
+            # Filter to relevant candidates and add AI-generated patterns
+            relevant = []
+            for candidate, evaluation in zip(candidates, evaluations):
+                score = evaluation.get("score", 0)
+                anchors = evaluation.get("anchors", [])
+                anti_patterns = evaluation.get("anti", [])
+                semantic_intent = evaluation.get("intent", "")
+
+                if isinstance(score, (int, float)) and score >= 8:
+                    # Filter anchors to only quality ones
+                    quality_anchors = filter_quality_anchors(anchors)
+
+                    # Fall back to extracted patterns if no quality anchors
+                    if not quality_anchors:
+                        quality_anchors = filter_quality_anchors(extract_anchor_patterns(candidate["title"]))
+
+                    # Skip candidate entirely if no quality anchors available
+                    if not quality_anchors:
+                        continue
+
+                    candidate["relevance_score"] = score
+                    candidate["anchor_patterns"] = quality_anchors
+                    candidate["anti_patterns"] = anti_patterns if anti_patterns else []
+                    candidate["semantic_intent"] = semantic_intent
+                    relevant.append(candidate)
+
+            return relevant
 
     except Exception as e:
         # On any error, fail open with regex patterns (no anti-patterns available)
@@ -424,27 +425,27 @@ Answer ONLY "yes" or "no".
 - "no" = generic, loosely related, or unhelpful"""
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": ANTHROPIC_API_KEY,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": "claude-3-5-haiku-20241022",
-                    "max_tokens": 10,
-                    "messages": [{"role": "user", "content": prompt}]
-                },
-                timeout=aiohttp.ClientTimeout(total=15)
-            ) as resp:
-                if resp.status != 200:
-                    return True  # Fail open on API error
+        session = await get_http_session()
+        async with session.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": ANTHROPIC_API_KEY,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": "claude-3-5-haiku-20241022",
+                "max_tokens": 10,
+                "messages": [{"role": "user", "content": prompt}]
+            },
+            timeout=aiohttp.ClientTimeout(total=15)
+        ) as resp:
+            if resp.status != 200:
+                return True  # Fail open on API error
 
-                result = await resp.json()
-                response_text = result.get("content", [{}])[0].get("text", "").lower().strip()
-                return response_text.startswith("yes")
+            result = await resp.json()
+            response_text = result.get("content", [{}])[0].get("text", "").lower().strip()
+            return response_text.startswith("yes")
 
     except Exception:
         return True  # Fail open on error
@@ -545,49 +546,49 @@ Answer with ONLY a JSON array of booleans: [true, false, true]
 - false = generic anchor, loosely related, or reader wouldn't benefit"""
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": ANTHROPIC_API_KEY,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": "claude-3-5-haiku-20241022",
-                    "max_tokens": 100,
-                    "messages": [{"role": "user", "content": prompt}]
-                },
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                if resp.status != 200:
-                    return insertions  # Fail open
+        session = await get_http_session()
+        async with session.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": ANTHROPIC_API_KEY,
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+            json={
+                "model": "claude-3-5-haiku-20241022",
+                "max_tokens": 100,
+                "messages": [{"role": "user", "content": prompt}]
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status != 200:
+                return insertions  # Fail open
 
-                result = await resp.json()
-                response_text = result.get("content", [{}])[0].get("text", "").strip()
+            result = await resp.json()
+            response_text = result.get("content", [{}])[0].get("text", "").strip()
 
-                # Parse JSON array
-                if response_text.startswith("```"):
-                    response_text = response_text.split("\n", 1)[-1].rsplit("```", 1)[0]
+            # Parse JSON array
+            if response_text.startswith("```"):
+                response_text = response_text.split("\n", 1)[-1].rsplit("```", 1)[0]
 
-                validations_result = json.loads(response_text)
+            validations_result = json.loads(response_text)
 
-                if not isinstance(validations_result, list):
-                    return insertions
+            if not isinstance(validations_result, list):
+                return insertions
 
-                # Filter to only valid insertions
-                valid_insertions = []
-                validation_idx = 0
-                for ctx in contexts:
-                    if ctx["context"]:
-                        if validation_idx < len(validations_result) and validations_result[validation_idx]:
-                            valid_insertions.append(ctx["insertion"])
-                        validation_idx += 1
-                    else:
-                        # No context found, include anyway
+            # Filter to only valid insertions
+            valid_insertions = []
+            validation_idx = 0
+            for ctx in contexts:
+                if ctx["context"]:
+                    if validation_idx < len(validations_result) and validations_result[validation_idx]:
                         valid_insertions.append(ctx["insertion"])
+                    validation_idx += 1
+                else:
+                    # No context found, include anyway
+                    valid_insertions.append(ctx["insertion"])
 
-                return valid_insertions
+            return valid_insertions
 
     except Exception:
         return insertions  # Fail open
@@ -610,185 +611,185 @@ async def get_internal_link_suggestions(args: dict[str, Any]) -> dict[str, Any]:
         if not topic:
             return {"content": [{"type": "text", "text": "Error: topic required"}], "is_error": True}
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            # First, check total published post count to assess catalog size
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id&status=eq.published",
-                headers={**headers, "Prefer": "count=exact"}
-            ) as resp:
-                # Get count from content-range header
-                content_range = resp.headers.get("content-range", "")
-                total_posts = 0
-                if "/" in content_range:
-                    try:
-                        total_posts = int(content_range.split("/")[1])
-                    except (ValueError, IndexError):
-                        pass
-
-            # If catalog is very small, skip internal linking
-            if total_posts < 3:
-                return {
-                    "content": [{
-                        "type": "text",
-                        "text": json.dumps({
-                            "skip_internal_links": True,
-                            "reason": f"Catalog too small ({total_posts} posts). Skip internal linking for now.",
-                            "suggestions": []
-                        }, separators=(',', ':'))
-                    }]
-                }
+        # First, check total published post count to assess catalog size
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id&status=eq.published",
+            headers={**headers, "Prefer": "count=exact"}
+        ) as resp:
+            # Get count from content-range header
+            content_range = resp.headers.get("content-range", "")
+            total_posts = 0
+            if "/" in content_range:
+                try:
+                    total_posts = int(content_range.split("/")[1])
+                except (ValueError, IndexError):
+                    pass
 
-            # Build query for published posts with category info
-            select = "slug,title,excerpt,blog_categories(slug)"
-            base_url = f"{SUPABASE_URL}/rest/v1/blog_posts?select={select}&status=eq.published"
-
-            # Exclude current post if specified
-            if exclude_slug:
-                base_url += f"&slug=neq.{exclude_slug}"
-
-            # Strategy 1: Same category posts (if category_id provided)
-            same_category_posts = []
-            if category_id:
-                async with session.get(
-                    f"{base_url}&category_id=eq.{category_id}&order=created_at.desc&limit={limit}",
-                    headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        same_category_posts = await resp.json()
-
-            # Strategy 2: Search by topic keywords in title
-            # Use ilike for case-insensitive partial match on first keyword
-            keywords = topic.lower().split()[:3]  # First 3 words
-            title_matches = []
-
-            if keywords:
-                # Search for posts with any keyword in title
-                keyword = keywords[0]  # Primary keyword
-                async with session.get(
-                    f"{base_url}&title=ilike.*{keyword}*&order=created_at.desc&limit={limit}",
-                    headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        title_matches = await resp.json()
-
-            # Combine and deduplicate results
-            seen_slugs = set()
-            combined = []
-
-            # Add same category first (higher relevance)
-            for post in same_category_posts:
-                if post["slug"] not in seen_slugs:
-                    seen_slugs.add(post["slug"])
-                    combined.append(post)
-
-            # Then title matches
-            for post in title_matches:
-                if post["slug"] not in seen_slugs:
-                    seen_slugs.add(post["slug"])
-                    combined.append(post)
-
-            # Limit results before scoring (to control API costs)
-            combined = combined[:limit]
-
-            # Score candidates for semantic relevance using Haiku
-            # This also generates AI-powered anchor patterns (not just regex extraction)
-            scored_candidates = []
-            if combined:
-                # Prepare candidates for scoring
-                scoring_candidates = [{"title": p["title"], "slug": p["slug"]} for p in combined]
-                scored_candidates = await score_link_relevance(
-                    source_title=topic,
-                    source_excerpt=source_excerpt,
-                    candidates=scoring_candidates
-                )
-
-            # If no relevant suggestions found, provide clear guidance
-            if not scored_candidates:
-                return {
-                    "content": [{
-                        "type": "text",
-                        "text": json.dumps({
-                            "skip_internal_links": True,
-                            "reason": f"No semantically relevant posts found for '{topic}'.",
-                            "total_posts": total_posts,
-                            "suggestions": []
-                        }, separators=(',', ':'))
-                    }]
-                }
+        # If catalog is very small, skip internal linking
+        if total_posts < 3:
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": json.dumps({
+                        "skip_internal_links": True,
+                        "reason": f"Catalog too small ({total_posts} posts). Skip internal linking for now.",
+                        "suggestions": []
+                    }, separators=(',', ':'))
+                }]
+            }
 
-            # Build slug->scored_candidate map for anchor patterns
-            slug_to_scored = {c["slug"]: c for c in scored_candidates}
+        # Build query for published posts with category info
+        select = "slug,title,excerpt,blog_categories(slug)"
+        base_url = f"{SUPABASE_URL}/rest/v1/blog_posts?select={select}&status=eq.published"
 
-            # Log relevance filtering results
-            filtered_count = len(combined) - len(scored_candidates)
-            if filtered_count > 0:
-                print(f"  → Relevance filter: {len(combined)} candidates → {len(scored_candidates)} relevant (filtered {filtered_count} unrelated)")
+        # Exclude current post if specified
+        if exclude_slug:
+            base_url += f"&slug=neq.{exclude_slug}"
 
-            # Format output with pre-built URLs AND AI-generated anchor patterns
-            suggestions = []
-            for post in combined:
-                if post["slug"] not in slug_to_scored:
-                    continue  # Filtered out by relevance scoring
+        # Strategy 1: Same category posts (if category_id provided)
+        same_category_posts = []
+        if category_id:
+            async with session.get(
+                f"{base_url}&category_id=eq.{category_id}&order=created_at.desc&limit={limit}",
+                headers=headers
+            ) as resp:
+                if resp.status == 200:
+                    same_category_posts = await resp.json()
 
-                scored = slug_to_scored[post["slug"]]
-                cat_slug = None
-                if post.get("blog_categories"):
-                    cat_slug = post["blog_categories"].get("slug")
+        # Strategy 2: Search by topic keywords in title
+        # Use ilike for case-insensitive partial match on first keyword
+        keywords = topic.lower().split()[:3]  # First 3 words
+        title_matches = []
 
-                suggestion = {
-                    "url": build_internal_url(post["slug"], cat_slug),
-                    "title": post["title"],
-                    "anchor_patterns": scored.get("anchor_patterns", []),  # AI-generated patterns
-                    "relevance_score": scored.get("relevance_score", 7)
-                }
-                # Include anti-patterns if available (for semantic disambiguation)
-                if scored.get("anti_patterns"):
-                    suggestion["anti_patterns"] = scored["anti_patterns"]
-                if scored.get("semantic_intent"):
-                    suggestion["semantic_intent"] = scored["semantic_intent"]
-                suggestions.append(suggestion)
-
-            # Log suggestions
-            if suggestions:
-                print(f"  → Found {len(suggestions)} relevant link targets:")
-                for s in suggestions[:5]:  # Show first 5
-                    patterns_preview = ", ".join(s["anchor_patterns"][:3]) if s["anchor_patterns"] else "none"
-                    anti_preview = f" | avoid: {', '.join(s.get('anti_patterns', [])[:2])}" if s.get("anti_patterns") else ""
-                    print(f"     • {s['title'][:40]}... (patterns: {patterns_preview}{anti_preview})")
-
-            # Provide context-aware guidance based on catalog size
-            # Must align with get_posts_needing_links caps
-            if total_posts < 5:
-                max_links = 1
-                guidance = f"Very small catalog ({total_posts} posts). Use max 1 internal link."
-            elif total_posts < 15:
-                max_links = 2
-                guidance = f"Small catalog ({total_posts} posts). Use max 2 internal links."
-            elif total_posts < 30:
-                max_links = 3
-                guidance = f"Growing catalog ({total_posts} posts). Use max 3 internal links."
-            elif total_posts < 50:
-                max_links = 4
-                guidance = f"Medium catalog ({total_posts} posts). Use max 4 internal links."
-            else:
-                max_links = None  # Full linking as per normal guidelines
-                guidance = None
-
-            response = {"suggestions": suggestions}
-            if guidance:
-                response["guidance"] = guidance
-            if max_links:
-                response["max_internal_links"] = max_links
+        if keywords:
+            # Search for posts with any keyword in title
+            keyword = keywords[0]  # Primary keyword
+            async with session.get(
+                f"{base_url}&title=ilike.*{keyword}*&order=created_at.desc&limit={limit}",
+                headers=headers
+            ) as resp:
+                if resp.status == 200:
+                    title_matches = await resp.json()
+
+        # Combine and deduplicate results
+        seen_slugs = set()
+        combined = []
+
+        # Add same category first (higher relevance)
+        for post in same_category_posts:
+            if post["slug"] not in seen_slugs:
+                seen_slugs.add(post["slug"])
+                combined.append(post)
+
+        # Then title matches
+        for post in title_matches:
+            if post["slug"] not in seen_slugs:
+                seen_slugs.add(post["slug"])
+                combined.append(post)
+
+        # Limit results before scoring (to control API costs)
+        combined = combined[:limit]
+
+        # Score candidates for semantic relevance using Haiku
+        # This also generates AI-powered anchor patterns (not just regex extraction)
+        scored_candidates = []
+        if combined:
+            # Prepare candidates for scoring
+            scoring_candidates = [{"title": p["title"], "slug": p["slug"]} for p in combined]
+            scored_candidates = await score_link_relevance(
+                source_title=topic,
+                source_excerpt=source_excerpt,
+                candidates=scoring_candidates
+            )
 
+        # If no relevant suggestions found, provide clear guidance
+        if not scored_candidates:
             return {
                 "content": [{
                     "type": "text",
-                    "text": json.dumps(response, separators=(',', ':'))
+                    "text": json.dumps({
+                        "skip_internal_links": True,
+                        "reason": f"No semantically relevant posts found for '{topic}'.",
+                        "total_posts": total_posts,
+                        "suggestions": []
+                    }, separators=(',', ':'))
                 }]
             }
 
+        # Build slug->scored_candidate map for anchor patterns
+        slug_to_scored = {c["slug"]: c for c in scored_candidates}
+
+        # Log relevance filtering results
+        filtered_count = len(combined) - len(scored_candidates)
+        if filtered_count > 0:
+            print(f"  → Relevance filter: {len(combined)} candidates → {len(scored_candidates)} relevant (filtered {filtered_count} unrelated)")
+
+        # Format output with pre-built URLs AND AI-generated anchor patterns
+        suggestions = []
+        for post in combined:
+            if post["slug"] not in slug_to_scored:
+                continue  # Filtered out by relevance scoring
+
+            scored = slug_to_scored[post["slug"]]
+            cat_slug = None
+            if post.get("blog_categories"):
+                cat_slug = post["blog_categories"].get("slug")
+
+            suggestion = {
+                "url": build_internal_url(post["slug"], cat_slug),
+                "title": post["title"],
+                "anchor_patterns": scored.get("anchor_patterns", []),  # AI-generated patterns
+                "relevance_score": scored.get("relevance_score", 7)
+            }
+            # Include anti-patterns if available (for semantic disambiguation)
+            if scored.get("anti_patterns"):
+                suggestion["anti_patterns"] = scored["anti_patterns"]
+            if scored.get("semantic_intent"):
+                suggestion["semantic_intent"] = scored["semantic_intent"]
+            suggestions.append(suggestion)
+
+        # Log suggestions
+        if suggestions:
+            print(f"  → Found {len(suggestions)} relevant link targets:")
+            for s in suggestions[:5]:  # Show first 5
+                patterns_preview = ", ".join(s["anchor_patterns"][:3]) if s["anchor_patterns"] else "none"
+                anti_preview = f" | avoid: {', '.join(s.get('anti_patterns', [])[:2])}" if s.get("anti_patterns") else ""
+                print(f"     • {s['title'][:40]}... (patterns: {patterns_preview}{anti_preview})")
+
+        # Provide context-aware guidance based on catalog size
+        # Must align with get_posts_needing_links caps
+        if total_posts < 5:
+            max_links = 1
+            guidance = f"Very small catalog ({total_posts} posts). Use max 1 internal link."
+        elif total_posts < 15:
+            max_links = 2
+            guidance = f"Small catalog ({total_posts} posts). Use max 2 internal links."
+        elif total_posts < 30:
+            max_links = 3
+            guidance = f"Growing catalog ({total_posts} posts). Use max 3 internal links."
+        elif total_posts < 50:
+            max_links = 4
+            guidance = f"Medium catalog ({total_posts} posts). Use max 4 internal links."
+        else:
+            max_links = None  # Full linking as per normal guidelines
+            guidance = None
+
+        response = {"suggestions": suggestions}
+        if guidance:
+            response["guidance"] = guidance
+        if max_links:
+            response["max_internal_links"] = max_links
+
+        return {
+            "content": [{
+                "type": "text",
+                "text": json.dumps(response, separators=(',', ':'))
+            }]
+        }
+
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
 
@@ -867,12 +868,12 @@ async def validate_urls(args: dict[str, Any]) -> dict[str, Any]:
                 seen.add(url)
                 unique_urls.append(url)
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            # Validate all URLs in parallel
-            tasks = [validate_single_url(url, session, headers) for url in unique_urls]
-            results = await asyncio.gather(*tasks)
+        # Validate all URLs in parallel
+        tasks = [validate_single_url(url, session, headers) for url in unique_urls]
+        results = await asyncio.gather(*tasks)
 
         # Compact output format
         output = []
@@ -1032,26 +1033,26 @@ async def resolve_internal_link_post_ids(links: list[dict]) -> list[dict]:
 
     # Batch query for all slugs
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            # Query posts by slugs
-            slugs = list(slug_to_links.keys())
-            slugs_param = ",".join(slugs)
+        # Query posts by slugs
+        slugs = list(slug_to_links.keys())
+        slugs_param = ",".join(slugs)
 
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?slug=in.({slugs_param})&select=id,slug",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    slug_to_id = {p["slug"]: p["id"] for p in posts}
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?slug=in.({slugs_param})&select=id,slug",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json()
+                slug_to_id = {p["slug"]: p["id"] for p in posts}
 
-                    # Update links with post IDs
-                    for slug, link_list in slug_to_links.items():
-                        post_id = slug_to_id.get(slug)
-                        for link in link_list:
-                            link["linked_post_id"] = post_id
+                # Update links with post IDs
+                for slug, link_list in slug_to_links.items():
+                    post_id = slug_to_id.get(slug)
+                    for link in link_list:
+                        link["linked_post_id"] = post_id
     except Exception:
         pass  # Continue without post IDs if query fails
 
@@ -1072,25 +1073,25 @@ async def save_post_links(post_id: str, content: list) -> int:
     links = await resolve_internal_link_post_ids(links)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
-            # Delete existing links for this post (in case of update)
-            async with session.delete(
-                f"{SUPABASE_URL}/rest/v1/blog_post_links?post_id=eq.{post_id}",
-                headers=headers
-            ) as resp:
-                pass  # Ignore result
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            # Insert new links
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_post_links",
-                headers=headers,
-                json=links
-            ) as resp:
-                if resp.status in [200, 201]:
-                    return len(links)
-                return 0
+        # Delete existing links for this post (in case of update)
+        async with session.delete(
+            f"{SUPABASE_URL}/rest/v1/blog_post_links?post_id=eq.{post_id}",
+            headers=headers
+        ) as resp:
+            pass  # Ignore result
+
+        # Insert new links
+        async with session.post(
+            f"{SUPABASE_URL}/rest/v1/blog_post_links",
+            headers=headers,
+            json=links
+        ) as resp:
+            if resp.status in [200, 201]:
+                return len(links)
+            return 0
 
     except Exception:
         return 0
@@ -1110,108 +1111,108 @@ async def get_posts_needing_links(args: dict[str, Any]) -> dict[str, Any]:
         # Fetch more posts than requested to account for filtering
         fetch_limit = max(limit * 2, 100)
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
-            # First, get total catalog size to determine realistic recommendations
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id&status=eq.published",
-                headers={**headers, "Prefer": "count=exact"}
-            ) as resp:
-                content_range = resp.headers.get("content-range", "")
-                total_posts = 0
-                if "/" in content_range:
-                    try:
-                        total_posts = int(content_range.split("/")[1])
-                    except (ValueError, IndexError):
-                        pass
-
-            # Determine max achievable links based on catalog size
-            # You can't link to more posts than exist (minus the current post)
-            # Also apply practical caps based on catalog maturity
-            if total_posts < 5:
-                max_achievable = 1  # Very small catalog
-                catalog_note = f"Small catalog ({total_posts} posts) - limited linking possible"
-            elif total_posts < 15:
-                max_achievable = 2  # Small catalog
-                catalog_note = f"Growing catalog ({total_posts} posts) - moderate linking"
-            elif total_posts < 30:
-                max_achievable = 3  # Medium catalog
-                catalog_note = f"Medium catalog ({total_posts} posts)"
-            elif total_posts < 50:
-                max_achievable = 4  # Good catalog
-                catalog_note = None
-            else:
-                max_achievable = 6  # Large catalog - full potential
-                catalog_note = None
-
-            # Get published posts with their link counts
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug,title,reading_time,category_id&status=eq.published&order=created_at.asc&limit={fetch_limit}",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return {"content": [{"type": "text", "text": "Error fetching posts"}], "is_error": True}
-                posts = await resp.json()
-
-            if not posts:
-                return {"content": [{"type": "text", "text": json.dumps({"posts": [], "message": "No published posts found"}, separators=(',', ':'))}]}
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            # Get link counts for these posts
-            post_ids = [p["id"] for p in posts]
-            post_ids_param = ",".join(post_ids)
+        # First, get total catalog size to determine realistic recommendations
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id&status=eq.published",
+            headers={**headers, "Prefer": "count=exact"}
+        ) as resp:
+            content_range = resp.headers.get("content-range", "")
+            total_posts = 0
+            if "/" in content_range:
+                try:
+                    total_posts = int(content_range.split("/")[1])
+                except (ValueError, IndexError):
+                    pass
 
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_post_links?select=post_id&post_id=in.({post_ids_param})&link_type=eq.internal",
-                headers=headers
-            ) as resp:
-                links = await resp.json() if resp.status == 200 else []
-
-            # Count links per post
-            link_counts = {}
-            for link in links:
-                pid = link["post_id"]
-                link_counts[pid] = link_counts.get(pid, 0) + 1
-
-            # Find posts needing more links
-            # Formula: ~3 internal links per 1000 words, BUT capped by catalog size
-            posts_needing_links = []
-            for post in posts:
-                reading_time = post.get("reading_time") or 5
-                # Word-based recommendation
-                word_based = max(2, int(reading_time * 200 / 1000 * 3))
-                # Cap by what's actually achievable given catalog size
-                recommended = min(word_based, max_achievable)
-                current = link_counts.get(post["id"], 0)
-                deficit = recommended - current
-
-                if deficit > 0:
-                    posts_needing_links.append({
-                        "id": post["id"],
-                        "slug": post["slug"],
-                        "title": post["title"][:60],  # Truncate for tokens
-                        "current_links": current,
-                        "recommended": recommended,
-                        "deficit": deficit
-                    })
+        # Determine max achievable links based on catalog size
+        # You can't link to more posts than exist (minus the current post)
+        # Also apply practical caps based on catalog maturity
+        if total_posts < 5:
+            max_achievable = 1  # Very small catalog
+            catalog_note = f"Small catalog ({total_posts} posts) - limited linking possible"
+        elif total_posts < 15:
+            max_achievable = 2  # Small catalog
+            catalog_note = f"Growing catalog ({total_posts} posts) - moderate linking"
+        elif total_posts < 30:
+            max_achievable = 3  # Medium catalog
+            catalog_note = f"Medium catalog ({total_posts} posts)"
+        elif total_posts < 50:
+            max_achievable = 4  # Good catalog
+            catalog_note = None
+        else:
+            max_achievable = 6  # Large catalog - full potential
+            catalog_note = None
+
+        # Get published posts with their link counts
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug,title,reading_time,category_id&status=eq.published&order=created_at.asc&limit={fetch_limit}",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return {"content": [{"type": "text", "text": "Error fetching posts"}], "is_error": True}
+            posts = await resp.json()
+
+        if not posts:
+            return {"content": [{"type": "text", "text": json.dumps({"posts": [], "message": "No published posts found"}, separators=(',', ':'))}]}
+
+        # Get link counts for these posts
+        post_ids = [p["id"] for p in posts]
+        post_ids_param = ",".join(post_ids)
+
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_post_links?select=post_id&post_id=in.({post_ids_param})&link_type=eq.internal",
+            headers=headers
+        ) as resp:
+            links = await resp.json() if resp.status == 200 else []
+
+        # Count links per post
+        link_counts = {}
+        for link in links:
+            pid = link["post_id"]
+            link_counts[pid] = link_counts.get(pid, 0) + 1
+
+        # Find posts needing more links
+        # Formula: ~3 internal links per 1000 words, BUT capped by catalog size
+        posts_needing_links = []
+        for post in posts:
+            reading_time = post.get("reading_time") or 5
+            # Word-based recommendation
+            word_based = max(2, int(reading_time * 200 / 1000 * 3))
+            # Cap by what's actually achievable given catalog size
+            recommended = min(word_based, max_achievable)
+            current = link_counts.get(post["id"], 0)
+            deficit = recommended - current
+
+            if deficit > 0:
+                posts_needing_links.append({
+                    "id": post["id"],
+                    "slug": post["slug"],
+                    "title": post["title"][:60],  # Truncate for tokens
+                    "current_links": current,
+                    "recommended": recommended,
+                    "deficit": deficit
+                })
 
-            # Sort by deficit (most in need first) and limit
-            posts_needing_links.sort(key=lambda x: x["deficit"], reverse=True)
-            posts_needing_links = posts_needing_links[:limit]
+        # Sort by deficit (most in need first) and limit
+        posts_needing_links.sort(key=lambda x: x["deficit"], reverse=True)
+        posts_needing_links = posts_needing_links[:limit]
 
-            if not posts_needing_links:
-                return {"content": [{"type": "text", "text": json.dumps({"posts": [], "message": "All posts have adequate internal links for current catalog size"}, separators=(',', ':'))}]}
+        if not posts_needing_links:
+            return {"content": [{"type": "text", "text": json.dumps({"posts": [], "message": "All posts have adequate internal links for current catalog size"}, separators=(',', ':'))}]}
 
-            result = {"posts": posts_needing_links, "catalog_size": total_posts}
-            if catalog_note:
-                result["note"] = catalog_note
+        result = {"posts": posts_needing_links, "catalog_size": total_posts}
+        if catalog_note:
+            result["note"] = catalog_note
 
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps(result, separators=(',', ':'))
-                }]
-            }
+        return {
+            "content": [{
+                "type": "text",
+                "text": json.dumps(result, separators=(',', ':'))
+            }]
+        }
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -1227,35 +1228,35 @@ async def get_post_for_linking(args: dict[str, Any]) -> dict[str, Any]:
         if not post_id:
             return {"content": [{"type": "text", "text": "Error: post_id required"}], "is_error": True}
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug,title,excerpt,content,category_id,reading_time&id=eq.{post_id}",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return {"content": [{"type": "text", "text": "Error fetching post"}], "is_error": True}
-                posts = await resp.json()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug,title,excerpt,content,category_id,reading_time&id=eq.{post_id}",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return {"content": [{"type": "text", "text": "Error fetching post"}], "is_error": True}
+            posts = await resp.json()
 
-            if not posts:
-                return {"content": [{"type": "text", "text": "Post not found"}], "is_error": True}
+        if not posts:
+            return {"content": [{"type": "text", "text": "Post not found"}], "is_error": True}
 
-            post = posts[0]
+        post = posts[0]
 
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps({
-                        "id": post["id"],
-                        "slug": post["slug"],
-                        "title": post["title"],
-                        "excerpt": post["excerpt"],
-                        "category_id": post["category_id"],
-                        "content": post["content"]
-                    }, separators=(',', ':'))
-                }]
-            }
+        return {
+            "content": [{
+                "type": "text",
+                "text": json.dumps({
+                    "id": post["id"],
+                    "slug": post["slug"],
+                    "title": post["title"],
+                    "excerpt": post["excerpt"],
+                    "category_id": post["category_id"],
+                    "content": post["content"]
+                }, separators=(',', ':'))
+            }]
+        }
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -1301,236 +1302,236 @@ async def apply_link_insertions(args: dict[str, Any]) -> dict[str, Any]:
         if not insertions:
             return {"content": [{"type": "text", "text": "Error: insertions array required"}], "is_error": True}
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
-            # Fetch fresh content from database
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=content",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return {"content": [{"type": "text", "text": "Error fetching post"}], "is_error": True}
-                posts = await resp.json()
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            if not posts:
-                return {"content": [{"type": "text", "text": "Post not found"}], "is_error": True}
+        # Fetch fresh content from database
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=content",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return {"content": [{"type": "text", "text": "Error fetching post"}], "is_error": True}
+            posts = await resp.json()
+
+        if not posts:
+            return {"content": [{"type": "text", "text": "Post not found"}], "is_error": True}
+
+        content = posts[0].get("content", [])
+        if not content:
+            return {"content": [{"type": "text", "text": "Post has no content"}], "is_error": True}
+
+        # Anti-pattern pre-filter - fast, deterministic check before API validation
+        # Catches obvious semantic mismatches (e.g., "grip on the club" for a "grip technique" article)
+        anti_pattern_rejected = []
+        filtered_by_anti = []
+        for ins in insertions:
+            anti_patterns = ins.get("anti_patterns", [])
+            if anti_patterns:
+                anchor_lower = ins.get("anchor_text", "").lower()
+                # Check if anchor text matches or is contained in any anti-pattern
+                matched_anti = None
+                for anti in anti_patterns:
+                    anti_lower = anti.lower()
+                    # Match if: anchor contains anti-pattern OR anti-pattern contains anchor
+                    if anti_lower in anchor_lower or anchor_lower in anti_lower:
+                        matched_anti = anti
+                        break
+                if matched_anti:
+                    anti_pattern_rejected.append({
+                        "anchor": ins.get("anchor_text"),
+                        "anti_pattern": matched_anti,
+                        "target": ins.get("target_title", "unknown")
+                    })
+                    continue
+            filtered_by_anti.append(ins)
+
+        if anti_pattern_rejected:
+            print(f"  → Anti-pattern filter rejected {len(anti_pattern_rejected)} link(s):")
+            for rej in anti_pattern_rejected:
+                print(f"     ✗ \"{rej['anchor']}\" matches anti-pattern \"{rej['anti_pattern']}\"")
+
+        insertions = filtered_by_anti
+
+        # Anchor quality filter - reject overly generic anchors
+        quality_rejected = []
+        filtered_by_quality = []
+        for ins in insertions:
+            anchor = ins.get("anchor_text", "")
+            if is_quality_anchor(anchor):
+                filtered_by_quality.append(ins)
+            else:
+                quality_rejected.append({
+                    "anchor": anchor,
+                    "target": ins.get("target_title", "unknown"),
+                    "reason": "too generic or short"
+                })
 
-            content = posts[0].get("content", [])
-            if not content:
-                return {"content": [{"type": "text", "text": "Post has no content"}], "is_error": True}
+        if quality_rejected:
+            print(f"  → Anchor quality filter rejected {len(quality_rejected)} link(s):")
+            for rej in quality_rejected:
+                print(f"     ✗ \"{rej['anchor']}\" - {rej['reason']}")
 
-            # Anti-pattern pre-filter - fast, deterministic check before API validation
-            # Catches obvious semantic mismatches (e.g., "grip on the club" for a "grip technique" article)
-            anti_pattern_rejected = []
-            filtered_by_anti = []
-            for ins in insertions:
-                anti_patterns = ins.get("anti_patterns", [])
-                if anti_patterns:
-                    anchor_lower = ins.get("anchor_text", "").lower()
-                    # Check if anchor text matches or is contained in any anti-pattern
-                    matched_anti = None
-                    for anti in anti_patterns:
-                        anti_lower = anti.lower()
-                        # Match if: anchor contains anti-pattern OR anti-pattern contains anchor
-                        if anti_lower in anchor_lower or anchor_lower in anti_lower:
-                            matched_anti = anti
-                            break
-                    if matched_anti:
-                        anti_pattern_rejected.append({
-                            "anchor": ins.get("anchor_text"),
-                            "anti_pattern": matched_anti,
-                            "target": ins.get("target_title", "unknown")
-                        })
-                        continue
-                filtered_by_anti.append(ins)
+        insertions = filtered_by_quality
 
-            if anti_pattern_rejected:
-                print(f"  → Anti-pattern filter rejected {len(anti_pattern_rejected)} link(s):")
-                for rej in anti_pattern_rejected:
-                    print(f"     ✗ \"{rej['anchor']}\" matches anti-pattern \"{rej['anti_pattern']}\"")
+        if not insertions:
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": "No links applied - all rejected (anti-pattern match or low anchor quality)"
+                }]
+            }
 
-            insertions = filtered_by_anti
+        # Context validation phase - validate anchor text in context before applying
+        # This prevents linking "topping" in "topping the leaderboard" to an article about golf topping
+        insertions_with_titles = [i for i in insertions if i.get("target_title")]
+        if insertions_with_titles:
+            print(f"  → Validating {len(insertions_with_titles)} link context(s)...")
+            validated_insertions = await validate_link_contexts_batch(
+                insertions_with_titles,
+                content
+            )
+            # Build set of validated (anchor_text, url) pairs
+            validated_pairs = {(i["anchor_text"].lower(), i["url"]) for i in validated_insertions}
 
-            # Anchor quality filter - reject overly generic anchors
-            quality_rejected = []
-            filtered_by_quality = []
+            # Filter original insertions to only validated ones
+            context_rejected = []
+            filtered_insertions = []
             for ins in insertions:
-                anchor = ins.get("anchor_text", "")
-                if is_quality_anchor(anchor):
-                    filtered_by_quality.append(ins)
+                if ins.get("target_title"):
+                    # Has title - check if validated
+                    if (ins["anchor_text"].lower(), ins["url"]) in validated_pairs:
+                        filtered_insertions.append(ins)
+                    else:
+                        context_rejected.append(ins)
                 else:
-                    quality_rejected.append({
-                        "anchor": anchor,
-                        "target": ins.get("target_title", "unknown"),
-                        "reason": "too generic or short"
-                    })
-
-            if quality_rejected:
-                print(f"  → Anchor quality filter rejected {len(quality_rejected)} link(s):")
-                for rej in quality_rejected:
-                    print(f"     ✗ \"{rej['anchor']}\" - {rej['reason']}")
-
-            insertions = filtered_by_quality
-
-            if not insertions:
-                return {
-                    "content": [{
-                        "type": "text",
-                        "text": "No links applied - all rejected (anti-pattern match or low anchor quality)"
-                    }]
-                }
+                    # No title - include without validation (backwards compatibility)
+                    filtered_insertions.append(ins)
 
-            # Context validation phase - validate anchor text in context before applying
-            # This prevents linking "topping" in "topping the leaderboard" to an article about golf topping
-            insertions_with_titles = [i for i in insertions if i.get("target_title")]
-            if insertions_with_titles:
-                print(f"  → Validating {len(insertions_with_titles)} link context(s)...")
-                validated_insertions = await validate_link_contexts_batch(
-                    insertions_with_titles,
-                    content
-                )
-                # Build set of validated (anchor_text, url) pairs
-                validated_pairs = {(i["anchor_text"].lower(), i["url"]) for i in validated_insertions}
-
-                # Filter original insertions to only validated ones
-                context_rejected = []
-                filtered_insertions = []
-                for ins in insertions:
-                    if ins.get("target_title"):
-                        # Has title - check if validated
-                        if (ins["anchor_text"].lower(), ins["url"]) in validated_pairs:
-                            filtered_insertions.append(ins)
-                        else:
-                            context_rejected.append(ins)
-                    else:
-                        # No title - include without validation (backwards compatibility)
-                        filtered_insertions.append(ins)
+            if context_rejected:
+                print(f"  → Context filter rejected {len(context_rejected)} link(s):")
+                for rej in context_rejected:
+                    target = rej.get('target_title', 'unknown')[:40]
+                    print(f"     ✗ \"{rej['anchor_text']}\" → \"{target}\" (context/specificity mismatch)")
 
-                if context_rejected:
-                    print(f"  → Context filter rejected {len(context_rejected)} link(s):")
-                    for rej in context_rejected:
-                        target = rej.get('target_title', 'unknown')[:40]
-                        print(f"     ✗ \"{rej['anchor_text']}\" → \"{target}\" (context/specificity mismatch)")
+            insertions = filtered_insertions
 
-                insertions = filtered_insertions
+        if not insertions:
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": "No links applied - all failed context validation (anchor text used in wrong context)"
+                }]
+            }
 
-            if not insertions:
-                return {
-                    "content": [{
-                        "type": "text",
-                        "text": "No links applied - all failed context validation (anchor text used in wrong context)"
-                    }]
-                }
+        # Apply insertions
+        applied = []
+        failed = []
 
-            # Apply insertions
-            applied = []
-            failed = []
+        def find_and_replace_case_insensitive(text: str, search: str, url: str) -> tuple[str, str | None]:
+            """
+            Find search text case-insensitively, replace with link preserving original case.
+            Returns (new_text, matched_text) or (original_text, None) if not found.
+            """
+            search_lower = search.lower()
+            text_lower = text.lower()
 
-            def find_and_replace_case_insensitive(text: str, search: str, url: str) -> tuple[str, str | None]:
-                """
-                Find search text case-insensitively, replace with link preserving original case.
-                Returns (new_text, matched_text) or (original_text, None) if not found.
-                """
-                search_lower = search.lower()
-                text_lower = text.lower()
+            # Check if already linked
+            if f'>{search}</a>'.lower() in text_lower:
+                return text, None
 
-                # Check if already linked
-                if f'>{search}</a>'.lower() in text_lower:
-                    return text, None
+            # Find the position case-insensitively
+            pos = text_lower.find(search_lower)
+            if pos == -1:
+                return text, None
 
-                # Find the position case-insensitively
-                pos = text_lower.find(search_lower)
-                if pos == -1:
-                    return text, None
+            # Extract the original-case version from the text
+            original_match = text[pos:pos + len(search)]
 
-                # Extract the original-case version from the text
-                original_match = text[pos:pos + len(search)]
+            # Build link with original casing
+            link_html = f'<a href="{url}">{original_match}</a>'
 
-                # Build link with original casing
-                link_html = f'<a href="{url}">{original_match}</a>'
+            # Replace first occurrence
+            new_text = text[:pos] + link_html + text[pos + len(search):]
+            return new_text, original_match
 
-                # Replace first occurrence
-                new_text = text[:pos] + link_html + text[pos + len(search):]
-                return new_text, original_match
+        for insertion in insertions:
+            anchor_text = insertion.get("anchor_text", "").strip()
+            url = insertion.get("url", "").strip()
+            block_id = insertion.get("block_id")  # Optional: target specific block
 
-            for insertion in insertions:
-                anchor_text = insertion.get("anchor_text", "").strip()
-                url = insertion.get("url", "").strip()
-                block_id = insertion.get("block_id")  # Optional: target specific block
+            if not anchor_text or not url:
+                failed.append({"anchor_text": anchor_text, "reason": "missing anchor_text or url"})
+                continue
 
-                if not anchor_text or not url:
-                    failed.append({"anchor_text": anchor_text, "reason": "missing anchor_text or url"})
+            # Find and replace the text (first occurrence only, case-insensitive)
+            found = False
+            for block in content:
+                # Skip if block_id specified and doesn't match
+                if block_id and block.get("id") != block_id:
                     continue
 
-                # Find and replace the text (first occurrence only, case-insensitive)
-                found = False
-                for block in content:
-                    # Skip if block_id specified and doesn't match
-                    if block_id and block.get("id") != block_id:
-                        continue
-
-                    block_type = block.get("type", "")
-                    data = block.get("data", {})
-
-                    # Check paragraph text
-                    if block_type == "paragraph":
-                        text = data.get("text", "")
-                        new_text, matched = find_and_replace_case_insensitive(text, anchor_text, url)
-                        if matched:
-                            data["text"] = new_text
-                            applied.append({"anchor_text": matched, "url": url, "block_id": block.get("id")})
-                            found = True
-                            break
+                block_type = block.get("type", "")
+                data = block.get("data", {})
 
-                    # Check list items
-                    elif block_type == "list":
-                        items = data.get("items", [])
-                        for i, item in enumerate(items):
-                            if isinstance(item, str):
-                                new_item, matched = find_and_replace_case_insensitive(item, anchor_text, url)
-                                if matched:
-                                    items[i] = new_item
-                                    applied.append({"anchor_text": matched, "url": url, "block_id": block.get("id")})
-                                    found = True
-                                    break
-                        if found:
-                            break
+                # Check paragraph text
+                if block_type == "paragraph":
+                    text = data.get("text", "")
+                    new_text, matched = find_and_replace_case_insensitive(text, anchor_text, url)
+                    if matched:
+                        data["text"] = new_text
+                        applied.append({"anchor_text": matched, "url": url, "block_id": block.get("id")})
+                        found = True
+                        break
+
+                # Check list items
+                elif block_type == "list":
+                    items = data.get("items", [])
+                    for i, item in enumerate(items):
+                        if isinstance(item, str):
+                            new_item, matched = find_and_replace_case_insensitive(item, anchor_text, url)
+                            if matched:
+                                items[i] = new_item
+                                applied.append({"anchor_text": matched, "url": url, "block_id": block.get("id")})
+                                found = True
+                                break
+                    if found:
+                        break
 
-                    # Check callout text
-                    elif block_type == "callout":
-                        text = data.get("text", "")
-                        new_text, matched = find_and_replace_case_insensitive(text, anchor_text, url)
-                        if matched:
-                            data["text"] = new_text
-                            applied.append({"anchor_text": matched, "url": url, "block_id": block.get("id")})
-                            found = True
-                            break
+                # Check callout text
+                elif block_type == "callout":
+                    text = data.get("text", "")
+                    new_text, matched = find_and_replace_case_insensitive(text, anchor_text, url)
+                    if matched:
+                        data["text"] = new_text
+                        applied.append({"anchor_text": matched, "url": url, "block_id": block.get("id")})
+                        found = True
+                        break
 
-                if not found:
-                    failed.append({"anchor_text": anchor_text, "reason": "text not found or already linked"})
+            if not found:
+                failed.append({"anchor_text": anchor_text, "reason": "text not found or already linked"})
 
-            if not applied:
-                return {
-                    "content": [{
-                        "type": "text",
-                        "text": f"No links applied. Failed: {json.dumps(failed, separators=(',', ':'))}"
-                    }]
-                }
+        if not applied:
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": f"No links applied. Failed: {json.dumps(failed, separators=(',', ':'))}"
+                }]
+            }
 
-            # Save updated content with updated_at to trigger webhooks
-            from datetime import datetime, timezone
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json={
-                    "content": content,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-            ) as resp:
-                if resp.status not in [200, 204]:
-                    error = await resp.text()
-                    return {"content": [{"type": "text", "text": f"Error saving: {error}"}], "is_error": True}
+        # Save updated content with updated_at to trigger webhooks
+        from datetime import datetime, timezone
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json={
+                "content": content,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
+        ) as resp:
+            if resp.status not in [200, 204]:
+                error = await resp.text()
+                return {"content": [{"type": "text", "text": f"Error saving: {error}"}], "is_error": True}
 
         # Re-extract and save links to tracking table
         links_saved = await save_post_links(post_id, content)
@@ -1571,95 +1572,95 @@ async def remove_internal_links_from_post(post_id: str) -> dict[str, Any]:
     Returns count of links removed.
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
-            # Fetch post content
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=id,slug,content",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return {"success": False, "error": "Failed to fetch post"}
-                posts = await resp.json()
-
-            if not posts:
-                return {"success": False, "error": "Post not found"}
-
-            post = posts[0]
-            content = post.get("content", [])
-            if not content:
-                return {"success": True, "removed": 0, "message": "No content"}
-
-            # Regex to match internal links: <a href="/...">text</a>
-            # Captures the inner text to preserve it
-            internal_link_pattern = re.compile(r'<a\s+href="(/[^"]*)"[^>]*>([^<]*)</a>', re.IGNORECASE)
-
-            removed_count = 0
-
-            def strip_internal_links(text: str) -> tuple[str, int]:
-                """Remove internal links, return cleaned text and count."""
-                count = len(internal_link_pattern.findall(text))
-                # Replace link with just the anchor text
-                cleaned = internal_link_pattern.sub(r'\2', text)
-                return cleaned, count
-
-            # Process each block
-            for block in content:
-                block_type = block.get("type", "")
-                data = block.get("data", {})
-
-                if block_type == "paragraph":
-                    text = data.get("text", "")
-                    cleaned, count = strip_internal_links(text)
-                    if count > 0:
-                        data["text"] = cleaned
-                        removed_count += count
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-                elif block_type == "list":
-                    items = data.get("items", [])
-                    for i, item in enumerate(items):
-                        if isinstance(item, str):
-                            cleaned, count = strip_internal_links(item)
-                            if count > 0:
-                                items[i] = cleaned
-                                removed_count += count
+        # Fetch post content
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=id,slug,content",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return {"success": False, "error": "Failed to fetch post"}
+            posts = await resp.json()
+
+        if not posts:
+            return {"success": False, "error": "Post not found"}
+
+        post = posts[0]
+        content = post.get("content", [])
+        if not content:
+            return {"success": True, "removed": 0, "message": "No content"}
+
+        # Regex to match internal links: <a href="/...">text</a>
+        # Captures the inner text to preserve it
+        internal_link_pattern = re.compile(r'<a\s+href="(/[^"]*)"[^>]*>([^<]*)</a>', re.IGNORECASE)
+
+        removed_count = 0
+
+        def strip_internal_links(text: str) -> tuple[str, int]:
+            """Remove internal links, return cleaned text and count."""
+            count = len(internal_link_pattern.findall(text))
+            # Replace link with just the anchor text
+            cleaned = internal_link_pattern.sub(r'\2', text)
+            return cleaned, count
+
+        # Process each block
+        for block in content:
+            block_type = block.get("type", "")
+            data = block.get("data", {})
 
-                elif block_type == "callout":
-                    text = data.get("text", "")
-                    cleaned, count = strip_internal_links(text)
-                    if count > 0:
-                        data["text"] = cleaned
-                        removed_count += count
+            if block_type == "paragraph":
+                text = data.get("text", "")
+                cleaned, count = strip_internal_links(text)
+                if count > 0:
+                    data["text"] = cleaned
+                    removed_count += count
 
-            if removed_count == 0:
-                return {"success": True, "removed": 0, "message": "No internal links found"}
+            elif block_type == "list":
+                items = data.get("items", [])
+                for i, item in enumerate(items):
+                    if isinstance(item, str):
+                        cleaned, count = strip_internal_links(item)
+                        if count > 0:
+                            items[i] = cleaned
+                            removed_count += count
 
-            # Save cleaned content with updated_at to trigger webhooks
-            from datetime import datetime, timezone
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json={
-                    "content": content,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-            ) as resp:
-                if resp.status not in [200, 204]:
-                    return {"success": False, "error": "Failed to save cleaned content"}
+            elif block_type == "callout":
+                text = data.get("text", "")
+                cleaned, count = strip_internal_links(text)
+                if count > 0:
+                    data["text"] = cleaned
+                    removed_count += count
+
+        if removed_count == 0:
+            return {"success": True, "removed": 0, "message": "No internal links found"}
+
+        # Save cleaned content with updated_at to trigger webhooks
+        from datetime import datetime, timezone
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json={
+                "content": content,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
+        ) as resp:
+            if resp.status not in [200, 204]:
+                return {"success": False, "error": "Failed to save cleaned content"}
 
-            # Delete internal link records from tracking table
-            async with session.delete(
-                f"{SUPABASE_URL}/rest/v1/blog_post_links?post_id=eq.{post_id}&link_type=eq.internal",
-                headers=headers
-            ) as resp:
-                pass  # Best effort - table might not exist
+        # Delete internal link records from tracking table
+        async with session.delete(
+            f"{SUPABASE_URL}/rest/v1/blog_post_links?post_id=eq.{post_id}&link_type=eq.internal",
+            headers=headers
+        ) as resp:
+            pass  # Best effort - table might not exist
 
-            return {
-                "success": True,
-                "removed": removed_count,
-                "post_slug": post["slug"]
-            }
+        return {
+            "success": True,
+            "removed": removed_count,
+            "post_slug": post["slug"]
+        }
 
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1681,141 +1682,141 @@ async def remove_single_link_by_id(link_id: str) -> dict[str, Any]:
         Dict with success status and details
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
-            # Fetch the link record
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_post_links?id=eq.{link_id}&select=id,post_id,url,anchor_text,link_type",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return {"success": False, "error": "Failed to fetch link record"}
-                links = await resp.json()
-
-            if not links:
-                return {"success": False, "error": f"Link with ID '{link_id}' not found"}
-
-            link_record = links[0]
-            post_id = link_record["post_id"]
-            url = link_record["url"]
-            anchor_text = link_record.get("anchor_text", "")
-            link_type = link_record.get("link_type", "unknown")
+        session = await get_http_session()
+        headers = get_supabase_headers()
 
-            # Fetch the post content
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=id,slug,content",
+        # Fetch the link record
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_post_links?id=eq.{link_id}&select=id,post_id,url,anchor_text,link_type",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return {"success": False, "error": "Failed to fetch link record"}
+            links = await resp.json()
+
+        if not links:
+            return {"success": False, "error": f"Link with ID '{link_id}' not found"}
+
+        link_record = links[0]
+        post_id = link_record["post_id"]
+        url = link_record["url"]
+        anchor_text = link_record.get("anchor_text", "")
+        link_type = link_record.get("link_type", "unknown")
+
+        # Fetch the post content
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=id,slug,content",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return {"success": False, "error": "Failed to fetch post"}
+            posts = await resp.json()
+
+        if not posts:
+            return {"success": False, "error": "Post not found"}
+
+        post = posts[0]
+        content = post.get("content", [])
+
+        if not content:
+            # No content, just delete the link record
+            async with session.delete(
+                f"{SUPABASE_URL}/rest/v1/blog_post_links?id=eq.{link_id}",
                 headers=headers
             ) as resp:
-                if resp.status != 200:
-                    return {"success": False, "error": "Failed to fetch post"}
-                posts = await resp.json()
-
-            if not posts:
-                return {"success": False, "error": "Post not found"}
-
-            post = posts[0]
-            content = post.get("content", [])
-
-            if not content:
-                # No content, just delete the link record
-                async with session.delete(
-                    f"{SUPABASE_URL}/rest/v1/blog_post_links?id=eq.{link_id}",
-                    headers=headers
-                ) as resp:
-                    pass
-                return {"success": True, "removed": True, "post_slug": post["slug"], "message": "Link record deleted (post has no content)"}
-
-            # Build regex to match this specific link
-            # Escape special regex characters in URL
-            escaped_url = re.escape(url)
-            # Match <a> tag with this exact href
-            link_pattern = re.compile(
-                rf'<a\s+[^>]*href=["\']({escaped_url})["\'][^>]*>([^<]*)</a>',
-                re.IGNORECASE
-            )
-
-            removed = False
-
-            def strip_specific_link(text: str) -> tuple[str, bool]:
-                """Remove the specific link, return cleaned text and whether it was found."""
-                match = link_pattern.search(text)
-                if match:
-                    # Replace link with just the anchor text
-                    cleaned = link_pattern.sub(r'\2', text, count=1)
-                    return cleaned, True
-                return text, False
-
-            # Process each block
-            for block in content:
-                if removed:
-                    break
-
-                block_type = block.get("type", "")
-                data = block.get("data", {})
+                pass
+            return {"success": True, "removed": True, "post_slug": post["slug"], "message": "Link record deleted (post has no content)"}
+
+        # Build regex to match this specific link
+        # Escape special regex characters in URL
+        escaped_url = re.escape(url)
+        # Match <a> tag with this exact href
+        link_pattern = re.compile(
+            rf'<a\s+[^>]*href=["\']({escaped_url})["\'][^>]*>([^<]*)</a>',
+            re.IGNORECASE
+        )
+
+        removed = False
+
+        def strip_specific_link(text: str) -> tuple[str, bool]:
+            """Remove the specific link, return cleaned text and whether it was found."""
+            match = link_pattern.search(text)
+            if match:
+                # Replace link with just the anchor text
+                cleaned = link_pattern.sub(r'\2', text, count=1)
+                return cleaned, True
+            return text, False
 
-                if block_type == "paragraph":
-                    text = data.get("text", "")
-                    cleaned, found = strip_specific_link(text)
-                    if found:
-                        data["text"] = cleaned
-                        removed = True
+        # Process each block
+        for block in content:
+            if removed:
+                break
 
-                elif block_type == "list":
-                    items = data.get("items", [])
-                    for i, item in enumerate(items):
-                        if isinstance(item, str):
-                            cleaned, found = strip_specific_link(item)
-                            if found:
-                                items[i] = cleaned
-                                removed = True
-                                break
+            block_type = block.get("type", "")
+            data = block.get("data", {})
 
-                elif block_type == "callout":
-                    text = data.get("text", "")
-                    cleaned, found = strip_specific_link(text)
-                    if found:
-                        data["text"] = cleaned
-                        removed = True
+            if block_type == "paragraph":
+                text = data.get("text", "")
+                cleaned, found = strip_specific_link(text)
+                if found:
+                    data["text"] = cleaned
+                    removed = True
 
-                elif block_type == "accordion":
-                    for item in data.get("items", []):
-                        answer = item.get("answer", "")
-                        cleaned, found = strip_specific_link(answer)
+            elif block_type == "list":
+                items = data.get("items", [])
+                for i, item in enumerate(items):
+                    if isinstance(item, str):
+                        cleaned, found = strip_specific_link(item)
                         if found:
-                            item["answer"] = cleaned
+                            items[i] = cleaned
                             removed = True
                             break
 
-            # Save updated content if we removed the link
-            if removed:
-                async with session.patch(
-                    f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                    headers=headers,
-                    json={
-                        "content": content,
-                        "updated_at": datetime.now(timezone.utc).isoformat()
-                    }
-                ) as resp:
-                    if resp.status not in [200, 204]:
-                        return {"success": False, "error": "Failed to save updated content"}
+            elif block_type == "callout":
+                text = data.get("text", "")
+                cleaned, found = strip_specific_link(text)
+                if found:
+                    data["text"] = cleaned
+                    removed = True
+
+            elif block_type == "accordion":
+                for item in data.get("items", []):
+                    answer = item.get("answer", "")
+                    cleaned, found = strip_specific_link(answer)
+                    if found:
+                        item["answer"] = cleaned
+                        removed = True
+                        break
 
-            # Delete the link record from tracking table
-            async with session.delete(
-                f"{SUPABASE_URL}/rest/v1/blog_post_links?id=eq.{link_id}",
-                headers=headers
+        # Save updated content if we removed the link
+        if removed:
+            async with session.patch(
+                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+                headers=headers,
+                json={
+                    "content": content,
+                    "updated_at": datetime.now(timezone.utc).isoformat()
+                }
             ) as resp:
                 if resp.status not in [200, 204]:
-                    return {"success": False, "error": "Failed to delete link record"}
+                    return {"success": False, "error": "Failed to save updated content"}
 
-            return {
-                "success": True,
-                "removed_from_content": removed,
-                "post_slug": post["slug"],
-                "url": url,
-                "anchor_text": anchor_text,
-                "link_type": link_type
-            }
+        # Delete the link record from tracking table
+        async with session.delete(
+            f"{SUPABASE_URL}/rest/v1/blog_post_links?id=eq.{link_id}",
+            headers=headers
+        ) as resp:
+            if resp.status not in [200, 204]:
+                return {"success": False, "error": "Failed to delete link record"}
+
+        return {
+            "success": True,
+            "removed_from_content": removed,
+            "post_slug": post["slug"],
+            "url": url,
+            "anchor_text": anchor_text,
+            "link_type": link_type
+        }
 
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -1834,35 +1835,35 @@ async def cleanup_internal_links(post_slugs: list[str] = None, all_posts: bool =
     """
     results = []
 
-    async with aiohttp.ClientSession() as session:
-        headers = get_supabase_headers()
-
-        if all_posts:
-            # Get all published posts
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug&status=eq.published",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return [{"error": "Failed to fetch posts"}]
-                posts = await resp.json()
-        elif post_slugs:
-            # Get specific posts
-            slugs_param = ",".join(f'"{s}"' for s in post_slugs)
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug&slug=in.({slugs_param})",
-                headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    return [{"error": "Failed to fetch posts"}]
-                posts = await resp.json()
-        else:
-            return [{"error": "Specify post_slugs or all_posts=True"}]
+    session = await get_http_session()
+    headers = get_supabase_headers()
+
+    if all_posts:
+        # Get all published posts
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug&status=eq.published",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return [{"error": "Failed to fetch posts"}]
+            posts = await resp.json()
+    elif post_slugs:
+        # Get specific posts
+        slugs_param = ",".join(f'"{s}"' for s in post_slugs)
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug&slug=in.({slugs_param})",
+            headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return [{"error": "Failed to fetch posts"}]
+            posts = await resp.json()
+    else:
+        return [{"error": "Specify post_slugs or all_posts=True"}]
 
-        for post in posts:
-            result = await remove_internal_links_from_post(post["id"])
-            result["slug"] = post["slug"]
-            results.append(result)
+    for post in posts:
+        result = await remove_internal_links_from_post(post["id"])
+        result["slug"] = post["slug"]
+        results.append(result)
 
     return results
 
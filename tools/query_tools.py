@@ -7,61 +7,61 @@ before generating new content.
 
 import json
 from typing import Any
-import aiohttp
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import SUPABASE_URL, get_supabase_headers
+from tools.http_session import get_http_session
 
 
 async def get_blog_context(args: dict[str, Any]) -> dict[str, Any]:
     """Get categories, tags, authors, and recent post slugs. Call first before creating content."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
-            # Fetch categories (id, slug, name only - skip description to save tokens)
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?select=id,slug,name&order=sort_order",
-                headers=headers
-            ) as resp:
-                categories = await resp.json() if resp.status == 200 else []
-
-            # Fetch tags (id, slug, name)
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_tags?select=id,slug,name&order=name",
-                headers=headers
-            ) as resp:
-                tags = await resp.json() if resp.status == 200 else []
-
-            # Fetch authors (id, slug, name only - skip bio to save tokens)
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_authors?select=id,slug,name",
-                headers=headers
-            ) as resp:
-                authors = await resp.json() if resp.status == 200 else []
-
-            # Fetch recent post slugs only (reduced from 50 to 20, skip titles)
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=slug&order=created_at.desc&limit=20",
-                headers=headers
-            ) as resp:
-                recent = await resp.json() if resp.status == 200 else []
-
-            # Compact format to save tokens
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps({
-                        "categories": categories,
-                        "tags": tags,
-                        "authors": authors,
-                        "recent_slugs": [p["slug"] for p in recent]
-                    }, separators=(',', ':'))
-                }]
-            }
+        session = await get_http_session()
+        headers = get_supabase_headers()
+
+        # Fetch categories (id, slug, name only - skip description to save tokens)
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?select=id,slug,name&order=sort_order",
+            headers=headers
+        ) as resp:
+            categories = await resp.json() if resp.status == 200 else []
+
+        # Fetch tags (id, slug, name)
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_tags?select=id,slug,name&order=name",
+            headers=headers
+        ) as resp:
+            tags = await resp.json() if resp.status == 200 else []
+
+        # Fetch authors (id, slug, name only - skip bio to save tokens)
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_authors?select=id,slug,name",
+            headers=headers
+        ) as resp:
+            authors = await resp.json() if resp.status == 200 else []
+
+        # Fetch recent post slugs only (reduced from 50 to 20, skip titles)
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=slug&order=created_at.desc&limit=20",
+            headers=headers
+        ) as resp:
+            recent = await resp.json() if resp.status == 200 else []
+
+        # Compact format to save tokens
+        return {
+            "content": [{
+                "type": "text",
+                "text": json.dumps({
+                    "categories": categories,
+                    "tags": tags,
+                    "authors": authors,
+                    "recent_slugs": [p["slug"] for p in recent]
+                }, separators=(',', ':'))
+            }]
+        }
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -70,27 +70,27 @@ async def get_blog_context(args: dict[str, Any]) -> dict[str, Any]:
 async def get_sample_post(args: dict[str, Any]) -> dict[str, Any]:
     """Get a sample published post to see content block structure."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            query = f"{SUPABASE_URL}/rest/v1/blog_posts?select=content&status=eq.published&limit=1"
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        query = f"{SUPABASE_URL}/rest/v1/blog_posts?select=content&status=eq.published&limit=1"
 
-            if args.get("category_slug"):
-                async with session.get(
-                    f"{SUPABASE_URL}/rest/v1/blog_categories?select=id&slug=eq.{args['category_slug']}&limit=1",
-                    headers=headers
-                ) as resp:
-                    cats = await resp.json() if resp.status == 200 else []
-                    if cats:
-                        query += f"&category_id=eq.{cats[0]['id']}"
+        if args.get("category_slug"):
+            async with session.get(
+                f"{SUPABASE_URL}/rest/v1/blog_categories?select=id&slug=eq.{args['category_slug']}&limit=1",
+                headers=headers
+            ) as resp:
+                cats = await resp.json() if resp.status == 200 else []
+                if cats:
+                    query += f"&category_id=eq.{cats[0]['id']}"
 
-            async with session.get(query, headers=headers) as resp:
-                posts = await resp.json() if resp.status == 200 else []
+        async with session.get(query, headers=headers) as resp:
+            posts = await resp.json() if resp.status == 200 else []
 
-            if not posts:
-                return {"content": [{"type": "text", "text": "No published posts found"}]}
+        if not posts:
+            return {"content": [{"type": "text", "text": "No published posts found"}]}
 
-            # Return just the content blocks (most useful part)
-            return {"content": [{"type": "text", "text": json.dumps(posts[0].get("content", []), separators=(',', ':'))}]}
+        # Return just the content blocks (most useful part)
+        return {"content": [{"type": "text", "text": json.dumps(posts[0].get("content", []), separators=(',', ':'))}]}
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -104,16 +104,16 @@ async def check_slug_exists(args: dict[str, Any]) -> dict[str, Any]:
         table_map = {"posts": "blog_posts", "categories": "blog_categories", "tags": "blog_tags"}
         db_table = table_map.get(table, "blog_posts")
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/{db_table}?select=slug&slug=eq.{slug}",
-                headers=headers
-            ) as resp:
-                results = await resp.json() if resp.status == 200 else []
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/{db_table}?select=slug&slug=eq.{slug}",
+            headers=headers
+        ) as resp:
+            results = await resp.json() if resp.status == 200 else []
 
-            exists = len(results) > 0
-            return {"content": [{"type": "text", "text": f"{slug}: {'EXISTS' if exists else 'available'}"}]}
+        exists = len(results) > 0
+        return {"content": [{"type": "text", "text": f"{slug}: {'EXISTS' if exists else 'available'}"}]}
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -122,16 +122,16 @@ async def check_slug_exists(args: dict[str, Any]) -> dict[str, Any]:
 async def get_posts_without_images(limit: int = 10) -> list:
     """Get posts that don't have featured images (for backfill)."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            # Get posts where featured_image is null OR empty string, include category for prompt context
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug,title,excerpt,category_id,blog_categories(slug)&or=(featured_image.is.null,featured_image.eq.)&order=created_at.desc&limit={limit}",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        # Get posts where featured_image is null OR empty string, include category for prompt context
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=id,slug,title,excerpt,category_id,blog_categories(slug)&or=(featured_image.is.null,featured_image.eq.)&order=created_at.desc&limit={limit}",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                return await resp.json()
+            return []
     except Exception:
         return []
 
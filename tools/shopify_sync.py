@@ -9,23 +9,45 @@ This module provides functions for:
 """
 
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import AsyncIterator, Optional
 import aiohttp
+import asyncio
+import random
+import re
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import SUPABASE_URL, get_supabase_headers, SHOPIFY_DEFAULT_AUTHOR
+from config import (
+    SUPABASE_URL,
+    SHOPIFY_DEFAULT_AUTHOR,
+    SHOPIFY_IMPORT_CONCURRENCY,
+)
+from tools.http_session import get_http_session, json_loads, request_with_retry
+from tools.supabase_bulk import fetch_rows_by_values, get_rows_by_values, supabase_headers, upsert_rows
 from tools.shopify_tools import (
     sync_category_to_shopify,
     sync_post_to_shopify,
     get_shopify_visibility_label,
     clear_sync_cache,
+    prewarm_blog_cache,
+    prewarm_article_cache,
+    prewarm_article_content_lengths,
     fetch_all_shopify_blogs,
     fetch_all_shopify_articles,
+    fetch_shopify_article_by_handle,
+    iter_shopify_article_pages,
+    iter_shopify_article_tags,
 )
 
+# Accepted HTTP statuses for Supabase writes (tuples, not per-call lists)
+_OK_READ = (200,)
+_OK_PATCH = (200, 204)
+_OK_WRITE = (200, 201)
+_OK_DELETE = (200, 204)
+
 
 # =============================================================================
 # SUPABASE HELPERS
@@ -34,102 +56,198 @@ from tools.shopify_tools import (
 async def get_all_categories() -> list:
     """Fetch all categories from Supabase."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?select=*&order=sort_order,name",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?select=*&order=sort_order,name",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                return await resp.json(loads=json_loads)
+            return []
     except Exception as e:
         print(f"Error fetching categories: {e}")
         return []
 
 
+# Category rows by ID (plus slug -> ID), loaded with one get_all_categories()
+# call the first time a single category is looked up, instead of one request
+# per category. invalidate_category() drops a row once its sync fields change.
+_category_index: dict[str, dict] = {}
+_category_slug_to_id: dict[str, str] = {}
+_category_index_loaded = False
+
+
+async def _ensure_category_index() -> None:
+    """Load every category into _category_index, once per run."""
+    global _category_index_loaded
+
+    if _category_index_loaded:
+        return
+
+    for category in await get_all_categories():
+        _category_index[category['id']] = category
+        _category_slug_to_id[category['slug']] = category['id']
+    _category_index_loaded = True
+
+
+def invalidate_category(category_id: str) -> None:
+    """Drop a category row from the index so the next lookup re-reads it."""
+    category = _category_index.pop(category_id, None)
+    if category:
+        _category_slug_to_id.pop(category['slug'], None)
+
+
 async def get_category_by_slug(slug: str) -> Optional[dict]:
     """Fetch a single category by slug."""
+    await _ensure_category_index()
+    category_id = _category_slug_to_id.get(slug)
+    if category_id:
+        return _category_index[category_id]
+
+    # Not indexed (e.g. inserted after the index was loaded) - ask Supabase
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?slug=eq.{slug}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                categories = await resp.json(loads=json_loads)
+                return categories[0] if categories else None
+            return None
     except Exception:
         return None
 
 
 async def get_category_by_id(category_id: str) -> Optional[dict]:
     """Fetch a single category by ID."""
+    await _ensure_category_index()
+    if category_id in _category_index:
+        return _category_index[category_id]
+
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                categories = await resp.json(loads=json_loads)
+                return categories[0] if categories else None
+            return None
     except Exception:
         return None
 
 
+# Supabase category ID -> Shopify blog GID, recorded when ensure_category_synced
+# reads it or update_category_shopify_fields writes it. The category row is the
+# persistent record; this only saves re-reading that row for every post
+# of the category in one run.
+_category_blog_gids: dict[str, str] = {}
+
+
 async def update_category_shopify_fields(category_id: str, shopify_blog_gid: str) -> bool:
     """Update category with Shopify sync info."""
+    _category_blog_gids[category_id] = shopify_blog_gid
+    invalidate_category(category_id)
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}",
-                headers=headers,
-                json={
-                    "shopify_blog_gid": shopify_blog_gid,
-                    "shopify_synced_at": datetime.utcnow().isoformat(),
-                }
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}",
+            headers=headers,
+            json={
+                "shopify_blog_gid": shopify_blog_gid,
+                "shopify_synced_at": datetime.utcnow().isoformat(),
+            }
+        ) as resp:
+            return resp.status in _OK_PATCH
     except Exception:
         return False
 
 
-async def get_all_posts() -> list:
-    """Fetch all posts from Supabase with related data."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=*,blog_categories(id,slug,name,shopify_blog_gid),blog_authors(id,slug,name)&order=updated_at.desc",
+# Posts per page when paging blog_posts (Supabase caps unpaged responses at max_rows)
+POSTS_PAGE_SIZE = 200
+
+_POST_SELECT = "*,blog_categories(id,slug,name,shopify_blog_gid),blog_authors(id,slug,name)"
+
+
+async def iter_post_pages(
+    order: str = "updated_at.desc,id",
+    page_size: int = POSTS_PAGE_SIZE,
+) -> AsyncIterator[tuple[list, Optional[int]]]:
+    """
+    Yield all posts with related data, one page at a time.
+
+    The first request asks for an exact count, so callers can report the
+    total before the remaining pages are fetched.
+
+    Args:
+        order: PostgREST order clause. Use a column syncing doesn't touch
+            (e.g. "id") when posts are modified while paging.
+        page_size: Rows per request
+
+    Yields:
+        (posts on this page, total post count or None if unknown)
+    """
+    total = None
+    offset = 0
+
+    while True:
+        headers = supabase_headers()
+        if offset == 0:
+            headers = {**headers, "Prefer": "count=exact"}
+        try:
+            session = await get_http_session()
+            async with await request_with_retry(
+                session, "GET",
+                f"{SUPABASE_URL}/rest/v1/blog_posts",
+                params={"select": _POST_SELECT, "order": order, "limit": str(page_size), "offset": str(offset)},
                 headers=headers
             ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
-    except Exception as e:
-        print(f"Error fetching posts: {e}")
-        return []
+                if resp.status not in (200, 206):
+                    print(f"Error fetching posts: HTTP {resp.status}")
+                    return
+                # Content-Range: "0-199/1234" (or "*/0" when empty)
+                if offset == 0:
+                    count = resp.headers.get("Content-Range", "").rpartition("/")[2]
+                    total = int(count) if count.isdigit() else None
+                page = json_loads(await resp.read())
+        except Exception as e:
+            print(f"Error fetching posts: {e}")
+            return
+
+        if page:
+            yield page, total
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+async def get_all_posts() -> list:
+    """Fetch all posts from Supabase with related data, newest update first."""
+    posts = []
+    async for page, _ in iter_post_pages():
+        posts.extend(page)
+    return posts
 
 
 async def get_post_by_slug(slug: str) -> Optional[dict]:
     """Fetch a single post by slug with related data."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&select=*,blog_categories(id,slug,name,shopify_blog_gid),blog_authors(id,slug,name)&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&select=*,blog_categories(id,slug,name,shopify_blog_gid),blog_authors(id,slug,name)&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json(loads=json_loads)
+                return posts[0] if posts else None
+            return None
     except Exception:
         return None
 
@@ -137,37 +255,71 @@ async def get_post_by_slug(slug: str) -> Optional[dict]:
 async def get_post_by_id(post_id: str) -> Optional[dict]:
     """Fetch a single post by ID with related data."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=*,blog_categories(id,slug,name,shopify_blog_gid),blog_authors(id,slug,name)&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=*,blog_categories(id,slug,name,shopify_blog_gid),blog_authors(id,slug,name)&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json(loads=json_loads)
+                return posts[0] if posts else None
+            return None
     except Exception:
         return None
 
 
+# Post ID -> tag names, filled by prewarm_post_tags ahead of bulk syncs.
+# Entries are consumed on first read so later edits are never served stale.
+_post_tags_cache: dict[str, list] = {}
+
+
 async def get_post_tags(post_id: str) -> list:
-    """Fetch tags for a post."""
+    """Fetch tags for a post (from the prewarmed batch when available)."""
+    if post_id in _post_tags_cache:
+        return _post_tags_cache.pop(post_id)
+
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}&select=blog_tags(name)",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    results = await resp.json()
-                    return [r['blog_tags']['name'] for r in results if r.get('blog_tags')]
-                return []
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}&select=blog_tags(name)",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                results = await resp.json(loads=json_loads)
+                return [r['blog_tags']['name'] for r in results if r.get('blog_tags')]
+            return []
     except Exception:
         return []
 
 
+async def prewarm_post_tags(post_ids: list[str]) -> None:
+    """
+    Load the tags of many posts with one paged `in.()` query per chunk.
+
+    Fills _post_tags_cache so the per-post get_post_tags calls of a bulk
+    sync don't each cost a request. Pages are read until every relation
+    is in, so a post is never cached with a tag list cut short by
+    Supabase's max_rows cap. If any chunk fails to load, nothing is
+    cached and each post falls back to its own request.
+    """
+    try:
+        rows = await fetch_rows_by_values(
+            "blog_post_tags", "post_id", post_ids,
+            select="post_id,blog_tags(name)", order="post_id,tag_id",
+        )
+    except RuntimeError as e:
+        print(f"Error prewarming post tags: {e}")
+        return
+
+    tags_by_post = {pid: [] for pid in post_ids if pid}
+    for row in rows:
+        if row.get('blog_tags'):
+            tags_by_post[row['post_id']].append(row['blog_tags']['name'])
+    _post_tags_cache.update(tags_by_post)
+
+
 async def update_post_shopify_fields(
     post_id: str,
     shopify_article_id: Optional[str] = None,
@@ -184,14 +336,14 @@ async def update_post_shopify_fields(
         if error:
             update_data["shopify_sync_error"] = error
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json=update_data
+        ) as resp:
+            return resp.status in _OK_PATCH
     except Exception:
         return False
 
@@ -223,6 +375,9 @@ async def sync_all_categories(force: bool = False) -> dict:
     else:
         print()
 
+    # Resolve unsynced categories' blog handles in one batched lookup
+    await prewarm_blog_cache([cat['slug'] for cat in categories if not cat.get('shopify_blog_gid')])
+
     synced = 0
     failed = 0
     skipped = 0
@@ -324,6 +479,9 @@ async def ensure_category_synced(category_id: str) -> Optional[str]:
     Returns:
         Shopify blog GID if successful, None otherwise
     """
+    if category_id in _category_blog_gids:
+        return _category_blog_gids[category_id]
+
     category = await get_category_by_id(category_id)
 
     if not category:
@@ -332,6 +490,7 @@ async def ensure_category_synced(category_id: str) -> Optional[str]:
     existing_gid = category.get('shopify_blog_gid')
 
     if existing_gid:
+        _category_blog_gids[category_id] = existing_gid
         return existing_gid
 
     # Sync the category
@@ -395,6 +554,38 @@ async def sync_post_by_id(post_id: str, force: bool = False) -> bool:
     return result in ("synced", "skipped")
 
 
+async def _prewarm_post_lookups(posts: list, force: bool = False) -> None:
+    """
+    Batch the lookups a post sync would otherwise make one by one.
+
+    Covers the Supabase tags of every post that will sync, the current
+    Shopify body length of posts that will be updated (overwrite safety
+    check), posts never synced to Shopify (article looked up by handle)
+    and categories never synced (blog looked up by handle).
+    """
+    to_sync = [post for post in posts if force or _needs_sync(post)]
+
+    blog_handles = []
+    article_handles_by_blog = {}
+    for post in posts:
+        category = post.get('blog_categories') or {}
+        blog_gid = category.get('shopify_blog_gid')
+        if not blog_gid:
+            blog_handles.append(category.get('slug'))
+        elif not post.get('shopify_article_id'):
+            article_handles_by_blog.setdefault(blog_gid, []).append(post['slug'])
+
+    await asyncio.gather(
+        prewarm_post_tags([post['id'] for post in to_sync]),
+        prewarm_article_content_lengths([post.get('shopify_article_id') for post in to_sync]),
+        prewarm_blog_cache(blog_handles),
+        *[
+            prewarm_article_cache(blog_gid, handles)
+            for blog_gid, handles in article_handles_by_blog.items()
+        ],
+    )
+
+
 async def _sync_single_post(post: dict, force: bool = False) -> str:
     """
     Internal function to sync a single post.
@@ -409,17 +600,10 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
     slug = post['slug']
     status = post.get('status', 'draft')
     existing_article_id = post.get('shopify_article_id')
-    updated_at = post.get('updated_at', '')
-    synced_at = post.get('shopify_synced_at', '')
-
-    # Check if sync is needed
-    needs_sync = (
-        force or
-        not existing_article_id or
-        (updated_at and (not synced_at or updated_at > synced_at))
-    )
 
-    if not needs_sync:
+    # Unchanged posts are skipped by timestamp. --force always re-sends, as it
+    # exists to repair articles that were changed or lost on the Shopify side
+    if not (force or _needs_sync(post)):
         visibility = get_shopify_visibility_label(status)
         print(f"  [SKIP] {title[:50]} - up-to-date ({visibility})")
         return "skipped"
@@ -431,9 +615,15 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
         return "failed"
 
     shopify_blog_gid = category.get('shopify_blog_gid')
-    if not shopify_blog_gid:
+    if shopify_blog_gid:
+        tags = await get_post_tags(post_id)
+    else:
         print(f"  Syncing category '{category['name']}' first...")
-        shopify_blog_gid = await ensure_category_synced(category['id'])
+        # The post's tags are read while the category syncs
+        shopify_blog_gid, tags = await asyncio.gather(
+            ensure_category_synced(category['id']),
+            get_post_tags(post_id),
+        )
         if not shopify_blog_gid:
             print(f"  [FAIL] {title[:50]} - category sync failed")
             return "failed"
@@ -442,9 +632,6 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
     author = post.get('blog_authors', {})
     author_name = author.get('name') if author else SHOPIFY_DEFAULT_AUTHOR
 
-    # Get tags
-    tags = await get_post_tags(post_id)
-
     visibility = get_shopify_visibility_label(status)
     print(f"  Syncing: {title[:50]}... ({visibility})", end=" ")
 
@@ -477,7 +664,13 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
 
 
 def _needs_sync(post: dict) -> bool:
-    """Check if a post needs syncing."""
+    """
+    Check if a post needs syncing.
+
+    A post synced after its last edit would send Shopify the same article
+    again, so comparing updated_at with shopify_synced_at is enough to skip
+    a no-op articleUpdate - no content hash needs to be stored.
+    """
     shopify_article_id = post.get('shopify_article_id')
     updated_at = post.get('updated_at', '')
     synced_at = post.get('shopify_synced_at', '')
@@ -513,26 +706,31 @@ async def sync_all_posts(force: bool = False) -> dict:
         dict with keys: synced, failed, skipped
     """
     clear_sync_cache()  # Prevent duplicates across sync operations
-    posts = await get_all_posts()
-
-    if not posts:
-        print("No posts found in database.")
-        return {"synced": 0, "failed": 0, "skipped": 0}
-
-    print(f"Found {len(posts)} post(s) to sync...\n")
 
     synced = 0
     failed = 0
     skipped = 0
+    found_any = False
+
+    # Pages are synced as they arrive; ordered by id because syncing a post
+    # may bump its updated_at and shift later offsets
+    async for posts, total in iter_post_pages(order="id"):
+        if not found_any:
+            found_any = True
+            print(f"Found {total if total is not None else len(posts)} post(s) to sync...\n")
+        await _prewarm_post_lookups(posts, force)
+
+        for post in posts:
+            result = await _sync_single_post(post, force=force)
+            if result == "synced":
+                synced += 1
+            elif result == "skipped":
+                skipped += 1
+            else:
+                failed += 1
 
-    for post in posts:
-        result = await _sync_single_post(post, force=force)
-        if result == "synced":
-            synced += 1
-        elif result == "skipped":
-            skipped += 1
-        else:
-            failed += 1
+    if not found_any:
+        print("No posts found in database.")
 
     return {"synced": synced, "failed": failed, "skipped": skipped}
 
@@ -556,6 +754,7 @@ async def sync_pending_posts() -> dict:
         return {"synced": 0, "failed": 0, "skipped": 0}
 
     print(f"Found {len(posts)} post(s) needing sync...\n")
+    await _prewarm_post_lookups(posts)
 
     synced = 0
     failed = 0
@@ -582,14 +781,19 @@ async def sync_recent(n: int, force: bool = False) -> dict:
         dict with keys: synced, failed, skipped
     """
     clear_sync_cache()  # Prevent duplicates across sync operations
-    posts = await get_all_posts()
-    posts = posts[:n]  # Already sorted by updated_at desc
+    posts = []
+    if n > 0:
+        # Only the first page is needed - newest updates come first
+        async for page, _ in iter_post_pages(page_size=n):
+            posts = page
+            break
 
     if not posts:
         print("No posts found.")
         return {"synced": 0, "failed": 0, "skipped": 0}
 
     print(f"Syncing {len(posts)} most recent post(s)...\n")
+    await _prewarm_post_lookups(posts, force)
 
     synced = 0
     failed = 0
@@ -725,62 +929,97 @@ async def show_category_sync_status() -> None:
 # IMPORT FUNCTIONS (CMS -> Supabase)
 # =============================================================================
 
-async def _get_category_by_slug_supabase(slug: str) -> Optional[dict]:
-    """Check if a category exists in Supabase by slug."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
-    except Exception:
-        return None
+# Attempts for Supabase requests that fail to connect at all
+SUPABASE_CONNECT_ATTEMPTS = 3
 
 
-async def _insert_category_supabase(category_data: dict) -> tuple[bool, str]:
-    """Insert a new category into Supabase.
+async def _supabase_request(
+    method: str,
+    table: str,
+    ok: tuple = _OK_READ,
+    params: Optional[dict] = None,
+    payload=None,
+) -> tuple[bool, object]:
+    """
+    Send one request to a Supabase table with the shared session.
+
+    429/5xx-unavailable responses are retried with backoff by
+    request_with_retry; connection failures (nothing was sent) are retried
+    here. Network errors are logged once, so callers only branch on the result.
+
+    Args:
+        method: HTTP method
+        table: Supabase table name
+        ok: Statuses that count as success
+        params: Query parameters (PostgREST filters)
+        payload: JSON request body, if any
 
     Returns:
-        Tuple of (success, error_message)
+        (True, parsed JSON body or None if empty) on success,
+        (False, error message) on failure
     """
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_categories",
-                headers=headers,
-                json=category_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    return True, ""
-                else:
+    url = f"{SUPABASE_URL}/rest/v1/{table}"
+    kwargs = {"params": params, "headers": supabase_headers()}
+    if payload is not None:
+        kwargs["json"] = payload
+
+    for attempt in range(SUPABASE_CONNECT_ATTEMPTS):
+        try:
+            session = await get_http_session()
+            async with await request_with_retry(session, method, url, **kwargs) as resp:
+                if resp.status not in ok:
                     error_text = await resp.text()
                     return False, f"HTTP {resp.status}: {error_text[:200]}"
-    except Exception as e:
-        return False, str(e)
+                body = await resp.read()
+                return True, json_loads(body) if body else None
+        except aiohttp.ClientConnectorError as e:
+            if attempt < SUPABASE_CONNECT_ATTEMPTS - 1:
+                await asyncio.sleep(2 ** attempt + random.random())
+                continue
+            error = str(e)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            error = str(e) or type(e).__name__
+        print(f"  [WARN] Supabase {method} {table} failed: {error}")
+        return False, error
+
+
+async def _get_categories_by_slugs_bulk(slugs: list[str]) -> dict[str, dict]:
+    """Fetch existing Supabase categories for many slugs at once, keyed by slug."""
+    return await get_rows_by_values(
+        "blog_categories", "slug", slugs, select="id,slug,name,shopify_blog_gid"
+    )
 
 
-async def _update_category_supabase(category_id: str, category_data: dict) -> bool:
-    """Update an existing category in Supabase."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}",
-                headers=headers,
-                json=category_data
-            ) as resp:
-                return resp.status in [200, 204]
-    except Exception:
-        return False
+# Large imports echo roughly this many per-row lines; failures always print
+IMPORT_LOG_MAX_LINES = 100
+
+
+def _write_import_log(log_lines: list[str]) -> None:
+    """
+    Write buffered per-row import output in a single stdout write.
 
+    On large imports only every Nth row is echoed so the terminal isn't
+    flooded; [FAIL] lines are always shown. Counts in the summary are
+    unaffected.
+    """
+    if not log_lines:
+        return
+
+    log_every = max(1, len(log_lines) // IMPORT_LOG_MAX_LINES)
+    shown = [
+        line for i, line in enumerate(log_lines)
+        if i % log_every == 0 or "[FAIL]" in line
+    ]
+    if log_every > 1:
+        shown.append(f"  ... (showing 1 in {log_every} of {len(log_lines)} rows)")
 
-async def import_categories_from_shopify(force_pull: bool = False) -> dict:
+    sys.stdout.write("\n".join(shown) + "\n")
+
+
+async def import_categories_from_shopify(
+    force_pull: bool = False,
+    shopify_blogs: Optional[list] = None,
+) -> dict:
     """
     Import categories (blogs) from Shopify into Supabase.
 
@@ -791,13 +1030,14 @@ async def import_categories_from_shopify(force_pull: bool = False) -> dict:
     Args:
         force_pull: If True, overwrite existing Supabase categories with Shopify data.
                    If False (default), skip categories that already exist.
+        shopify_blogs: Blogs already fetched from Shopify. If None, they are fetched here.
 
     Returns:
         dict with keys: imported, updated, skipped, errors
     """
-    print("Fetching blogs from Shopify...")
-
-    shopify_blogs = await fetch_all_shopify_blogs()
+    if shopify_blogs is None:
+        print("Fetching blogs from Shopify...")
+        shopify_blogs = await fetch_all_shopify_blogs()
 
     if not shopify_blogs:
         print("No blogs found in Shopify (or fetch failed).")
@@ -805,63 +1045,100 @@ async def import_categories_from_shopify(force_pull: bool = False) -> dict:
 
     print(f"Found {len(shopify_blogs)} blogs in Shopify\n")
 
-    imported = 0
-    updated = 0
-    skipped = 0
     errors = []
 
+    # Split blogs into parallel handle/title/gid columns in one pass,
+    # recording blogs without a handle as errors up front
+    handles = []
+    titles = []
+    gids = []
     for blog in shopify_blogs:
-        gid = blog.get("id", "")
         handle = blog.get("handle", "")
-        title = blog.get("title", "")
-
         if not handle:
-            errors.append(f"Blog {gid} has no handle, skipping")
+            errors.append(f"Blog {blog.get('id', '')} has no handle, skipping")
             continue
+        handles.append(handle)
+        titles.append(blog.get("title", ""))
+        gids.append(blog.get("id", ""))
 
-        # Use handle as slug (they're equivalent in Shopify)
-        slug = handle
+    # Look up every existing category in one pass instead of one request per blog.
+    # Without a complete lookup, existing categories would be taken for new ones.
+    try:
+        existing_map = await _get_categories_by_slugs_bulk(handles)
+    except RuntimeError as e:
+        print(f"Import aborted - could not check existing categories: {e}")
+        return {"imported": 0, "updated": 0, "skipped": 0, "errors": errors + [str(e)]}
+
+    # One timestamp for the whole import run
+    now_iso = datetime.utcnow().isoformat()
+
+    imported = 0
+    updated = 0
+    skipped = 0
+    to_insert = []
+    to_update = []
+    log_lines = []  # Per-row output, written in one go after the batch
 
+    # Use handle as slug (they're equivalent in Shopify)
+    for slug, title, gid in zip(handles, titles, gids):
         # Check if category already exists in Supabase
-        existing = await _get_category_by_slug_supabase(slug)
+        existing = existing_map.get(slug)
 
         if existing:
-            if force_pull:
+            if force_pull and (
+                existing.get("name") == title
+                and existing.get("shopify_blog_gid") == gid
+            ):
+                # Already matches Shopify - nothing to write
+                log_lines.append(f"  [SKIP] {title} ({slug}) - unchanged")
+                skipped += 1
+            elif force_pull:
                 # Update existing category with Shopify data
-                update_data = {
+                # Note: Shopify blogs don't have descriptions, so none is sent
+                to_update.append({
+                    "slug": slug,
                     "name": title,
                     "shopify_blog_gid": gid,
-                    "shopify_synced_at": datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat(),
-                }
-                # Note: Shopify blogs don't have descriptions
-
-                success = await _update_category_supabase(existing["id"], update_data)
-                if success:
-                    print(f"  [UPDATE] {title} ({slug})")
-                    updated += 1
-                else:
-                    errors.append(f"Failed to update {slug}")
+                    "shopify_synced_at": now_iso,
+                    "updated_at": now_iso,
+                })
             else:
-                print(f"  [SKIP] {title} ({slug}) - already exists")
+                log_lines.append(f"  [SKIP] {title} ({slug}) - already exists")
                 skipped += 1
         else:
             # Insert new category
-            insert_data = {
+            to_insert.append({
                 "slug": slug,
                 "name": title,
                 "description": None,  # Shopify blogs don't have descriptions
                 "shopify_blog_gid": gid,
-                "shopify_synced_at": datetime.utcnow().isoformat(),
-            }
+                "shopify_synced_at": now_iso,
+            })
+
+    # Write all changed and new categories in bulk.
+    # New rows never overwrite: a slug that turns out to exist is left as is.
+    update_failures, insert_failures = await asyncio.gather(
+        upsert_rows("blog_categories", to_update),
+        upsert_rows("blog_categories", to_insert, ignore_duplicates=True),
+    )
 
-            success, error_msg = await _insert_category_supabase(insert_data)
-            if success:
-                print(f"  [IMPORT] {title} ({slug})")
-                imported += 1
-            else:
-                print(f"  [FAIL] {title} ({slug}) - {error_msg}")
-                errors.append(f"Failed to import {slug}: {error_msg}")
+    for row in to_update:
+        if row["slug"] in update_failures:
+            errors.append(f"Failed to update {row['slug']}")
+        else:
+            log_lines.append(f"  [UPDATE] {row['name']} ({row['slug']})")
+            updated += 1
+
+    for row in to_insert:
+        error_msg = insert_failures.get(row["slug"])
+        if error_msg:
+            log_lines.append(f"  [FAIL] {row['name']} ({row['slug']}) - {error_msg}")
+            errors.append(f"Failed to import {row['slug']}: {error_msg}")
+        else:
+            log_lines.append(f"  [IMPORT] {row['name']} ({row['slug']})")
+            imported += 1
+
+    _write_import_log(log_lines)
 
     # Summary
     print()
@@ -883,148 +1160,166 @@ async def import_categories_from_shopify(force_pull: bool = False) -> dict:
 # TAG IMPORT (Shopify → Supabase)
 # =============================================================================
 
+# Slug patterns, compiled once at import time
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[\s_-]+')
+_SLUG_TRIM_RE = re.compile(r'^-+|-+$')
+
+
+@lru_cache(maxsize=4096)
 def _slugify(text: str) -> str:
     """Convert text to URL-safe slug."""
-    import re
     slug = text.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_-]+', '-', slug)
-    slug = re.sub(r'^-+|-+$', '', slug)
+    slug = _SLUG_STRIP_RE.sub('', slug)
+    slug = _SLUG_SEPARATOR_RE.sub('-', slug)
+    slug = _SLUG_TRIM_RE.sub('', slug)
     return slug
 
 
 async def _get_tag_by_slug_supabase(slug: str) -> Optional[dict]:
-    """Check if a tag exists in Supabase by slug."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_tags?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    tags = await resp.json()
-                    return tags[0] if tags else None
-                return None
-    except Exception:
-        return None
-
-
-async def _insert_tag_supabase(tag_data: dict) -> tuple[bool, str]:
-    """Insert a new tag into Supabase. Returns (success, error_message)."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_tags",
-                headers=headers,
-                json=tag_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    return True, ""
-                else:
-                    error_text = await resp.text()
-                    return False, f"HTTP {resp.status}: {error_text[:200]}"
-    except Exception as e:
-        return False, str(e)
+    """Check if a tag exists in Supabase by slug. Only the tag `id` is returned."""
+    ok, tags = await _supabase_request(
+        "GET", "blog_tags",
+        params={"slug": f"eq.{slug}", "select": "id", "limit": "1"},
+    )
+    return tags[0] if ok and tags else None
 
 
-async def _update_tag_supabase(tag_id: str, update_data: dict) -> bool:
-    """Update an existing tag in Supabase."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_tags?id=eq.{tag_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
-    except Exception:
-        return False
+async def _get_tags_by_slugs_bulk(slugs: list[str]) -> dict[str, dict]:
+    """Fetch existing Supabase tags for many slugs at once, keyed by slug."""
+    return await get_rows_by_values("blog_tags", "slug", slugs, select="id,slug,name")
 
 
-async def import_tags_from_shopify(force_pull: bool = False) -> dict:
+async def import_tags_from_shopify(
+    force_pull: bool = False,
+    articles: Optional[list] = None,
+) -> dict:
     """
     Import tags from Shopify into Supabase.
 
     Shopify doesn't have a dedicated tags API - tags are strings attached to articles.
-    This function fetches all articles and extracts unique tags.
+    This function streams the tags of every article (without bodies) and
+    extracts the unique ones.
 
     Args:
         force_pull: If True, overwrite existing Supabase tags with Shopify data.
                    If False (default), skip tags that already exist.
+        articles: Articles already fetched from Shopify. If None, they are fetched here.
 
     Returns:
         dict with keys: imported, updated, skipped, errors
     """
-    print("Fetching articles from Shopify to extract tags...")
-
-    articles = await fetch_all_shopify_articles()
+    # Extract unique tags from all articles (strip each tag once, drop blanks)
+    if articles is None:
+        print("Fetching article tags from Shopify...")
+        article_count = 0
+        unique_tags = set()
+        async for tags in iter_shopify_article_tags():
+            article_count += 1
+            unique_tags.update(
+                stripped for tag in tags if tag and (stripped := tag.strip())
+            )
+    else:
+        article_count = len(articles)
+        unique_tags = {
+            stripped
+            for article in articles
+            for tag in (article.get("tags") or [])
+            if tag and (stripped := tag.strip())
+        }
 
-    if not articles:
+    if not article_count:
         print("No articles found in Shopify (or fetch failed).")
         return {"imported": 0, "updated": 0, "skipped": 0, "errors": []}
 
-    # Extract unique tags from all articles
-    unique_tags = set()
-    for article in articles:
-        tags = article.get("tags", [])
-        for tag in tags:
-            if tag and tag.strip():
-                unique_tags.add(tag.strip())
-
     if not unique_tags:
         print("No tags found in Shopify articles.")
         return {"imported": 0, "updated": 0, "skipped": 0, "errors": []}
 
-    print(f"Found {len(unique_tags)} unique tags across {len(articles)} articles\n")
+    print(f"Found {len(unique_tags)} unique tags across {article_count} articles\n")
 
-    imported = 0
-    updated = 0
-    skipped = 0
     errors = []
 
+    # Slugify each tag once, in sorted order, dropping tags with empty slugs
+    pairs = []
     for tag_name in sorted(unique_tags):
         slug = _slugify(tag_name)
-
         if not slug:
             errors.append(f"Tag '{tag_name}' produces empty slug, skipping")
             continue
+        pairs.append((slug, tag_name))
 
-        # Check if tag already exists in Supabase
-        existing = await _get_tag_by_slug_supabase(slug)
+    # Look up every existing tag in one pass instead of one request per tag.
+    # Without a complete lookup, existing tags would be taken for new ones.
+    try:
+        existing_map = await _get_tags_by_slugs_bulk([slug for slug, _ in pairs])
+    except RuntimeError as e:
+        print(f"Import aborted - could not check existing tags: {e}")
+        return {"imported": 0, "updated": 0, "skipped": 0, "errors": errors + [str(e)]}
 
-        if existing:
-            if force_pull:
+    imported = 0
+    updated = 0
+    skipped = 0
+    to_insert = []
+    to_update = []
+    log_lines = []  # Per-row output, written in one go after the batch
+    queued_slugs = set()
+
+    for slug, tag_name in pairs:
+        # Check if tag already exists in Supabase (or was already queued by
+        # another tag name that slugifies the same way)
+        existing = existing_map.get(slug)
+
+        if slug in queued_slugs:
+            log_lines.append(f"  [SKIP] {tag_name} ({slug}) - already exists")
+            skipped += 1
+        elif existing:
+            if force_pull and existing.get("name") == tag_name:
+                # Already matches Shopify - nothing to write
+                log_lines.append(f"  [SKIP] {tag_name} ({slug}) - unchanged")
+                skipped += 1
+            elif force_pull:
                 # Update existing tag
-                update_data = {
+                to_update.append({
+                    "slug": slug,
                     "name": tag_name,
-                }
-
-                success = await _update_tag_supabase(existing["id"], update_data)
-                if success:
-                    print(f"  [UPDATE] {tag_name} ({slug})")
-                    updated += 1
-                else:
-                    errors.append(f"Failed to update {slug}")
+                })
+                queued_slugs.add(slug)
             else:
-                print(f"  [SKIP] {tag_name} ({slug}) - already exists")
+                log_lines.append(f"  [SKIP] {tag_name} ({slug}) - already exists")
                 skipped += 1
         else:
             # Insert new tag
-            insert_data = {
+            to_insert.append({
                 "slug": slug,
                 "name": tag_name,
-            }
+            })
+            queued_slugs.add(slug)
+
+    # Write all changed and new tags in bulk.
+    # New rows never overwrite: a slug that turns out to exist is left as is.
+    update_failures, insert_failures = await asyncio.gather(
+        upsert_rows("blog_tags", to_update),
+        upsert_rows("blog_tags", to_insert, ignore_duplicates=True),
+    )
 
-            success, error_msg = await _insert_tag_supabase(insert_data)
-            if success:
-                print(f"  [IMPORT] {tag_name} ({slug})")
-                imported += 1
-            else:
-                print(f"  [FAIL] {tag_name} ({slug}) - {error_msg}")
-                errors.append(f"Failed to import {slug}: {error_msg}")
+    for row in to_update:
+        if row["slug"] in update_failures:
+            errors.append(f"Failed to update {row['slug']}")
+        else:
+            log_lines.append(f"  [UPDATE] {row['name']} ({row['slug']})")
+            updated += 1
+
+    for row in to_insert:
+        error_msg = insert_failures.get(row["slug"])
+        if error_msg:
+            log_lines.append(f"  [FAIL] {row['name']} ({row['slug']}) - {error_msg}")
+            errors.append(f"Failed to import {row['slug']}: {error_msg}")
+        else:
+            log_lines.append(f"  [IMPORT] {row['name']} ({row['slug']})")
+            imported += 1
+
+    _write_import_log(log_lines)
 
     # Summary
     print()
@@ -1048,36 +1343,33 @@ async def import_tags_from_shopify(force_pull: bool = False) -> dict:
 
 async def _get_post_by_slug_supabase(slug: str) -> Optional[dict]:
     """Check if a post exists in Supabase by slug."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
-    except Exception:
-        return None
+    ok, posts = await _supabase_request(
+        "GET", "blog_posts", params={"slug": f"eq.{slug}", "limit": "1"}
+    )
+    return posts[0] if ok and posts else None
 
 
 async def _get_category_by_shopify_gid(gid: str) -> Optional[dict]:
     """Get Supabase category by Shopify GID."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?shopify_blog_gid=eq.{gid}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
-    except Exception:
-        return None
+    ok, categories = await _supabase_request(
+        "GET", "blog_categories", params={"shopify_blog_gid": f"eq.{gid}", "limit": "1"}
+    )
+    return categories[0] if ok and categories else None
+
+
+EXCERPT_MAX_LENGTH = 300
+
+
+def _truncate_excerpt(excerpt: str) -> str:
+    """Cap an imported excerpt at EXCERPT_MAX_LENGTH chars, ending with '...' when cut."""
+    if not excerpt or len(excerpt) <= EXCERPT_MAX_LENGTH:
+        return excerpt
+    return f"{excerpt[:EXCERPT_MAX_LENGTH - 3]}..."
+
+
+async def _no_result() -> None:
+    """Placeholder coroutine for optional lookups inside asyncio.gather."""
+    return None
 
 
 async def _get_tag_by_name_supabase(name: str) -> Optional[dict]:
@@ -1086,59 +1378,43 @@ async def _get_tag_by_name_supabase(name: str) -> Optional[dict]:
     return await _get_tag_by_slug_supabase(slug)
 
 
+# Default author ID, cached after the first successful lookup
+_default_author_id: Optional[str] = None
+
+
 async def _get_default_author_id() -> Optional[str]:
-    """Get the default author ID from Supabase."""
+    """Get the default author ID from Supabase (cached for the process lifetime)."""
+    global _default_author_id
+    if _default_author_id:
+        return _default_author_id
+
     from config import DEFAULT_AUTHOR_SLUG
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_authors?slug=eq.{DEFAULT_AUTHOR_SLUG}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    authors = await resp.json()
-                    return authors[0]["id"] if authors else None
-                return None
-    except Exception:
+    ok, authors = await _supabase_request(
+        "GET", "blog_authors", params={"slug": f"eq.{DEFAULT_AUTHOR_SLUG}", "limit": "1"}
+    )
+    if not ok:
         return None
+    _default_author_id = authors[0]["id"] if authors else None
+    return _default_author_id
 
 
 async def _insert_post_supabase(post_data: dict) -> tuple[bool, str, Optional[str]]:
     """Insert a new post into Supabase. Returns (success, error_message, post_id)."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            headers["Prefer"] = "return=representation"
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_posts",
-                headers=headers,
-                json=post_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    result = await resp.json()
-                    post_id = result[0]["id"] if result else None
-                    return True, "", post_id
-                else:
-                    error_text = await resp.text()
-                    return False, f"HTTP {resp.status}: {error_text[:200]}", None
-    except Exception as e:
-        return False, str(e), None
+    # Default headers already ask for return=representation
+    ok, result = await _supabase_request("POST", "blog_posts", ok=_OK_WRITE, payload=post_data)
+    if not ok:
+        return False, result, None
+    post_id = result[0]["id"] if result else None
+    return True, "", post_id
 
 
 async def _update_post_supabase(post_id: str, update_data: dict) -> bool:
     """Update an existing post in Supabase."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
-    except Exception:
-        return False
+    ok, _ = await _supabase_request(
+        "PATCH", "blog_posts", ok=_OK_PATCH,
+        params={"id": f"eq.{post_id}"}, payload=update_data,
+    )
+    return ok
 
 
 async def _create_post_tag_relations(post_id: str, tag_ids: list) -> int:
@@ -1146,79 +1422,104 @@ async def _create_post_tag_relations(post_id: str, tag_ids: list) -> int:
     if not tag_ids:
         return 0
 
-    created = 0
-    for tag_id in tag_ids:
-        try:
-            async with aiohttp.ClientSession() as session:
-                headers = get_supabase_headers()
-                async with session.post(
-                    f"{SUPABASE_URL}/rest/v1/blog_post_tags",
-                    headers=headers,
-                    json={"post_id": post_id, "tag_id": tag_id}
-                ) as resp:
-                    if resp.status in [200, 201]:
-                        created += 1
-        except Exception:
-            pass
-    return created
-
-
-async def _delete_post_tag_relations(post_id: str) -> bool:
-    """Delete all post-tag relationships for a post."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.delete(
-                f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}",
-                headers=headers
-            ) as resp:
-                return resp.status in [200, 204]
-    except Exception:
-        return False
-
+    # PostgREST inserts a JSON array in one request. Duplicate tag IDs would
+    # violate the (post_id, tag_id) key and fail the whole batch, so drop them.
+    unique_tag_ids = list(dict.fromkeys(tag_ids))
+    ok, rows = await _supabase_request(
+        "POST", "blog_post_tags", ok=_OK_WRITE,
+        payload=[{"post_id": post_id, "tag_id": tag_id} for tag_id in unique_tag_ids],
+    )
+    return len(rows) if ok and rows else 0
 
-async def import_posts_from_shopify(force_pull: bool = False) -> dict:
-    """
-    Import posts (articles) from Shopify into Supabase.
 
-    This is a reverse sync - pulling existing articles from Shopify
-    into Supabase. Useful when setting up the generator with an existing store.
+async def _delete_post_tag_relations(post_id: str, tag_ids: list = None) -> bool:
+    """Delete post-tag relationships for a post - all of them, or only `tag_ids` if given."""
+    params = {"post_id": f"eq.{post_id}"}
+    if tag_ids:
+        params["tag_id"] = "in.(" + ",".join(f'"{tag_id}"' for tag_id in tag_ids) + ")"
+    ok, _ = await _supabase_request("DELETE", "blog_post_tags", ok=_OK_DELETE, params=params)
+    return ok
 
-    Shopify HTML content is stored as a single HTML content block in the
-    content JSONB field, preserving the original formatting.
-
-    Prerequisites:
-    - Import categories first with --shopify-import-categories
-    - Import tags first with --shopify-import-tags
 
-    Args:
-        force_pull: If True, overwrite existing Supabase posts with Shopify data.
-                   If False (default), skip posts that already exist.
+async def _get_post_tag_ids_bulk(post_ids: list[str]) -> Optional[dict[str, set]]:
+    """
+    Fetch the current tag IDs for many posts at once, keyed by post ID.
 
-    Returns:
-        dict with keys: imported, updated, skipped, errors
+    Returns None if the relations couldn't all be read, so callers don't
+    diff against an incomplete set.
     """
-    print("Fetching articles from Shopify...")
+    try:
+        rows = await fetch_rows_by_values(
+            "blog_post_tags", "post_id", post_ids,
+            select="post_id,tag_id", order="post_id,tag_id",
+        )
+    except RuntimeError as e:
+        print(f"  [WARN] Could not read current post tags: {e}")
+        return None
+    tag_ids_by_post = {}
+    for row in rows:
+        tag_ids_by_post.setdefault(row["post_id"], set()).add(row["tag_id"])
+    return tag_ids_by_post
 
-    articles = await fetch_all_shopify_articles()
 
-    if not articles:
-        print("No articles found in Shopify (or fetch failed).")
-        return {"imported": 0, "updated": 0, "skipped": 0, "errors": []}
+async def _sync_post_tag_relations(
+    post_id: str,
+    desired_tag_ids: list,
+    existing_tag_ids: Optional[set],
+) -> None:
+    """
+    Bring a post's tag relations in line with `desired_tag_ids`.
 
-    print(f"Found {len(articles)} articles in Shopify\n")
+    Only the difference is written: relations no longer wanted are deleted
+    and missing ones inserted. Nothing is sent when the tags are unchanged.
+    When the current relations are unknown (existing_tag_ids is None), all
+    of them are replaced instead.
+    """
+    if existing_tag_ids is None:
+        await _delete_post_tag_relations(post_id)
+        await _create_post_tag_relations(post_id, desired_tag_ids)
+        return
 
-    # Get default author
-    default_author_id = await _get_default_author_id()
-    if not default_author_id:
-        print("Warning: No default author found. Posts will be created without author.")
+    to_add = [tag_id for tag_id in dict.fromkeys(desired_tag_ids) if tag_id not in existing_tag_ids]
+    to_remove = list(existing_tag_ids.difference(desired_tag_ids))
+
+    tasks = []
+    if to_remove:
+        tasks.append(_delete_post_tag_relations(post_id, to_remove))
+    if to_add:
+        tasks.append(_create_post_tag_relations(post_id, to_add))
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def _import_shopify_article(
+    article: dict,
+    default_author_id: Optional[str],
+    force_pull: bool,
+    semaphore: asyncio.Semaphore,
+    posts_by_slug: dict[str, dict],
+    cats_by_gid: dict[str, dict],
+    tags_by_slug: dict[str, dict],
+    tag_ids_by_post: Optional[dict[str, set]],
+    claimed_slugs: set,
+    now_iso: str,
+) -> tuple[str, Optional[str], Optional[str]]:
+    """
+    Import one Shopify article into Supabase (used by import_posts_from_shopify).
 
-    imported = 0
-    updated = 0
-    skipped = 0
-    errors = []
+    Existing posts, categories, tags and (when force-pulling) current
+    post-tag relations are resolved from the maps prefetched by the caller
+    rather than queried per article.
+    `claimed_slugs` is shared by all articles in the run so a handle that
+    appears in more than one blog is only written once. `now_iso` is the
+    run's shared shopify_synced_at timestamp.
 
-    for article in articles:
+    Returns:
+        Tuple of (status, log_line, error) where status is one of
+        "imported", "updated", "skipped" or "error"; log_line and error
+        are None when there is nothing to report.
+    """
+    async with semaphore:
         gid = article.get("id", "")
         handle = article.get("handle", "")
         title = article.get("title", "")
@@ -1228,16 +1529,14 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
         tags = article.get("tags", [])
 
         if not handle:
-            errors.append(f"Article {gid} has no handle, skipping")
-            continue
+            return "error", None, f"Article {gid} has no handle, skipping"
 
         slug = handle
 
         # Clean up excerpt
         # Truncate long excerpts, but don't set placeholder text
         # Empty excerpts should stay empty to avoid overwriting Shopify data
-        if excerpt and len(excerpt) > 300:
-            excerpt = excerpt[:297] + "..."
+        excerpt = _truncate_excerpt(excerpt)
 
         # Store HTML content as a single HTML block
         content_blocks = [{"type": "html", "content": content_html}] if content_html else []
@@ -1245,31 +1544,31 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
         # SAFETY CHECK: Validate content is not empty before proceeding
         content_length = len(content_html.strip()) if content_html else 0
         if content_length < 50:
-            print(f"  [SKIP] {title[:50]}... ({slug}) - empty/minimal content ({content_length} chars)")
-            errors.append(f"Skipped {slug}: empty content from Shopify ({content_length} chars)")
-            skipped += 1
-            continue
+            return (
+                "skipped",
+                f"  [SKIP] {title[:50]}... ({slug}) - empty/minimal content ({content_length} chars)",
+                f"Skipped {slug}: empty content from Shopify ({content_length} chars)",
+            )
 
         # Get featured image
         image_data = article.get("image", {})
         featured_image = image_data.get("url") if image_data else None
         featured_image_alt = image_data.get("altText") if image_data else None
 
-        # Resolve category (blog)
+        # Handles are only unique per blog - the first article with a slug wins
+        if slug in claimed_slugs:
+            return "skipped", f"  [SKIP] {title[:50]}... ({slug}) - already exists", None
+        claimed_slugs.add(slug)
+
+        # Resolve category (blog), tags and any existing post from the prefetched maps
         blog_data = article.get("blog", {})
         blog_gid = blog_data.get("id") if blog_data else None
-        category_id = None
-        if blog_gid:
-            cat = await _get_category_by_shopify_gid(blog_gid)
-            if cat:
-                category_id = cat["id"]
-
-        # Resolve tags
-        supabase_tag_ids = []
-        for tag_name in tags:
-            tag = await _get_tag_by_name_supabase(tag_name)
-            if tag:
-                supabase_tag_ids.append(tag["id"])
+        cat = cats_by_gid.get(blog_gid) if blog_gid else None
+        category_id = cat["id"] if cat else None
+        supabase_tag_ids = [
+            tag["id"] for tag in (tags_by_slug.get(_slugify(t)) for t in tags) if tag
+        ]
+        existing = posts_by_slug.get(slug)
 
         # Get SEO data
         seo_data = article.get("seo", {})
@@ -1280,9 +1579,6 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
             if seo_data.get("description"):
                 seo["description"] = seo_data["description"]
 
-        # Check if post already exists in Supabase
-        existing = await _get_post_by_slug_supabase(slug)
-
         if existing:
             if force_pull:
                 # Update existing post with Shopify data
@@ -1295,7 +1591,7 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
                     "featured_image_alt": featured_image_alt,
                     "category_id": category_id,
                     "shopify_article_id": gid,
-                    "shopify_synced_at": datetime.utcnow().isoformat(),
+                    "shopify_synced_at": now_iso,
                     "shopify_sync_error": None,
                 }
                 if seo:
@@ -1306,20 +1602,20 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
                     # Update tag relations - SAFETY: only modify tags if we have tags to set
                     # This prevents accidental tag deletion when import fails to resolve tags
                     if supabase_tag_ids:
-                        await _delete_post_tag_relations(existing["id"])
-                        await _create_post_tag_relations(existing["id"], supabase_tag_ids)
+                        await _sync_post_tag_relations(
+                            existing["id"],
+                            supabase_tag_ids,
+                            None if tag_ids_by_post is None
+                            else tag_ids_by_post.get(existing["id"], set()),
+                        )
                         tag_info = f" [{len(supabase_tag_ids)} tags]"
                     else:
                         # Don't delete existing tags if we have no new tags
                         # This is safer - preserves existing data
                         tag_info = " [tags preserved]"
-                    print(f"  [UPDATE] {title[:50]}... ({slug}){tag_info}")
-                    updated += 1
-                else:
-                    errors.append(f"Failed to update {slug}")
-            else:
-                print(f"  [SKIP] {title[:50]}... ({slug}) - already exists")
-                skipped += 1
+                    return "updated", f"  [UPDATE] {title[:50]}... ({slug}){tag_info}", None
+                return "error", None, f"Failed to update {slug}"
+            return "skipped", f"  [SKIP] {title[:50]}... ({slug}) - already exists", None
         else:
             # Insert new post
             insert_data = {
@@ -1333,7 +1629,7 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
                 "author_id": default_author_id,
                 "category_id": category_id,
                 "shopify_article_id": gid,
-                "shopify_synced_at": datetime.utcnow().isoformat(),
+                "shopify_synced_at": now_iso,
             }
             if seo:
                 insert_data["seo"] = seo
@@ -1351,14 +1647,170 @@ async def import_posts_from_shopify(force_pull: bool = False) -> dict:
                 await _create_post_tag_relations(new_post_id, supabase_tag_ids)
                 tag_count = len(supabase_tag_ids)
                 tag_info = f" [{tag_count} tags]" if tag_count else ""
-                print(f"  [IMPORT] {title[:50]}... ({slug}){tag_info}")
-                imported += 1
-            else:
-                print(f"  [FAIL] {title[:50]}... ({slug}) - {error_msg}")
-                errors.append(f"Failed to import {slug}: {error_msg}")
+                return "imported", f"  [IMPORT] {title[:50]}... ({slug}){tag_info}", None
+            return (
+                "error",
+                f"  [FAIL] {title[:50]}... ({slug}) - {error_msg}",
+                f"Failed to import {slug}: {error_msg}",
+            )
+
+
+# Shopify article pages buffered ahead of the import while the current page is processed
+ARTICLE_PAGE_PREFETCH = 2
+
+
+async def _single_page(articles: list) -> AsyncIterator[list]:
+    """Present an already-fetched article list as a single page."""
+    if articles:
+        yield articles
+
+
+async def _prefetch_article_lookups(
+    articles: list, force_pull: bool
+) -> tuple[dict, dict, dict, Optional[dict]]:
+    """
+    Fetch every existing post, category and tag a page of articles refers to.
+
+    One bulk query each instead of several per article. Current post-tag
+    relations are only needed (and fetched) when force-pulling.
+
+    Returns:
+        Tuple of (posts_by_slug, cats_by_gid, tags_by_slug, tag_ids_by_post)
+    """
+    posts_by_slug, cats_by_gid, tags_by_slug = await asyncio.gather(
+        get_rows_by_values(
+            "blog_posts", "slug",
+            [a.get("handle") for a in articles],
+            select="id,slug",
+        ),
+        get_rows_by_values(
+            "blog_categories", "shopify_blog_gid",
+            [(a.get("blog") or {}).get("id") for a in articles],
+            select="id,shopify_blog_gid",
+        ),
+        _get_tags_by_slugs_bulk(
+            [_slugify(t) for a in articles for t in (a.get("tags") or [])]
+        ),
+    )
+
+    # Existing posts only get their tags rewritten when force-pulling.
+    # None means the current relations are unknown (replace, don't diff).
+    tag_ids_by_post = {}
+    if force_pull and posts_by_slug:
+        tag_ids_by_post = await _get_post_tag_ids_bulk(
+            [post["id"] for post in posts_by_slug.values()]
+        )
+
+    return posts_by_slug, cats_by_gid, tags_by_slug, tag_ids_by_post
+
+
+async def import_posts_from_shopify(
+    force_pull: bool = False,
+    articles: Optional[list] = None,
+) -> dict:
+    """
+    Import posts (articles) from Shopify into Supabase.
+
+    This is a reverse sync - pulling existing articles from Shopify
+    into Supabase. Useful when setting up the generator with an existing store.
+
+    Shopify HTML content is stored as a single HTML content block in the
+    content JSONB field, preserving the original formatting.
+
+    Prerequisites:
+    - Import categories first with --shopify-import-categories
+    - Import tags first with --shopify-import-tags
+
+    Args:
+        force_pull: If True, overwrite existing Supabase posts with Shopify data.
+                   If False (default), skip posts that already exist.
+        articles: Articles already fetched from Shopify. If None, they are fetched here.
+
+    Returns:
+        dict with keys: imported, updated, skipped, errors
+    """
+    if articles is None:
+        # Stream pages from Shopify so importing starts with the first page
+        print("Fetching articles from Shopify...")
+        pages = iter_shopify_article_pages()
+    else:
+        pages = _single_page(articles)
+
+    default_author_id = await _get_default_author_id()
+    if not default_author_id:
+        print("Warning: No default author found. Posts will be created without author.")
+
+    # Producer: fetch the next page(s) from Shopify while the current one is imported
+    page_queue = asyncio.Queue(maxsize=ARTICLE_PAGE_PREFETCH)
+
+    async def produce_pages():
+        try:
+            async for page in pages:
+                await page_queue.put(page)
+        finally:
+            await page_queue.put(None)  # Sentinel - always ends the consumer loop
+
+    producer = asyncio.create_task(produce_pages())
+
+    # Consumer: articles are processed concurrently, bounded to respect Supabase rate limits
+    semaphore = asyncio.Semaphore(SHOPIFY_IMPORT_CONCURRENCY)
+    claimed_slugs = set()
+    now_iso = datetime.utcnow().isoformat()  # One sync timestamp for the whole run
+    counts = {"imported": 0, "updated": 0, "skipped": 0, "error": 0}
+    errors = []
+    article_count = 0
+
+    try:
+        while (page := await page_queue.get()) is not None:
+            article_count += len(page)
+            try:
+                posts_by_slug, cats_by_gid, tags_by_slug, tag_ids_by_post = (
+                    await _prefetch_article_lookups(page, force_pull)
+                )
+            except RuntimeError as e:
+                # Without the lookups existing posts would look new - skip the page
+                print(f"  [FAIL] {len(page)} articles not imported - {e}")
+                counts["error"] += len(page)
+                errors.append(f"{len(page)} articles not imported: {e}")
+                continue
+
+            results = await asyncio.gather(*[
+                _import_shopify_article(
+                    article, default_author_id, force_pull, semaphore,
+                    posts_by_slug, cats_by_gid, tags_by_slug, tag_ids_by_post,
+                    claimed_slugs, now_iso,
+                )
+                for article in page
+            ])
+
+            log_lines = []
+            for status, log_line, error in results:
+                counts[status] += 1
+                if log_line:
+                    log_lines.append(log_line)
+                if error:
+                    errors.append(error)
+
+            # Per-article output, written in original article order
+            if log_lines:
+                sys.stdout.write("\n".join(log_lines) + "\n")
+    finally:
+        if not producer.done():
+            producer.cancel()
+
+    await producer  # Surface any error raised while paging Shopify
+
+    if not article_count:
+        print("No articles found in Shopify (or fetch failed).")
+        return {"imported": 0, "updated": 0, "skipped": 0, "errors": []}
+
+    imported = counts["imported"]
+    updated = counts["updated"]
+    skipped = counts["skipped"]
 
     # Summary
     print()
+    print(f"Processed {article_count} articles from Shopify")
     print(f"Import complete: {imported} imported, {updated} updated, {skipped} skipped")
     if errors:
         print(f"Errors: {len(errors)}")
@@ -1392,29 +1844,15 @@ async def import_single_post_from_shopify(slug: str) -> bool:
     """
     print(f"Fetching article '{slug}' from Shopify...")
 
-    # Fetch all articles and find the one we want
-    articles = await fetch_all_shopify_articles()
-
-    if not articles:
-        print("Error: Could not fetch articles from Shopify.")
-        return False
-
-    # Find the article by handle
-    article = None
-    for a in articles:
-        if a.get("handle") == slug:
-            article = a
-            break
+    # Look the article up directly by handle rather than paging every blog
+    article = await fetch_shopify_article_by_handle(slug)
 
     if not article:
         print(f"Error: Article with slug '{slug}' not found in Shopify.")
-        available = [a.get("handle", "?") for a in articles[:10]]
-        print(f"Available slugs: {', '.join(available)}")
-        if len(articles) > 10:
-            print(f"  ... and {len(articles) - 10} more")
         return False
 
     # Extract article data
+    now_iso = datetime.utcnow().isoformat()
     gid = article.get("id", "")
     handle = article.get("handle", "")
     title = article.get("title", "")
@@ -1424,8 +1862,7 @@ async def import_single_post_from_shopify(slug: str) -> bool:
     tags = article.get("tags", [])
 
     # Clean up excerpt (truncate if too long, but don't add placeholder)
-    if excerpt and len(excerpt) > 300:
-        excerpt = excerpt[:297] + "..."
+    excerpt = _truncate_excerpt(excerpt)
 
     # Store HTML content as a single HTML block
     content_blocks = [{"type": "html", "content": content_html}] if content_html else []
@@ -1445,32 +1882,27 @@ async def import_single_post_from_shopify(slug: str) -> bool:
     featured_image = image_data.get("url") if image_data else None
     featured_image_alt = image_data.get("altText") if image_data else None
 
-    # Resolve category (blog)
+    # Resolve category (blog), default author, existing post and tags concurrently
     blog_data = article.get("blog", {})
     blog_gid = blog_data.get("id") if blog_data else None
+    cat, default_author_id, existing, *tag_results = await asyncio.gather(
+        _get_category_by_shopify_gid(blog_gid) if blog_gid else _no_result(),
+        _get_default_author_id(),
+        _get_post_by_slug_supabase(slug),
+        *[_get_tag_by_name_supabase(tag_name) for tag_name in tags],
+    )
+
     category_id = None
     if blog_gid:
-        cat = await _get_category_by_shopify_gid(blog_gid)
         if cat:
             category_id = cat["id"]
             print(f"  Category: {cat.get('name', '?')}")
         else:
             print(f"  Warning: Blog {blog_gid} not found in Supabase. Run --shopify-import-categories first.")
 
-    # Resolve tags
-    supabase_tag_ids = []
-    for tag_name in tags:
-        tag = await _get_tag_by_name_supabase(tag_name)
-        if tag:
-            supabase_tag_ids.append(tag["id"])
+    supabase_tag_ids = [tag["id"] for tag in tag_results if tag]
     print(f"  Tags: {len(tags)} in Shopify, {len(supabase_tag_ids)} matched in Supabase")
 
-    # Get default author
-    default_author_id = await _get_default_author_id()
-
-    # Check if post already exists in Supabase
-    existing = await _get_post_by_slug_supabase(slug)
-
     if existing:
         print(f"  Updating existing Supabase post...")
 
@@ -1483,7 +1915,7 @@ async def import_single_post_from_shopify(slug: str) -> bool:
             "featured_image_alt": featured_image_alt,
             "category_id": category_id,
             "shopify_article_id": gid,
-            "shopify_synced_at": datetime.utcnow().isoformat(),
+            "shopify_synced_at": now_iso,
             "shopify_sync_error": None,
         }
 
@@ -1515,7 +1947,7 @@ async def import_single_post_from_shopify(slug: str) -> bool:
             "author_id": default_author_id,
             "category_id": category_id,
             "shopify_article_id": gid,
-            "shopify_synced_at": datetime.utcnow().isoformat(),
+            "shopify_synced_at": now_iso,
         }
 
         if published_at:
@@ -1540,6 +1972,8 @@ async def import_all_from_shopify(force_pull: bool = False) -> dict:
     Import all content from Shopify into Supabase.
 
     Imports in order: categories (blogs), tags, posts (articles).
+    Blogs and articles are fetched from Shopify once, concurrently, and
+    shared by all three imports.
 
     Args:
         force_pull: If True, overwrite existing Supabase data.
@@ -1549,22 +1983,29 @@ async def import_all_from_shopify(force_pull: bool = False) -> dict:
     """
     results = {}
 
+    print("Fetching blogs and articles from Shopify...")
+    shopify_blogs, articles = await asyncio.gather(
+        fetch_all_shopify_blogs(),
+        fetch_all_shopify_articles(),
+    )
+    print()
+
     print("=" * 60)
     print("IMPORTING CATEGORIES (BLOGS)")
     print("=" * 60)
-    results["categories"] = await import_categories_from_shopify(force_pull)
+    results["categories"] = await import_categories_from_shopify(force_pull, shopify_blogs)
     print()
 
     print("=" * 60)
     print("IMPORTING TAGS")
     print("=" * 60)
-    results["tags"] = await import_tags_from_shopify(force_pull)
+    results["tags"] = await import_tags_from_shopify(force_pull, articles)
     print()
 
     print("=" * 60)
     print("IMPORTING POSTS (ARTICLES)")
     print("=" * 60)
-    results["posts"] = await import_posts_from_shopify(force_pull)
+    results["posts"] = await import_posts_from_shopify(force_pull, articles)
     print()
 
     # Final summary
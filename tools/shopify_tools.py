@@ -8,10 +8,14 @@ This module provides:
 4. SEO metafield management
 """
 
+import asyncio
 import json
 import re
 import html
-from typing import Optional, Any
+import random
+import time
+from functools import lru_cache
+from typing import Optional, Any, AsyncIterator, Awaitable, Callable, Iterator, Literal
 from datetime import datetime, timedelta
 import aiohttp
 import sys
@@ -28,6 +32,7 @@ from config import (
     SHOPIFY_API_VERSION,
     SHOPIFY_DEFAULT_AUTHOR,
 )
+from tools.http_session import get_http_session, json_dumps, json_loads, MAX_RETRY_DELAY, RETRY_STATUSES
 
 
 # =============================================================================
@@ -45,6 +50,18 @@ class ShopifyTokenManager:
     def __init__(self):
         self._access_token: Optional[str] = None
         self._expires_at: Optional[datetime] = None
+        # Serializes refreshes so concurrent callers share one token request.
+        # Recreated per event loop since each CLI command runs its own loop.
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the refresh lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
 
     def is_token_valid(self) -> bool:
         """Check if current token is valid and not expired."""
@@ -63,8 +80,13 @@ class ShopifyTokenManager:
         if self.is_token_valid():
             return self._access_token
 
-        # Need to fetch a new token
-        return await self._fetch_new_token()
+        async with self._get_lock():
+            # Another caller may have refreshed while we waited for the lock
+            if self.is_token_valid():
+                return self._access_token
+
+            # Need to fetch a new token
+            return await self._fetch_new_token()
 
     async def _fetch_new_token(self) -> Optional[str]:
         """
@@ -80,29 +102,29 @@ class ShopifyTokenManager:
         token_url = f"https://{SHOPIFY_STORE}.myshopify.com/admin/oauth/access_token"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    token_url,
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": SHOPIFY_CLIENT_ID,
-                        "client_secret": SHOPIFY_CLIENT_SECRET,
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status != 200:
-                        error_text = await resp.text()
-                        print(f"Error fetching Shopify token: {resp.status} - {error_text}")
-                        return None
-
-                    result = await resp.json()
-
-                    self._access_token = result.get("access_token")
-                    expires_in = result.get("expires_in", 86400)  # Default 24 hours
-                    self._expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
-
-                    return self._access_token
+            session = await get_http_session()
+            async with session.post(
+                token_url,
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": SHOPIFY_CLIENT_ID,
+                    "client_secret": SHOPIFY_CLIENT_SECRET,
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as resp:
+                if resp.status != 200:
+                    error_text = await resp.text()
+                    print(f"Error fetching Shopify token: {resp.status} - {error_text}")
+                    return None
+
+                result = await resp.json()
+
+                self._access_token = result.get("access_token")
+                expires_in = result.get("expires_in", 86400)  # Default 24 hours
+                self._expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+
+                return self._access_token
 
         except aiohttp.ClientError as e:
             print(f"Network error fetching Shopify token: {e}")
@@ -166,32 +188,67 @@ def get_shopify_publish_settings(status: str, scheduled_at: Optional[str] = None
     }
 
 
+_SHOPIFY_VISIBILITY_LABELS = {
+    'draft': 'Hidden',
+    'archived': 'Hidden',
+    'published': 'Visible',
+    'scheduled': 'Scheduled',
+}
+
+
 def get_shopify_visibility_label(status: str) -> str:
     """Get human-readable Shopify visibility for a given status."""
-    mapping = {
-        'draft': 'Hidden',
-        'archived': 'Hidden',
-        'published': 'Visible',
-        'scheduled': 'Scheduled',
-    }
-    return mapping.get(status, 'Hidden')
+    return _SHOPIFY_VISIBILITY_LABELS.get(status, 'Hidden')
 
 
 # =============================================================================
 # HTML ESCAPE UTILITIES
 # =============================================================================
 
+# Heading/anchor patterns, compiled once at import time
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_ANCHOR_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+
 def escape_html(text: str) -> str:
     """Escape HTML special characters for safe output."""
+    if not text:
+        return ''
+    if not isinstance(text, str):
+        text = str(text)
+    # Short strings (alts, captions, labels) repeat a lot - memoize those
+    if len(text) <= ESCAPE_CACHE_MAX_LENGTH:
+        return _escape_html_cached(text)
+    return _escape_html_uncached(text)
+
+
+def _escape_html_uncached(text: str) -> str:
+    """Escape a string, skipping html.escape() when nothing needs escaping."""
+    # Fast path: nothing to escape, return the string as-is. Each `in` is a
+    # C-level memchr scan - much cheaper than a regex character class
+    if not (
+        '&' in text or '<' in text or '>' in text or '"' in text or "'" in text
+    ):
+        return text
+    # html.escape's C-level str.replace calls beat a str.translate table here:
+    # translate with multi-char replacements is several times slower except on
+    # long text with very few special characters
     return html.escape(text)
 
 
+# Longest string escape_html memoizes; longer text is rarely repeated
+ESCAPE_CACHE_MAX_LENGTH = 200
+_escape_html_cached = lru_cache(maxsize=4096)(_escape_html_uncached)
+
+
+# Memoized: each heading is anchored by both render_heading and the auto-generated TOC
+@lru_cache(maxsize=1024)
 def generate_anchor_id(text: str) -> str:
     """Generate a URL-safe anchor ID from heading text."""
     # Strip HTML tags first
-    clean_text = re.sub(r'<[^>]*>', '', text)
+    clean_text = _HTML_TAG_RE.sub('', text)
     # Convert to lowercase, replace non-alphanumeric with hyphens
-    anchor = re.sub(r'[^a-z0-9]+', '-', clean_text.lower())
+    anchor = _ANCHOR_SEPARATOR_RE.sub('-', clean_text.lower())
     # Remove leading/trailing hyphens
     return anchor.strip('-')
 
@@ -200,6 +257,10 @@ def generate_anchor_id(text: str) -> str:
 # CONTENT BLOCK TO HTML RENDERER
 # =============================================================================
 
+# Block types that still produce output when their data dict is empty
+_DATALESS_BLOCK_TYPES = frozenset({'divider', 'widget', 'tableOfContents'})
+
+
 def render_blocks_to_html(blocks: list) -> str:
     """
     Convert an array of content blocks to HTML string.
@@ -213,10 +274,23 @@ def render_blocks_to_html(blocks: list) -> str:
     Returns:
         HTML string suitable for Shopify article body
     """
+    # str.join sums the part lengths and allocates the result once, so no
+    # size estimate or buffer preallocation is needed here
+    return '\n\n'.join(iter_blocks_html(blocks))
+
+
+def iter_blocks_html(blocks: list) -> Iterator[str]:
+    """
+    Yield the rendered HTML of each block, skipping empty and unknown ones.
+
+    render_blocks_to_html joins this; callers that stream the body (to a
+    file or chunked upload) can consume it directly and never hold the
+    whole article in memory.
+    """
     if not blocks or not isinstance(blocks, list):
-        return ''
+        return
 
-    html_parts = []
+    get_renderer = _BLOCK_RENDERERS.get
 
     for block in blocks:
         if not block or not isinstance(block, dict):
@@ -233,66 +307,36 @@ def render_blocks_to_html(blocks: list) -> str:
         if block_type == 'html' and not data:
             data = {'content': block.get('content', '')}
 
+        # Nothing to render - skip the call entirely
+        if not data and block_type not in _DATALESS_BLOCK_TYPES:
+            continue
+
         try:
-            rendered = render_block(block_type, data, blocks)
-            if rendered:
-                html_parts.append(rendered)
+            # Same dispatch as render_block, inlined to save a call per block
+            if block_type == 'tableOfContents':
+                rendered = render_table_of_contents(data, blocks)
+            else:
+                renderer = get_renderer(block_type)
+                if renderer is None:
+                    continue
+                rendered = renderer(data)
         except Exception as e:
             # Skip malformed blocks with warning, don't fail entire sync
             print(f"Warning: Failed to render block type '{block_type}': {e}")
             continue
 
-    return '\n\n'.join(html_parts)
+        if rendered:
+            yield rendered
 
 
 def render_block(block_type: str, data: dict, all_blocks: list = None) -> str:
     """Render a single content block to HTML."""
-
-    if block_type == 'paragraph':
-        return render_paragraph(data)
-    elif block_type == 'heading':
-        return render_heading(data)
-    elif block_type == 'quote':
-        return render_quote(data)
-    elif block_type == 'list':
-        return render_list(data)
-    elif block_type == 'checklist':
-        return render_checklist(data)
-    elif block_type == 'proscons':
-        return render_proscons(data)
-    elif block_type == 'image':
-        return render_image(data)
-    elif block_type == 'gallery':
-        return render_gallery(data)
-    elif block_type == 'video':
-        return render_video(data)
-    elif block_type == 'embed':
-        return render_embed(data)
-    elif block_type == 'table':
-        return render_table(data)
-    elif block_type == 'stats':
-        return render_stats(data)
-    elif block_type == 'accordion':
-        return render_accordion(data)
-    elif block_type == 'button':
-        return render_button(data)
-    elif block_type == 'tableOfContents':
+    # Table of contents is the only renderer that needs the other blocks
+    if block_type == 'tableOfContents':
         return render_table_of_contents(data, all_blocks)
-    elif block_type == 'code':
-        return render_code(data)
-    elif block_type == 'callout':
-        return render_callout(data)
-    elif block_type == 'divider':
-        return render_divider(data)
-    elif block_type == 'widget':
-        return render_widget(data)
-    elif block_type == 'html':
-        # Raw HTML block - used by imports from Shopify
-        # Content may be in data['html'] or data['content'] depending on source
-        html_content = data.get('html') or data.get('content', '')
-        return html_content if html_content else ''
-    else:
-        return ''
+
+    renderer = _BLOCK_RENDERERS.get(block_type)
+    return renderer(data) if renderer else ''
 
 
 # =============================================================================
@@ -354,18 +398,33 @@ def render_list(data: dict) -> str:
     if not items:
         return ''
 
+    # One buffer for the whole list, joined once
     if style == 'ordered':
-        items_html = '\n'.join([
-            f'    <li class="list__item list__item--ordered"><span class="list__number">{i+1}</span><span class="list__content">{item}</span></li>'
-            for i, item in enumerate(items) if item
-        ])
-        return f'<ol class="list list--ordered">\n{items_html}\n</ol>'
+        parts = ['<ol class="list list--ordered">']
+        append = parts.append
+        for i, item in enumerate(items):
+            if item:
+                append(f'    <li class="list__item list__item--ordered"><span class="list__number">{i+1}</span><span class="list__content">{item}</span></li>')
+        append('</ol>')
     else:
-        items_html = '\n'.join([
-            f'    <li class="list__item list__item--unordered"><span class="list__bullet"></span><span class="list__content">{item}</span></li>'
-            for item in items if item
-        ])
-        return f'<ul class="list list--unordered">\n{items_html}\n</ul>'
+        parts = ['<ul class="list list--unordered">']
+        append = parts.append
+        for item in items:
+            if item:
+                append(f'    <li class="list__item list__item--unordered"><span class="list__bullet"></span><span class="list__content">{item}</span></li>')
+        append('</ul>')
+    return '\n'.join(parts)
+
+
+# Fixed markup up to the item text, one variant per checkbox state
+_CHECKLIST_ITEM_CHECKED = (
+    '    <li class="checklist__item checklist__item--checked">'
+    '<span class="checklist__check">&#10003;</span><span class="checklist__text">'
+)
+_CHECKLIST_ITEM_UNCHECKED = (
+    '    <li class="checklist__item">'
+    '<span class="checklist__check checklist__check--empty"></span><span class="checklist__text">'
+)
 
 
 def render_checklist(data: dict) -> str:
@@ -379,14 +438,12 @@ def render_checklist(data: dict) -> str:
     title_html = f'<h4 class="checklist__title">{escape_html(title)}</h4>\n' if title else ''
 
     items_html = []
-    for item in items:
-        if not isinstance(item, dict):
-            continue
+    append = items_html.append
+    # Drop malformed entries once up front so the loop body has no type branch
+    for item in [i for i in items if isinstance(i, dict)]:
         text = item.get('text', '')
-        checked = item.get('checked', False)
-        checked_class = ' checklist__item--checked' if checked else ''
-        check_icon = '<span class="checklist__check">&#10003;</span>' if checked else '<span class="checklist__check checklist__check--empty"></span>'
-        items_html.append(f'    <li class="checklist__item{checked_class}">{check_icon}<span class="checklist__text">{escape_html(text)}</span></li>')
+        item_open = _CHECKLIST_ITEM_CHECKED if item.get('checked', False) else _CHECKLIST_ITEM_UNCHECKED
+        append(f'{item_open}{escape_html(text)}</span></li>')
 
     return f'''<div class="checklist">
   {title_html}<ul class="checklist__list">
@@ -453,9 +510,8 @@ def render_gallery(data: dict) -> str:
         return ''
 
     images_html = []
-    for img in images:
-        if not isinstance(img, dict):
-            continue
+    append = images_html.append
+    for img in [i for i in images if isinstance(i, dict)]:
         src = img.get('src', '')
         alt = img.get('alt', '')
         caption = img.get('caption', '')
@@ -464,7 +520,7 @@ def render_gallery(data: dict) -> str:
             continue
 
         caption_html = f'\n      <figcaption class="gallery__caption">{escape_html(caption)}</figcaption>' if caption else ''
-        images_html.append(f'''    <figure class="gallery__item">
+        append(f'''    <figure class="gallery__item">
       <img src="{escape_html(src)}" alt="{escape_html(alt)}" class="gallery__img" loading="lazy" />{caption_html}
     </figure>''')
 
@@ -473,6 +529,11 @@ def render_gallery(data: dict) -> str:
 </div>'''
 
 
+# Video URL patterns, compiled once at import time
+_YOUTUBE_ID_RE = re.compile(r'(?:youtube\.com\/(?:watch\?v=|embed\/)|youtu\.be\/)([a-zA-Z0-9_-]{11})')
+_VIMEO_ID_RE = re.compile(r'vimeo\.com\/(\d+)')
+
+
 def render_video(data: dict) -> str:
     """Render video block - YouTube/Vimeo embed."""
     url = data.get('url', '')
@@ -486,13 +547,13 @@ def render_video(data: dict) -> str:
     embed_url = None
 
     # YouTube patterns
-    youtube_match = re.search(r'(?:youtube\.com\/(?:watch\?v=|embed\/)|youtu\.be\/)([a-zA-Z0-9_-]{11})', url)
+    youtube_match = _YOUTUBE_ID_RE.search(url)
     if youtube_match:
         embed_url = f'https://www.youtube.com/embed/{youtube_match.group(1)}'
 
     # Vimeo patterns
     if not embed_url:
-        vimeo_match = re.search(r'vimeo\.com\/(\d+)', url)
+        vimeo_match = _VIMEO_ID_RE.search(url)
         if vimeo_match:
             embed_url = f'https://player.vimeo.com/video/{vimeo_match.group(1)}'
 
@@ -509,6 +570,16 @@ def render_video(data: dict) -> str:
 </figure>'''
 
 
+# Display names for embed link cards
+_EMBED_PLATFORM_NAMES = {
+    'twitter': 'X',
+    'instagram': 'Instagram',
+    'tiktok': 'TikTok',
+    'facebook': 'Facebook',
+    'other': 'Link',
+}
+
+
 def render_embed(data: dict) -> str:
     """Render embed block - social media embeds."""
     platform = data.get('platform', 'other')
@@ -523,14 +594,7 @@ def render_embed(data: dict) -> str:
         return ''
 
     # Otherwise render as a link card
-    platform_icons = {
-        'twitter': 'X',
-        'instagram': 'Instagram',
-        'tiktok': 'TikTok',
-        'facebook': 'Facebook',
-        'other': 'Link',
-    }
-    platform_name = platform_icons.get(platform, 'Link')
+    platform_name = _EMBED_PLATFORM_NAMES.get(platform, 'Link')
 
     return f'''<div class="embed embed--{platform}">
   <a href="{escape_html(url)}" target="_blank" rel="noopener noreferrer" class="embed__link">
@@ -540,6 +604,10 @@ def render_embed(data: dict) -> str:
 </div>'''
 
 
+# Alternating body row classes, indexed by row parity
+_TABLE_ROW_CLASSES = ('table__row--even', 'table__row--odd')
+
+
 def render_table(data: dict) -> str:
     """Render table block - data table with optional styling."""
     caption = data.get('caption', '')
@@ -562,13 +630,14 @@ def render_table(data: dict) -> str:
     header_cells = ''.join([f'<th class="table__header-cell">{cell}</th>' for cell in headers])
     header_html = f'  <thead class="table__head"><tr class="table__row table__row--header">{header_cells}</tr></thead>\n' if headers else ''
 
-    body_rows = []
-    for i, row in enumerate(rows):
-        if not isinstance(row, list):
-            continue
-        cells = ''.join([f'<td class="table__cell">{cell}</td>' for cell in row])
-        row_class = 'table__row--even' if i % 2 == 0 else 'table__row--odd'
-        body_rows.append(f'    <tr class="table__row {row_class}">{cells}</tr>')
+    # Cells may carry inline HTML (links, emphasis), so they pass through as-is
+    body_rows = [
+        f'    <tr class="table__row {_TABLE_ROW_CLASSES[i & 1]}">'
+        + ''.join([f'<td class="table__cell">{cell}</td>' for cell in row])
+        + '</tr>'
+        for i, row in enumerate(rows)
+        if isinstance(row, list)
+    ]
 
     body_html = f'  <tbody class="table__body">\n{chr(10).join(body_rows)}\n  </tbody>' if body_rows else ''
 
@@ -589,9 +658,8 @@ def render_stats(data: dict) -> str:
     title_html = f'<h4 class="stats__title">{escape_html(title)}</h4>\n' if title else ''
 
     stat_items = []
-    for stat in stats:
-        if not isinstance(stat, dict):
-            continue
+    append = stat_items.append
+    for stat in [s for s in stats if isinstance(s, dict)]:
         value = stat.get('value', '')
         label = stat.get('label', '')
         description = stat.get('description', '')
@@ -600,7 +668,7 @@ def render_stats(data: dict) -> str:
         icon_html = f'<span class="stat__icon">{icon}</span>' if icon else ''
         desc_html = f'<span class="stat__description">{escape_html(description)}</span>' if description else ''
 
-        stat_items.append(f'''    <div class="stat">
+        append(f'''    <div class="stat">
       {icon_html}<span class="stat__value">{escape_html(value)}</span>
       <span class="stat__label">{escape_html(label)}</span>
       {desc_html}
@@ -625,15 +693,15 @@ def render_accordion(data: dict) -> str:
     title_html = f'<h4 class="accordion__title">{escape_html(title)}</h4>\n' if title else ''
 
     accordion_items = []
-    for i, item in enumerate(items):
-        if not isinstance(item, dict):
-            continue
+    append = accordion_items.append
+    # Filter after enumerate so defaultOpen still indexes the original list
+    for i, item in [(i, item) for i, item in enumerate(items) if isinstance(item, dict)]:
         question = item.get('question', '')
         answer = item.get('answer', '')
 
         open_attr = ' open' if i == default_open else ''
 
-        accordion_items.append(f'''    <details class="accordion__item"{open_attr}>
+        append(f'''    <details class="accordion__item"{open_attr}>
       <summary class="accordion__question">{escape_html(question)}</summary>
       <div class="accordion__answer">{answer}</div>
     </details>''')
@@ -680,9 +748,11 @@ def render_table_of_contents(data: dict, all_blocks: list = None) -> str:
             if block.get('type') == 'heading':
                 block_data = block.get('data', {})
                 text = block_data.get('text', '')
-                # Strip HTML tags from text for display
-                clean_text = re.sub(r'<[^>]*>', '', text)
-                anchor = block_data.get('anchor', generate_anchor_id(text))
+                # Strip HTML tags from text for display. Heading text is stored as
+                # HTML, so decode its entities (&amp; -> &) here; escape_html below
+                # re-escapes the plain text, including any `<` that survived stripping
+                clean_text = html.unescape(_HTML_TAG_RE.sub('', text))
+                anchor = block_data['anchor'] if 'anchor' in block_data else generate_anchor_id(text)
                 level = block_data.get('level', 2)
                 items.append({'text': clean_text, 'anchor': anchor, 'level': level})
 
@@ -690,15 +760,14 @@ def render_table_of_contents(data: dict, all_blocks: list = None) -> str:
         return ''
 
     toc_items = []
-    for item in items:
-        if not isinstance(item, dict):
-            continue
+    append = toc_items.append
+    for item in [i for i in items if isinstance(i, dict)]:
         text = item.get('text', '')
         anchor = item.get('anchor', '')
         level = item.get('level', 2)
 
         indent_class = f'toc__item--level-{level}'
-        toc_items.append(f'    <li class="toc__item {indent_class}"><a href="#{escape_html(anchor)}" class="toc__link">{escape_html(text)}</a></li>')
+        append(f'    <li class="toc__item {indent_class}"><a href="#{escape_html(anchor)}" class="toc__link">{escape_html(text)}</a></li>')
 
     return f'''<nav class="toc">
   <h4 class="toc__title">{escape_html(title)}</h4>
@@ -708,6 +777,12 @@ def render_table_of_contents(data: dict, all_blocks: list = None) -> str:
 </nav>'''
 
 
+# Fixed markup around each numbered code line
+_CODE_LINE_OPEN = '<span class="code-block__line"><span class="code-block__line-number">'
+_CODE_LINE_MID = '</span><span class="code-block__line-content">'
+_CODE_LINE_CLOSE = '</span></span>'
+
+
 def render_code(data: dict) -> str:
     """Render code block - code snippet with optional line numbers."""
     language = data.get('language', '')
@@ -726,11 +801,10 @@ def render_code(data: dict) -> str:
     escaped_code = escape_html(code)
 
     if show_line_numbers:
-        lines = escaped_code.split('\n')
-        numbered_lines = []
-        for i, line in enumerate(lines, 1):
-            numbered_lines.append(f'<span class="code-block__line"><span class="code-block__line-number">{i}</span><span class="code-block__line-content">{line}</span></span>')
-        code_content = '\n'.join(numbered_lines)
+        code_content = '\n'.join([
+            f'{_CODE_LINE_OPEN}{i}{_CODE_LINE_MID}{line}{_CODE_LINE_CLOSE}'
+            for i, line in enumerate(escaped_code.split('\n'), 1)
+        ])
         line_numbers_class = ' code-block--line-numbers'
     else:
         code_content = escaped_code
@@ -745,6 +819,17 @@ def render_code(data: dict) -> str:
 </div>'''
 
 
+# Default titles and icons for each callout style
+_CALLOUT_DEFAULTS = {
+    'tip': {'title': 'Pro Tip', 'icon': '&#128161;'},  # lightbulb
+    'info': {'title': 'Info', 'icon': '&#8505;'},  # info
+    'warning': {'title': 'Warning', 'icon': '&#9888;'},  # warning
+    'success': {'title': 'Success', 'icon': '&#10003;'},  # checkmark
+    'error': {'title': 'Error', 'icon': '&#10005;'},  # x
+    'note': {'title': 'Note', 'icon': '&#128221;'},  # memo
+}
+
+
 def render_callout(data: dict) -> str:
     """Render callout block - tip/info/warning/success/error/note boxes."""
     style = data.get('style', 'info')
@@ -754,17 +839,7 @@ def render_callout(data: dict) -> str:
     if not text:
         return ''
 
-    # Default titles and icons for each style
-    defaults = {
-        'tip': {'title': 'Pro Tip', 'icon': '&#128161;'},  # lightbulb
-        'info': {'title': 'Info', 'icon': '&#8505;'},  # info
-        'warning': {'title': 'Warning', 'icon': '&#9888;'},  # warning
-        'success': {'title': 'Success', 'icon': '&#10003;'},  # checkmark
-        'error': {'title': 'Error', 'icon': '&#10005;'},  # x
-        'note': {'title': 'Note', 'icon': '&#128221;'},  # memo
-    }
-
-    default_config = defaults.get(style, defaults['info'])
+    default_config = _CALLOUT_DEFAULTS.get(style, _CALLOUT_DEFAULTS['info'])
     display_title = title if title else default_config['title']
     icon = default_config['icon']
 
@@ -793,10 +868,50 @@ def render_widget(data: dict) -> str:
     return f'<!-- Widget: {escape_html(widget_type)} -->'
 
 
+def render_html(data: dict) -> str:
+    """Render raw HTML block - used by imports from Shopify, passed through as-is."""
+    # Content may be in data['html'] or data['content'] depending on source
+    html_content = data.get('html') or data.get('content', '')
+    return html_content if html_content else ''
+
+
+# Block type -> renderer, used by render_block for O(1) dispatch.
+# tableOfContents is handled separately since it also needs all_blocks.
+_BLOCK_RENDERERS = {
+    'paragraph': render_paragraph,
+    'heading': render_heading,
+    'quote': render_quote,
+    'list': render_list,
+    'checklist': render_checklist,
+    'proscons': render_proscons,
+    'image': render_image,
+    'gallery': render_gallery,
+    'video': render_video,
+    'embed': render_embed,
+    'table': render_table,
+    'stats': render_stats,
+    'accordion': render_accordion,
+    'button': render_button,
+    'code': render_code,
+    'callout': render_callout,
+    'divider': render_divider,
+    'widget': render_widget,
+    'html': render_html,
+}
+
+
 # =============================================================================
 # SEO METAFIELDS BUILDER
 # =============================================================================
 
+# SEO fields copied to metafields, in order: (seo key, joins a list value)
+_SEO_METAFIELD_KEYS = (
+    ('title', False),
+    ('description', False),
+    ('keywords', True),
+)
+
+
 def build_seo_metafields(seo_data: dict) -> list:
     """
     Build Shopify metafields array from Supabase SEO data.
@@ -812,37 +927,43 @@ def build_seo_metafields(seo_data: dict) -> list:
 
     metafields = []
 
-    # SEO Title
-    if seo_data.get('title'):
+    for key, joins_list in _SEO_METAFIELD_KEYS:
+        value = seo_data.get(key)
+        if not value:
+            continue
+        # Keywords may be stored as a list
+        if joins_list and isinstance(value, list):
+            value = ", ".join(value)
         metafields.append({
             "namespace": "seo",
-            "key": "title",
-            "value": str(seo_data['title']),
+            "key": key,
+            "value": str(value),
             "type": "single_line_text_field"
         })
 
-    # SEO Description
-    if seo_data.get('description'):
-        metafields.append({
-            "namespace": "seo",
-            "key": "description",
-            "value": str(seo_data['description']),
-            "type": "single_line_text_field"
-        })
+    return metafields
 
-    # SEO Keywords
-    if seo_data.get('keywords'):
-        keywords = seo_data['keywords']
-        if isinstance(keywords, list):
-            keywords = ", ".join(keywords)
-        metafields.append({
-            "namespace": "seo",
-            "key": "keywords",
-            "value": str(keywords),
-            "type": "single_line_text_field"
-        })
 
-    return metafields
+def _metafields_input(owner_id: str, metafields: list) -> list:
+    """Build MetafieldsSetInput entries for one owner resource."""
+    return [
+        {
+            "ownerId": owner_id,
+            "namespace": mf["namespace"],
+            "key": mf["key"],
+            "value": mf["value"],
+            "type": mf["type"],
+        }
+        for mf in metafields
+    ]
+
+
+def _metafields_set_error(result: dict) -> Optional[str]:
+    """Joined userErrors of a metafieldsSet payload, or None if it succeeded."""
+    user_errors = result.get("metafieldsSet", {}).get("userErrors", [])
+    if user_errors:
+        return "; ".join([e.get("message", str(e)) for e in user_errors])
+    return None
 
 
 async def set_resource_metafields(owner_id: str, metafields: list) -> dict:
@@ -861,17 +982,6 @@ async def set_resource_metafields(owner_id: str, metafields: list) -> dict:
     if not metafields:
         return {"success": True}
 
-    # Add ownerId to each metafield
-    metafields_input = []
-    for mf in metafields:
-        metafields_input.append({
-            "ownerId": owner_id,
-            "namespace": mf["namespace"],
-            "key": mf["key"],
-            "value": mf["value"],
-            "type": mf["type"],
-        })
-
     query = """
     mutation SetMetafields($metafields: [MetafieldsSetInput!]!) {
         metafieldsSet(metafields: $metafields) {
@@ -889,20 +999,17 @@ async def set_resource_metafields(owner_id: str, metafields: list) -> dict:
     }
     """
 
-    variables = {"metafields": metafields_input}
+    variables = {"metafields": _metafields_input(owner_id, metafields)}
     result = await execute_shopify_graphql(query, variables)
 
     if "error" in result:
         return {"success": False, "error": result["error"]}
 
-    set_result = result.get("metafieldsSet", {})
-    user_errors = set_result.get("userErrors", [])
-
-    if user_errors:
-        error_msg = "; ".join([e.get("message", str(e)) for e in user_errors])
+    error_msg = _metafields_set_error(result)
+    if error_msg:
         return {"success": False, "error": error_msg}
 
-    return {"success": True, "metafields": set_result.get("metafields", [])}
+    return {"success": True, "metafields": result.get("metafieldsSet", {}).get("metafields", [])}
 
 
 # =============================================================================
@@ -914,6 +1021,9 @@ def get_shopify_graphql_url() -> str:
     return f"https://{SHOPIFY_STORE}.myshopify.com/admin/api/{SHOPIFY_API_VERSION}/graphql.json"
 
 
+_shopify_headers: Optional[dict] = None
+
+
 async def get_shopify_headers() -> Optional[dict]:
     """
     Get headers for Shopify API calls with a valid access token.
@@ -921,20 +1031,118 @@ async def get_shopify_headers() -> Optional[dict]:
     Returns:
         Headers dict with access token, or None if token unavailable
     """
+    global _shopify_headers
+
     access_token = await _token_manager.get_access_token()
     if not access_token:
         return None
 
-    return {
-        "Content-Type": "application/json",
-        "X-Shopify-Access-Token": access_token,
-    }
+    # Reuse the same dict until the token is refreshed - callers only read it
+    if _shopify_headers is None or _shopify_headers["X-Shopify-Access-Token"] != access_token:
+        _shopify_headers = {
+            "Content-Type": "application/json",
+            "X-Shopify-Access-Token": access_token,
+        }
+
+    return _shopify_headers
+
+
+# Attempts per GraphQL call when Shopify throttles the query or the connection drops
+GRAPHQL_MAX_ATTEMPTS = 8
+GRAPHQL_NETWORK_RETRY_DELAY = 0.2
+
+# Operations that write - only retried when Shopify is known not to have run them
+_MUTATION_RE = re.compile(r"\s*mutation\b")
+
+# Cost points a request reserves from the bucket before it is sent
+GRAPHQL_RESERVE_COST = 50
+
+# Shopify's query cost bucket as last reported. Shared by every concurrent
+# caller so they pace themselves instead of each discovering THROTTLED
+_throttle_available: Optional[float] = None
+_throttle_maximum = 0.0
+_throttle_restore_rate = 0.0
+_throttle_updated_at = 0.0
+
+
+def _record_throttle_status(result: dict) -> None:
+    """Remember the bucket state from a response's extensions.cost.throttleStatus."""
+    global _throttle_available, _throttle_maximum, _throttle_restore_rate, _throttle_updated_at
+
+    status = ((result.get("extensions") or {}).get("cost") or {}).get("throttleStatus")
+    if not status:
+        return
+    try:
+        available = float(status["currentlyAvailable"])
+        maximum = float(status["maximumAvailable"])
+        restore_rate = float(status["restoreRate"])
+    except (KeyError, TypeError, ValueError):
+        return
+
+    _throttle_available = available
+    _throttle_maximum = maximum
+    _throttle_restore_rate = restore_rate
+    _throttle_updated_at = time.monotonic()
+
+
+async def _wait_for_throttle_budget() -> None:
+    """Reserve GRAPHQL_RESERVE_COST points, sleeping until the bucket has refilled enough."""
+    global _throttle_available, _throttle_updated_at
+
+    if _throttle_available is None or _throttle_restore_rate <= 0:
+        return  # No cost report yet - nothing to pace against
+
+    now = time.monotonic()
+    available = min(
+        _throttle_maximum,
+        _throttle_available + (now - _throttle_updated_at) * _throttle_restore_rate,
+    )
+    # Reserve before sleeping so callers arriving meanwhile queue up behind this one
+    _throttle_available = available - GRAPHQL_RESERVE_COST
+    _throttle_updated_at = now
+
+    if _throttle_available < 0:
+        await asyncio.sleep(min(-_throttle_available / _throttle_restore_rate, MAX_RETRY_DELAY))
+
+
+def _is_throttled(result: dict) -> bool:
+    """Whether a GraphQL response was rejected by Shopify's query cost limiter."""
+    return any(
+        isinstance(e, dict) and (e.get("extensions") or {}).get("code") == "THROTTLED"
+        for e in result.get("errors") or []
+    )
+
+
+def _throttle_delay(result: dict, attempt: int) -> float:
+    """
+    Seconds until the cost bucket has refilled enough to rerun the query.
+
+    Uses extensions.cost.throttleStatus when Shopify reports it, otherwise
+    falls back to 2^attempt backoff. Jitter keeps concurrent callers that
+    were throttled together from retrying in lockstep.
+    """
+    cost = (result.get("extensions") or {}).get("cost") or {}
+    status = cost.get("throttleStatus") or {}
+    try:
+        missing = cost["requestedQueryCost"] - status["currentlyAvailable"]
+        delay = missing / status["restoreRate"]
+    except (KeyError, TypeError, ZeroDivisionError):
+        delay = 2 ** attempt
+    delay += random.uniform(0, 0.25) * 2 ** attempt
+    return min(max(delay, 0.5), MAX_RETRY_DELAY)
 
 
 async def execute_shopify_graphql(query: str, variables: dict = None) -> dict:
     """
     Execute a GraphQL query against Shopify Admin API.
 
+    Requests are paced against the cost bucket Shopify last reported.
+    THROTTLED and 429 responses, and connections that could not be opened,
+    are retried (up to GRAPHQL_MAX_ATTEMPTS) before an error dict is
+    returned - Shopify did not run the operation in those cases. Dropped
+    connections, 5xx responses and unreadable bodies are retried for
+    queries only: a mutation may already have been applied.
+
     Args:
         query: GraphQL query string
         variables: Query variables dict
@@ -953,27 +1161,55 @@ async def execute_shopify_graphql(query: str, variables: dict = None) -> dict:
     if variables:
         payload["variables"] = variables
 
-    try:
-        async with aiohttp.ClientSession() as session:
+    is_mutation = _MUTATION_RE.match(query) is not None
+    retry_statuses = (429,) if is_mutation else RETRY_STATUSES
+
+    for attempt in range(GRAPHQL_MAX_ATTEMPTS):
+        last_attempt = attempt == GRAPHQL_MAX_ATTEMPTS - 1
+        await _wait_for_throttle_budget()
+        try:
+            # Shared pooled session - keeps the TLS connection to the store alive between queries.
+            # Sent once per attempt; this loop is the only retry loop.
+            session = await get_http_session()
             async with session.post(
                 get_shopify_graphql_url(),
                 headers=headers,
-                json=payload,
+                data=json_dumps(payload),
                 timeout=aiohttp.ClientTimeout(total=30)
             ) as resp:
-                result = await resp.json()
+                if resp.status in retry_statuses and not last_attempt:
+                    await asyncio.sleep(GRAPHQL_NETWORK_RETRY_DELAY * 2 ** attempt)
+                    continue
+                if resp.status >= 500:
+                    return {"error": f"HTTP {resp.status} from Shopify"}
+                result = json_loads(await resp.read())
+
+        # Connection never opened, so the request was never sent
+        except aiohttp.ClientConnectorError as e:
+            if last_attempt:
+                return {"error": f"Network error: {str(e)}"}
+            await asyncio.sleep(GRAPHQL_NETWORK_RETRY_DELAY * 2 ** attempt)
+            continue
+        # ValueError: a body that is not JSON, e.g. a gateway error page
+        except (aiohttp.ClientError, ValueError) as e:
+            if is_mutation or last_attempt:
+                return {"error": f"Network error: {str(e)}"}
+            await asyncio.sleep(GRAPHQL_NETWORK_RETRY_DELAY * 2 ** attempt)
+            continue
+        except Exception as e:
+            return {"error": f"Unexpected error: {str(e)}"}
 
-                # Check for top-level errors
-                if "errors" in result:
-                    error_messages = [e.get("message", str(e)) for e in result["errors"]]
-                    return {"error": "; ".join(error_messages)}
+        _record_throttle_status(result)
 
-                return result.get("data", {})
+        # Check for top-level errors
+        if "errors" in result:
+            if _is_throttled(result) and not last_attempt:
+                await asyncio.sleep(_throttle_delay(result, attempt))
+                continue
+            error_messages = [e.get("message", str(e)) for e in result["errors"]]
+            return {"error": "; ".join(error_messages)}
 
-    except aiohttp.ClientError as e:
-        return {"error": f"Network error: {str(e)}"}
-    except Exception as e:
-        return {"error": f"Unexpected error: {str(e)}"}
+        return result.get("data", {})
 
 
 # =============================================================================
@@ -981,8 +1217,79 @@ async def execute_shopify_graphql(query: str, variables: dict = None) -> dict:
 # =============================================================================
 
 # In-memory cache to prevent race conditions during a single sync session
-_blog_cache: dict[str, str] = {}  # handle -> gid
-_article_cache: dict[str, str] = {}  # (blog_gid, handle) -> article_gid
+# A None value records a handle confirmed missing by a prewarm_* lookup
+_blog_cache: dict[str, Optional[str]] = {}  # handle -> gid
+_article_cache: dict[tuple[str, str], Optional[str]] = {}  # (blog_gid, handle) -> article_gid
+_article_length_cache: dict[str, int] = {}  # article_gid -> stripped body length
+
+# Max handles OR-joined into one Shopify search query by the prewarm_* helpers
+HANDLE_LOOKUP_BATCH_SIZE = 50
+
+
+# Paginated fetch queries - one fixed document per query, the page size
+# and cursor are passed as variables
+_FETCH_BLOGS_QUERY = """
+query FetchBlogs($first: Int!, $after: String) {
+    blogs(first: $first, after: $after) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        nodes {
+            id
+            title
+            handle
+        }
+    }
+}
+"""
+
+_FETCH_BLOG_ARTICLES_QUERY = """
+query FetchArticles($blogId: ID!, $first: Int!, $after: String) {
+    blog(id: $blogId) {
+        articles(first: $first, after: $after) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                id
+                title
+                handle
+                body
+                summary
+                publishedAt
+                tags
+                blog {
+                    id
+                    handle
+                    title
+                }
+                image {
+                    url
+                    altText
+                }
+            }
+        }
+    }
+}
+"""
+
+_FETCH_BLOG_ARTICLE_TAGS_QUERY = """
+query FetchArticleTags($blogId: ID!, $first: Int!, $after: String) {
+    blog(id: $blogId) {
+        articles(first: $first, after: $after) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                tags
+            }
+        }
+    }
+}
+"""
 
 
 async def fetch_all_shopify_blogs() -> list:
@@ -1000,26 +1307,9 @@ async def fetch_all_shopify_blogs() -> list:
     page_size = 100
 
     while True:
-        # Build query with optional cursor
-        after_clause = f', after: "{cursor}"' if cursor else ""
-
-        query = f"""
-        query FetchBlogs {{
-            blogs(first: {page_size}{after_clause}) {{
-                pageInfo {{
-                    hasNextPage
-                    endCursor
-                }}
-                nodes {{
-                    id
-                    title
-                    handle
-                }}
-            }}
-        }}
-        """
-
-        result = await execute_shopify_graphql(query)
+        result = await execute_shopify_graphql(
+            _FETCH_BLOGS_QUERY, {"first": page_size, "after": cursor}
+        )
 
         if "error" in result:
             if not all_blogs:  # Only show error if no blogs fetched yet
@@ -1046,6 +1336,10 @@ async def fetch_all_shopify_blogs() -> list:
     return all_blogs
 
 
+# Max blogs paged concurrently by fetch_all_shopify_articles (Shopify rate limits)
+SHOPIFY_BLOG_FETCH_CONCURRENCY = 8
+
+
 async def fetch_all_shopify_articles() -> list:
     """
     Fetch all articles from all blogs in Shopify.
@@ -1054,66 +1348,96 @@ async def fetch_all_shopify_articles() -> list:
     id (gid), title, handle, contentHtml, excerpt, publishedAt,
     blog (gid, handle), image, tags, author
 
-    Uses cursor-based pagination for each blog.
+    Uses cursor-based pagination for each blog. Blogs are paged
+    concurrently (up to SHOPIFY_BLOG_FETCH_CONCURRENCY at a time);
+    articles are returned in blog order.
 
     Returns:
         List of Shopify article dicts, or empty list on error
     """
-    # First, fetch all blogs
     blogs = await fetch_all_shopify_blogs()
     if not blogs:
         return []
 
+    semaphore = asyncio.Semaphore(SHOPIFY_BLOG_FETCH_CONCURRENCY)
+    results = await asyncio.gather(
+        *[_fetch_blog_articles(blog, semaphore) for blog in blogs],
+        return_exceptions=True,
+    )
+
     all_articles = []
+    for blog, result in zip(blogs, results):
+        if isinstance(result, Exception):
+            print(f"  [WARN] Failed to fetch articles from blog '{blog.get('handle', 'unknown')}': {result}")
+            continue
+        all_articles.extend(result)
+
+    return all_articles
+
+
+async def _fetch_blog_articles(blog: dict, semaphore: asyncio.Semaphore) -> list:
+    """Collect every article of one blog (used by fetch_all_shopify_articles)."""
+    async with semaphore:
+        articles = []
+        async for page in _iter_blog_article_pages(blog):
+            articles.extend(page)
+        return articles
+
+
+async def iter_shopify_article_pages() -> AsyncIterator[list]:
+    """
+    Yield every Shopify article, one page of article dicts at a time.
+
+    Articles have the same fields as fetch_all_shopify_articles(). Pages
+    are fetched lazily, so callers can start processing the first page
+    while the store is still being paged and only hold one page at a time.
+
+    Yields:
+        List of Shopify article dicts (one GraphQL page, up to 50 articles)
+    """
+    blogs = await fetch_all_shopify_blogs()
+    if not blogs:
+        return
 
     for blog in blogs:
-        blog_gid = blog.get("id")
-        blog_handle = blog.get("handle", "unknown")
-
-        cursor = None
-        page_size = 50
-
-        while True:
-            after_clause = f', after: "{cursor}"' if cursor else ""
-
-            query = f"""
-            query FetchArticles {{
-                blog(id: "{blog_gid}") {{
-                    articles(first: {page_size}{after_clause}) {{
-                        pageInfo {{
-                            hasNextPage
-                            endCursor
-                        }}
-                        nodes {{
-                            id
-                            title
-                            handle
-                            body
-                            summary
-                            publishedAt
-                            tags
-                            blog {{
-                                id
-                                handle
-                                title
-                            }}
-                            image {{
-                                url
-                                altText
-                            }}
-                        }}
-                    }}
-                }}
-            }}
-            """
-
-            result = await execute_shopify_graphql(query)
+        async for page in _iter_blog_article_pages(blog):
+            yield page
+
+
+async def _iter_blog_article_pages(blog: dict) -> AsyncIterator[list]:
+    """Yield the articles of one blog, one GraphQL page at a time."""
+    async for nodes in _iter_blog_connection_pages(_FETCH_BLOG_ARTICLES_QUERY, blog, 50, "articles"):
+        yield nodes
+
+
+async def _iter_blog_connection_pages(
+    query: str, blog: dict, page_size: int, label: str
+) -> AsyncIterator[list]:
+    """
+    Page through a blog's articles connection, yielding each page's nodes.
+
+    The request for the next page is started before the current page is
+    yielded, so it is in flight while the caller processes this one.
+    """
+    blog_gid = blog.get("id")
+    blog_handle = blog.get("handle", "unknown")
+
+    def fetch_page(cursor: Optional[str]) -> asyncio.Task:
+        return asyncio.create_task(execute_shopify_graphql(
+            query, {"blogId": blog_gid, "first": page_size, "after": cursor}
+        ))
+
+    pending = fetch_page(None)
+    try:
+        while pending is not None:
+            result = await pending
+            pending = None
 
             if "error" in result:
-                print(f"  [WARN] Failed to fetch articles from blog '{blog_handle}': {result['error']}")
+                print(f"  [WARN] Failed to fetch {label} from blog '{blog_handle}': {result['error']}")
                 break
 
-            blog_data = result.get("blog", {})
+            blog_data = result.get("blog") or {}
             if not blog_data:
                 print(f"  [WARN] No data returned for blog '{blog_handle}' - may have been deleted")
                 break
@@ -1124,18 +1448,92 @@ async def fetch_all_shopify_articles() -> list:
             if not nodes:
                 break
 
-            all_articles.extend(nodes)
-
-            # Check pagination
+            # Check pagination and prefetch the next page before yielding
             page_info = articles_data.get("pageInfo", {})
-            if not page_info.get("hasNextPage"):
-                break
+            cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+            if cursor:
+                pending = fetch_page(cursor)
 
-            cursor = page_info.get("endCursor")
-            if not cursor:
-                break
+            yield nodes
+    finally:
+        # Caller stopped early - don't leave the prefetch running
+        if pending is not None:
+            pending.cancel()
 
-    return all_articles
+
+async def fetch_shopify_article_by_handle(handle: str) -> Optional[dict]:
+    """
+    Fetch a single article from Shopify by its handle (slug).
+
+    Uses the Admin API articles search instead of paging through every
+    blog, so a single-post import costs one request regardless of store size.
+    Returns the same fields as fetch_all_shopify_articles().
+
+    Args:
+        handle: The article handle to look up
+
+    Returns:
+        Shopify article dict, or None if not found or on error
+    """
+    query = """
+    query FetchArticleByHandle($query: String!) {
+        articles(first: 5, query: $query) {
+            nodes {
+                id
+                title
+                handle
+                body
+                summary
+                publishedAt
+                tags
+                blog {
+                    id
+                    handle
+                    title
+                }
+                image {
+                    url
+                    altText
+                }
+            }
+        }
+    }
+    """
+
+    result = await execute_shopify_graphql(query, {"query": f'handle:"{handle}"'})
+
+    if "error" in result:
+        print(f"  [WARN] Failed to search articles for '{handle}': {result['error']}")
+        return None
+
+    # Search matching can be loose - only accept an exact handle match
+    for node in result.get("articles", {}).get("nodes", []):
+        if node.get("handle") == handle:
+            return node
+
+    return None
+
+
+async def iter_shopify_article_tags() -> AsyncIterator[list]:
+    """
+    Yield the tag list of every article in Shopify, one article at a time.
+
+    A lighter alternative to fetch_all_shopify_articles() for callers that
+    only need tags: each page requests just the `tags` field and is
+    discarded once its tags have been yielded, so memory stays bounded
+    by page size rather than by store size.
+
+    Yields:
+        List of tag strings for each article
+    """
+    blogs = await fetch_all_shopify_blogs()
+
+    for blog in blogs:
+        async for nodes in _iter_blog_connection_pages(
+            _FETCH_BLOG_ARTICLE_TAGS_QUERY, blog, 250, "article tags"
+        ):
+            for node in nodes:
+                yield node.get("tags") or []
 
 
 async def find_blog_by_handle(handle: str) -> Optional[str]:
@@ -1190,7 +1588,7 @@ async def find_article_by_handle(blog_gid: str, handle: str) -> Optional[str]:
     Returns:
         Shopify article GID if found, None otherwise
     """
-    cache_key = f"{blog_gid}:{handle}"
+    cache_key = (blog_gid, handle)
     if cache_key in _article_cache:
         return _article_cache[cache_key]
 
@@ -1227,6 +1625,134 @@ async def find_article_by_handle(blog_gid: str, handle: str) -> Optional[str]:
     return None
 
 
+async def prewarm_blog_cache(handles: list[str]) -> None:
+    """
+    Resolve many blog handles up front so find_blog_by_handle needs no request.
+
+    Handles are OR-joined into one blogs search per HANDLE_LOOKUP_BATCH_SIZE.
+    Handles a successful search didn't return are cached as missing too.
+
+    Args:
+        handles: Blog handles/slugs about to be synced
+    """
+    pending = [h for h in dict.fromkeys(handles) if h and h not in _blog_cache]
+
+    query = """
+    query PrewarmBlogs($first: Int!, $query: String!) {
+        blogs(first: $first, query: $query) {
+            nodes {
+                id
+                handle
+            }
+        }
+    }
+    """
+
+    for i in range(0, len(pending), HANDLE_LOOKUP_BATCH_SIZE):
+        batch = pending[i:i + HANDLE_LOOKUP_BATCH_SIZE]
+        result = await execute_shopify_graphql(query, {
+            "first": len(batch),
+            "query": " OR ".join(f"handle:{handle}" for handle in batch),
+        })
+
+        if "error" in result:
+            continue  # Leave this batch to the per-handle lookup
+
+        found = {
+            node.get("handle"): node.get("id")
+            for node in result.get("blogs", {}).get("nodes", [])
+        }
+        for handle in batch:
+            _blog_cache[handle] = found.get(handle)
+
+
+async def prewarm_article_cache(blog_gid: str, handles: list[str]) -> None:
+    """
+    Resolve many article handles in one blog so find_article_by_handle needs no request.
+
+    Works like prewarm_blog_cache, one articles search per batch of handles.
+
+    Args:
+        blog_gid: Shopify blog GID the articles belong to
+        handles: Article handles/slugs about to be synced
+    """
+    pending = [
+        h for h in dict.fromkeys(handles)
+        if h and (blog_gid, h) not in _article_cache
+    ]
+
+    query = """
+    query PrewarmArticles($blogId: ID!, $first: Int!, $query: String!) {
+        blog(id: $blogId) {
+            articles(first: $first, query: $query) {
+                nodes {
+                    id
+                    handle
+                }
+            }
+        }
+    }
+    """
+
+    for i in range(0, len(pending), HANDLE_LOOKUP_BATCH_SIZE):
+        batch = pending[i:i + HANDLE_LOOKUP_BATCH_SIZE]
+        result = await execute_shopify_graphql(query, {
+            "blogId": blog_gid,
+            "first": len(batch),
+            "query": " OR ".join(f"handle:{handle}" for handle in batch),
+        })
+
+        if "error" in result or not result.get("blog"):
+            continue  # Leave this batch to the per-handle lookup
+
+        found = {
+            node.get("handle"): node.get("id")
+            for node in result["blog"].get("articles", {}).get("nodes", [])
+        }
+        for handle in batch:
+            _article_cache[(blog_gid, handle)] = found.get(handle)
+
+
+# Max article bodies fetched per nodes() query by prewarm_article_content_lengths
+# (bodies can be large, so this is kept below HANDLE_LOOKUP_BATCH_SIZE)
+ARTICLE_BODY_BATCH_SIZE = 25
+
+
+async def prewarm_article_content_lengths(article_gids: list[str]) -> None:
+    """
+    Fetch the body length of many articles with one nodes() query per batch.
+
+    Fills _article_length_cache so the overwrite safety check in
+    sync_post_to_shopify doesn't cost a request per article. Articles that
+    could not be loaded are left to fetch_article_content_length.
+
+    Args:
+        article_gids: Shopify article GIDs about to be updated
+    """
+    pending = list(dict.fromkeys(gid for gid in article_gids if gid))
+
+    query = """
+    query PrewarmArticleBodies($ids: [ID!]!) {
+        nodes(ids: $ids) {
+            ... on Article {
+                id
+                body
+            }
+        }
+    }
+    """
+
+    for i in range(0, len(pending), ARTICLE_BODY_BATCH_SIZE):
+        result = await execute_shopify_graphql(query, {"ids": pending[i:i + ARTICLE_BODY_BATCH_SIZE]})
+
+        if "error" in result:
+            continue  # Leave this batch to the per-article lookup
+
+        for node in result.get("nodes") or []:
+            if node and node.get("id"):
+                _article_length_cache[node["id"]] = len((node.get("body") or "").strip())
+
+
 async def fetch_article_content_length(article_gid: str) -> Optional[int]:
     """
     Fetch the body content length of an existing Shopify article.
@@ -1240,6 +1766,10 @@ async def fetch_article_content_length(article_gid: str) -> Optional[int]:
     Returns:
         Length of article body in characters, or None if fetch failed
     """
+    # Prewarmed lengths are used once - a later sync re-reads the live article
+    if article_gid in _article_length_cache:
+        return _article_length_cache.pop(article_gid)
+
     query = """
     query GetArticleBody($id: ID!) {
         article(id: $id) {
@@ -1263,15 +1793,111 @@ async def fetch_article_content_length(article_gid: str) -> Optional[int]:
 
 def clear_sync_cache():
     """Clear the in-memory sync cache. Call at start of sync operations."""
-    global _blog_cache, _article_cache
+    global _blog_cache, _article_cache, _article_length_cache
     _blog_cache = {}
     _article_cache = {}
+    _article_length_cache = {}
+    _escape_html_cached.cache_clear()
 
 
 # =============================================================================
 # CATEGORY TO SHOPIFY BLOG SYNC
 # =============================================================================
 
+def _is_stale_id_result(result: dict, mutation: str) -> bool:
+    """
+    Whether an update mutation failed because the target ID no longer exists.
+
+    Shopify reports this either as a top-level "not found" error or as a
+    NOT_FOUND userError on the mutation payload. INVALID is its generic
+    validation code, so it is not treated as a missing resource.
+    """
+    if "error" in result:
+        error_lower = result["error"].lower()
+        return "not found" in error_lower or "does not exist" in error_lower
+
+    user_errors = result.get(mutation, {}).get("userErrors")
+    if not user_errors:
+        # Successful update - the common case
+        return False
+    return any(e.get("code") == "NOT_FOUND" for e in user_errors)
+
+
+async def _upsert_shopify_resource(
+    kind: Literal["blog", "article"],
+    existing_id: Optional[str],
+    update_query: str,
+    update_variables: Callable[[str], dict],
+    create_query: str,
+    create_variables: dict,
+    cache: dict,
+    cache_key: Any,
+    find_existing: Callable[[], Awaitable[Optional[str]]],
+) -> dict:
+    """
+    Update a blog/article by ID, or create it if there is no usable ID.
+
+    The stored ID is trusted - the update itself reports if it went stale.
+    In that case the cached ID is dropped and the resource is looked up by
+    handle: a different ID is retried once, and it is created only if the
+    lookup finds nothing. If the lookup returns the same ID, the update's
+    own errors are reported instead of creating a duplicate.
+
+    Args:
+        kind: "blog" or "article" - names the mutations and returned node
+        existing_id: ID to update, or None to create
+        update_query: Update mutation document
+        update_variables: Builds the update variables for a given ID
+        create_query: Create mutation document
+        create_variables: Variables for the create mutation
+        cache: Handle -> ID cache to keep in step (_blog_cache/_article_cache)
+        cache_key: Key of this resource in `cache` (handle, or (blog GID, handle))
+        find_existing: Looks the resource up by handle
+
+    Returns:
+        dict with keys: success, node, result (raw response), created, error
+    """
+    if existing_id:
+        mutation = f"{kind}Update"
+        result = await execute_shopify_graphql(update_query, update_variables(existing_id))
+
+        if _is_stale_id_result(result, mutation):
+            # Resource may have been deleted or recreated - forget the cached
+            # ID and look it up by handle before deciding to create
+            cache.pop(cache_key, None)
+            found_id = await find_existing()
+            if not found_id:
+                # Resource truly doesn't exist, create it below
+                existing_id = None
+            elif found_id != existing_id:
+                # Retry update with correct ID
+                result = await execute_shopify_graphql(update_query, update_variables(found_id))
+            # Same ID still live - fall through and report the update's errors
+
+    created = not existing_id
+    if created:
+        mutation = f"{kind}Create"
+        result = await execute_shopify_graphql(create_query, create_variables)
+
+    if "error" in result:
+        return {"success": False, "error": result["error"]}
+
+    payload = result.get(mutation, {})
+    user_errors = payload.get("userErrors")
+    if user_errors:
+        error_msg = "; ".join([e.get("message", str(e)) for e in user_errors])
+        return {"success": False, "error": error_msg}
+
+    node = payload.get(kind)
+    if not node:
+        action = "create" if created else "update"
+        return {"success": False, "error": f"Shopify returned no {kind} for {action}"}
+
+    # Cache the result
+    cache[cache_key] = node.get("id")
+    return {"success": True, "node": node, "result": result, "created": created}
+
+
 async def sync_category_to_shopify(
     category_id: str,
     name: str,
@@ -1311,111 +1937,83 @@ async def sync_category_to_shopify(
     # Build SEO metafields (will be set after create/update)
     metafields = build_seo_metafields(seo)
 
-    if existing_blog_gid:
-        # Update existing blog
-        query = """
-        mutation UpdateBlog($id: ID!, $blog: BlogUpdateInput!) {
+    # When the GID is known up front, the SEO metafields ride along in the
+    # update request instead of a second one
+    if metafields:
+        update_query = """
+        mutation UpdateBlogWithMetafields($id: ID!, $blog: BlogUpdateInput!, $metafields: [MetafieldsSetInput!]!) {
             blogUpdate(id: $id, blog: $blog) {
                 blog { id title handle }
                 userErrors { code field message }
             }
+            metafieldsSet(metafields: $metafields) {
+                metafields { id }
+                userErrors { code field message }
+            }
         }
         """
-        variables = {
-            "id": existing_blog_gid,
-            "blog": blog_input,
-        }
-
-        result = await execute_shopify_graphql(query, variables)
-
-        if "error" in result:
-            # Check if this is a "not found" error - blog may have been deleted
-            error_lower = result["error"].lower()
-            if "not found" in error_lower or "does not exist" in error_lower:
-                # Fall back to checking by handle
-                existing_blog_gid = await find_blog_by_handle(slug)
-                if existing_blog_gid:
-                    # Retry update with correct ID
-                    variables["id"] = existing_blog_gid
-                    result = await execute_shopify_graphql(query, variables)
-                else:
-                    # Blog truly doesn't exist, create it
-                    existing_blog_gid = None
-            else:
-                return {"success": False, "error": result["error"]}
-
-        if existing_blog_gid:  # Still updating
-            update_result = result.get("blogUpdate", {})
-            user_errors = update_result.get("userErrors", [])
-
-            if user_errors:
-                # Check for "not found" type errors
-                error_codes = [e.get("code", "") for e in user_errors]
-                if any(code in ("INVALID", "NOT_FOUND") for code in error_codes):
-                    # Stale ID - check by handle and create if needed
-                    existing_blog_gid = await find_blog_by_handle(slug)
-                    if not existing_blog_gid:
-                        existing_blog_gid = None  # Will create below
-                else:
-                    error_msg = "; ".join([e.get("message", str(e)) for e in user_errors])
-                    return {"success": False, "error": error_msg}
-            else:
-                blog = update_result.get("blog", {})
-                if blog:
-                    blog_gid = blog.get("id")
-                    # Cache the result
-                    _blog_cache[slug] = blog_gid
-                    # Set metafields separately (not supported inline for blogs)
-                    if metafields:
-                        mf_result = await set_resource_metafields(blog_gid, metafields)
-                        if not mf_result.get("success"):
-                            print(f" [WARN] Metafields failed: {mf_result.get('error')}")
-                    return {
-                        "success": True,
-                        "shopify_blog_gid": blog_gid,
-                        "handle": blog.get("handle"),
-                    }
-
-    if not existing_blog_gid:
-        # Create new blog (only if it truly doesn't exist)
-        query = """
-        mutation CreateBlog($blog: BlogCreateInput!) {
-            blogCreate(blog: $blog) {
+    else:
+        update_query = """
+        mutation UpdateBlog($id: ID!, $blog: BlogUpdateInput!) {
+            blogUpdate(id: $id, blog: $blog) {
                 blog { id title handle }
                 userErrors { code field message }
             }
         }
         """
+
+    def update_variables(blog_gid: str) -> dict:
         variables = {
+            "id": blog_gid,
             "blog": blog_input,
         }
+        if metafields:
+            variables["metafields"] = _metafields_input(blog_gid, metafields)
+        return variables
+
+    # Create new blog (only if it truly doesn't exist)
+    create_query = """
+    mutation CreateBlog($blog: BlogCreateInput!) {
+        blogCreate(blog: $blog) {
+            blog { id title handle }
+            userErrors { code field message }
+        }
+    }
+    """
 
-        result = await execute_shopify_graphql(query, variables)
-
-        if "error" in result:
-            return {"success": False, "error": result["error"]}
-
-        create_result = result.get("blogCreate", {})
-        user_errors = create_result.get("userErrors", [])
-
-        if user_errors:
-            error_msg = "; ".join([e.get("message", str(e)) for e in user_errors])
-            return {"success": False, "error": error_msg}
+    upsert = await _upsert_shopify_resource(
+        "blog",
+        existing_blog_gid,
+        update_query,
+        update_variables,
+        create_query,
+        {"blog": blog_input},
+        _blog_cache,
+        slug,
+        lambda: find_blog_by_handle(slug),
+    )
+    if not upsert["success"]:
+        return {"success": False, "error": upsert["error"]}
+
+    blog = upsert["node"]
+    blog_gid = blog.get("id")
 
-        blog = create_result.get("blog", {})
-        blog_gid = blog.get("id")
-        # Cache the result
-        _blog_cache[slug] = blog_gid
-        # Set metafields separately (not supported inline for blogs)
-        if metafields:
+    if metafields:
+        if upsert["created"]:
+            # Set metafields separately (not supported inline for blogs)
             mf_result = await set_resource_metafields(blog_gid, metafields)
-            if not mf_result.get("success"):
-                print(f" [WARN] Metafields failed: {mf_result.get('error')}")
-        return {
-            "success": True,
-            "shopify_blog_gid": blog_gid,
-            "handle": blog.get("handle"),
-        }
+            mf_error = None if mf_result.get("success") else mf_result.get("error")
+        else:
+            # Metafields were set by the same mutation document
+            mf_error = _metafields_set_error(upsert["result"])
+        if mf_error:
+            print(f" [WARN] Metafields failed: {mf_error}")
+
+    return {
+        "success": True,
+        "shopify_blog_gid": blog_gid,
+        "handle": blog.get("handle"),
+    }
 
 
 # =============================================================================
@@ -1437,6 +2035,7 @@ async def sync_post_to_shopify(
     scheduled_at: Optional[str] = None,
     tags: Optional[list] = None,
     existing_shopify_id: Optional[str] = None,
+    body_html: Optional[str] = None,
 ) -> dict:
     """
     Sync a blog post to Shopify as an Article.
@@ -1461,12 +2060,16 @@ async def sync_post_to_shopify(
         scheduled_at: ISO 8601 datetime for scheduled posts
         tags: List of tag names
         existing_shopify_id: Existing Shopify article ID if updating
+        body_html: Already-rendered `content`, if the caller has it
 
     Returns:
         dict with keys: success, shopify_article_id, handle, error
     """
-    # Render content blocks to HTML
-    body_html = render_blocks_to_html(content)
+    # Render content blocks to HTML. This stays inline on the event loop: a
+    # typical post renders in well under a millisecond, less than it would
+    # cost to ship the blocks to a worker process and the HTML back
+    if body_html is None:
+        body_html = render_blocks_to_html(content)
 
     # DEBUG: Log content rendering for troubleshooting
     print(f"    [DEBUG] Content blocks: {len(content) if content else 0} blocks")
@@ -1558,100 +2161,42 @@ async def sync_post_to_shopify(
     if not existing_shopify_id:
         existing_shopify_id = await find_article_by_handle(shopify_blog_gid, slug)
 
-    if existing_shopify_id:
-        # Update existing article
-        query = """
-        mutation UpdateArticle($id: ID!, $article: ArticleUpdateInput!) {
-            articleUpdate(id: $id, article: $article) {
-                article { id title handle }
-                userErrors { code field message }
-            }
-        }
-        """
-        variables = {
-            "id": existing_shopify_id,
-            "article": article_input,
+    update_query = """
+    mutation UpdateArticle($id: ID!, $article: ArticleUpdateInput!) {
+        articleUpdate(id: $id, article: $article) {
+            article { id title handle }
+            userErrors { code field message }
         }
+    }
+    """
 
-        result = await execute_shopify_graphql(query, variables)
-
-        if "error" in result:
-            # Check if this is a "not found" error - article may have been deleted
-            error_lower = result["error"].lower()
-            if "not found" in error_lower or "does not exist" in error_lower:
-                # Fall back to checking by handle
-                existing_shopify_id = await find_article_by_handle(shopify_blog_gid, slug)
-                if existing_shopify_id:
-                    # Retry update with correct ID
-                    variables["id"] = existing_shopify_id
-                    result = await execute_shopify_graphql(query, variables)
-                else:
-                    # Article truly doesn't exist, create it
-                    existing_shopify_id = None
-            else:
-                return {"success": False, "error": result["error"]}
-
-        if existing_shopify_id:  # Still updating
-            update_result = result.get("articleUpdate", {})
-            user_errors = update_result.get("userErrors", [])
-
-            if user_errors:
-                # Check for "not found" type errors
-                error_codes = [e.get("code", "") for e in user_errors]
-                if any(code in ("INVALID", "NOT_FOUND") for code in error_codes):
-                    # Stale ID - check by handle and create if needed
-                    existing_shopify_id = await find_article_by_handle(shopify_blog_gid, slug)
-                    if not existing_shopify_id:
-                        existing_shopify_id = None  # Will create below
-                else:
-                    error_msg = "; ".join([e.get("message", str(e)) for e in user_errors])
-                    return {"success": False, "error": error_msg}
-            else:
-                article = update_result.get("article", {})
-                if article:
-                    # Cache the result
-                    cache_key = f"{shopify_blog_gid}:{slug}"
-                    _article_cache[cache_key] = article.get("id")
-                    return {
-                        "success": True,
-                        "shopify_article_id": article.get("id"),
-                        "handle": article.get("handle"),
-                    }
-
-    if not existing_shopify_id:
-        # Create new article (only if it truly doesn't exist)
-        article_input["blogId"] = shopify_blog_gid
-
-        query = """
-        mutation CreateArticle($article: ArticleCreateInput!) {
-            articleCreate(article: $article) {
-                article { id title handle }
-                userErrors { code field message }
-            }
-        }
-        """
-        variables = {
-            "article": article_input,
+    # Create new article (only if it truly doesn't exist)
+    create_query = """
+    mutation CreateArticle($article: ArticleCreateInput!) {
+        articleCreate(article: $article) {
+            article { id title handle }
+            userErrors { code field message }
         }
+    }
+    """
 
-        result = await execute_shopify_graphql(query, variables)
-
-        if "error" in result:
-            return {"success": False, "error": result["error"]}
-
-        create_result = result.get("articleCreate", {})
-        user_errors = create_result.get("userErrors", [])
-
-        if user_errors:
-            error_msg = "; ".join([e.get("message", str(e)) for e in user_errors])
-            return {"success": False, "error": error_msg}
-
-        article = create_result.get("article", {})
-        # Cache the result
-        cache_key = f"{shopify_blog_gid}:{slug}"
-        _article_cache[cache_key] = article.get("id")
-        return {
-            "success": True,
-            "shopify_article_id": article.get("id"),
-            "handle": article.get("handle"),
-        }
+    upsert = await _upsert_shopify_resource(
+        "article",
+        existing_shopify_id,
+        update_query,
+        lambda article_id: {"id": article_id, "article": article_input},
+        create_query,
+        {"article": {**article_input, "blogId": shopify_blog_gid}},
+        _article_cache,
+        (shopify_blog_gid, slug),
+        lambda: find_article_by_handle(shopify_blog_gid, slug),
+    )
+    if not upsert["success"]:
+        return {"success": False, "error": upsert["error"]}
+
+    article = upsert["node"]
+    return {
+        "success": True,
+        "shopify_article_id": article.get("id"),
+        "handle": article.get("handle"),
+    }
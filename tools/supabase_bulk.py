@@ -0,0 +1,253 @@
+"""
+Supabase Bulk - Chunked PostgREST lookups and upserts
+
+Shared by the Shopify and WordPress sync modules when they work on many
+rows at once:
+1. fetch_rows_by_values / get_rows_by_values - `<column>=in.(...)` lookups,
+   chunked by value and paged past Supabase's max_rows response cap
+2. upsert_rows - JSON-array writes keyed on slug
+
+Lookups raise RuntimeError instead of returning partial results: an
+importer that can't tell which rows exist must not treat them as new.
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import SUPABASE_URL, get_supabase_headers
+from tools.http_session import get_http_session, json_dumps, json_loads, request_with_retry
+
+# Max values per PostgREST `in.()` filter - keeps lookup URLs well under length limits
+LOOKUP_CHUNK_SIZE = 100
+
+# Rows requested per lookup page. Supabase silently truncates responses at
+# max_rows (1000 by default), so a chunk's matches are paged rather than
+# assumed to fit in one response.
+LOOKUP_PAGE_SIZE = 500
+
+# Max rows per bulk upsert request body
+UPSERT_CHUNK_SIZE = 500
+
+# Max concurrent Supabase requests per bulk call (respects Supabase rate limits)
+SUPABASE_IMPORT_CONCURRENCY = 20
+
+
+@lru_cache(maxsize=1)
+def supabase_headers() -> dict:
+    """
+    Supabase request headers, built once per process.
+
+    The returned dict is shared - don't mutate it; copy it first
+    (e.g. {**supabase_headers(), "Prefer": ...}) to change a header.
+    """
+    return get_supabase_headers()
+
+
+def in_filter(values: list[str]) -> str:
+    """PostgREST `in.()` filter value matching any of `values`."""
+    # Quote each value so commas/parentheses can't break the in.() list
+    return "in.(" + ",".join('"' + str(v).replace('"', '\\"') + '"' for v in values) + ")"
+
+
+async def _fetch_chunk_pages(
+    semaphore: asyncio.Semaphore,
+    table: str,
+    column: str,
+    chunk: list[str],
+    select: str,
+    order: str,
+) -> list[dict]:
+    """
+    Fetch every row matching one chunk of values, page by page.
+
+    The first page asks for an exact count, so paging stops at the real
+    total even if the server's max_rows is below LOOKUP_PAGE_SIZE.
+    """
+    rows = []
+    total = None
+    headers = {**supabase_headers(), "Prefer": "count=exact"}
+
+    while True:
+        async with semaphore:
+            session = await get_http_session()
+            async with await request_with_retry(
+                session, "GET",
+                f"{SUPABASE_URL}/rest/v1/{table}",
+                params={
+                    column: in_filter(chunk),
+                    "select": select,
+                    "order": order,
+                    "limit": str(LOOKUP_PAGE_SIZE),
+                    "offset": str(len(rows)),
+                },
+                headers=headers
+            ) as resp:
+                if resp.status not in (200, 206):
+                    error_text = await resp.text()
+                    raise RuntimeError(f"{table} lookup failed: HTTP {resp.status}: {error_text[:200]}")
+                if total is None:
+                    # Content-Range: "0-499/1234" (or "*/0" when empty)
+                    count = resp.headers.get("Content-Range", "").rpartition("/")[2]
+                    total = int(count) if count.isdigit() else -1
+                page = json_loads(await resp.read())
+
+        rows.extend(page)
+        headers = supabase_headers()  # Count only needed once
+        if not page:
+            return rows
+        if total >= 0 and len(rows) >= total:
+            return rows
+        if total < 0 and len(page) < LOOKUP_PAGE_SIZE:
+            return rows
+
+
+async def fetch_rows_by_values(
+    table: str,
+    column: str,
+    values: list[str],
+    select: str,
+    order: Optional[str] = None,
+) -> list[dict]:
+    """
+    Fetch all rows in a Supabase table whose `column` matches any of the values.
+
+    One `<column>=in.(...)` query per LOOKUP_CHUNK_SIZE values, chunks
+    fetched concurrently, each paged until all its matches are read.
+
+    Args:
+        table: Supabase table name
+        column: Column to match on (e.g. slug, post_id)
+        values: Values to look up (duplicates and blanks are ignored)
+        select: Columns to return
+        order: PostgREST order clause giving a stable page order
+            (default: `column`; add a tiebreaker if it isn't unique)
+
+    Returns:
+        List of every matching row
+
+    Raises:
+        RuntimeError: If any chunk failed to load
+    """
+    unique_values = list(dict.fromkeys(v for v in values if v))
+    if not unique_values:
+        return []
+
+    semaphore = asyncio.Semaphore(SUPABASE_IMPORT_CONCURRENCY)
+    results = await asyncio.gather(
+        *[
+            _fetch_chunk_pages(
+                semaphore, table, column,
+                unique_values[i:i + LOOKUP_CHUNK_SIZE], select, order or column
+            )
+            for i in range(0, len(unique_values), LOOKUP_CHUNK_SIZE)
+        ],
+        return_exceptions=True,
+    )
+
+    rows = []
+    for result in results:
+        if isinstance(result, Exception):
+            raise RuntimeError(f"Error fetching rows from {table}: {result}") from result
+        rows.extend(result)
+    return rows
+
+
+async def get_rows_by_values(
+    table: str,
+    column: str,
+    values: list[str],
+    select: str,
+) -> dict[str, dict]:
+    """
+    Like fetch_rows_by_values, but keyed by `column` (which must be in
+    `select`). Use for unique columns - later duplicates overwrite earlier ones.
+
+    Returns:
+        Dict mapping column value -> row for every value that exists
+
+    Raises:
+        RuntimeError: If any chunk failed to load
+    """
+    rows = await fetch_rows_by_values(table, column, values, select)
+    return {row[column]: row for row in rows}
+
+
+async def upsert_rows(
+    table: str,
+    rows: list[dict],
+    ignore_duplicates: bool = False,
+) -> dict[str, str]:
+    """
+    Write many rows to a Supabase table in bulk, matched on slug.
+
+    Rows are POSTed as JSON arrays, one request per UPSERT_CHUNK_SIZE rows
+    (chunks run concurrently). A PostgREST array must share one set of
+    keys, so rows are grouped by their keys first.
+
+    With ignore_duplicates=False, `resolution=merge-duplicates` makes
+    PostgREST run INSERT ... ON CONFLICT (slug) DO UPDATE, writing only
+    the columns present in each row. Pass ignore_duplicates=True for rows
+    meant to be new: a slug that already exists is then left untouched
+    (ON CONFLICT DO NOTHING) rather than overwritten.
+
+    A single bad row makes PostgREST reject its whole chunk, so a chunk
+    refused with a 4xx is retried one row per request (concurrently) to
+    pin the failure on the offending rows only.
+
+    Returns:
+        Dict mapping slug -> error message for every row that failed
+    """
+    groups: dict[tuple, list[dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    chunks = [
+        group[i:i + UPSERT_CHUNK_SIZE]
+        for group in groups.values()
+        for i in range(0, len(group), UPSERT_CHUNK_SIZE)
+    ]
+    resolution = "ignore-duplicates" if ignore_duplicates else "merge-duplicates"
+    headers = {**supabase_headers(), "Prefer": f"resolution={resolution},return=minimal"}
+    semaphore = asyncio.Semaphore(SUPABASE_IMPORT_CONCURRENCY)
+
+    async def post_rows(chunk: list[dict]) -> tuple[int, str]:
+        """POST one upsert request. Returns (HTTP status or 0, error message or "")."""
+        async with semaphore:
+            try:
+                session = await get_http_session()
+                # Safe to replay on 5xx: re-sending an upsert on slug writes the same rows
+                async with await request_with_retry(
+                    session, "POST",
+                    f"{SUPABASE_URL}/rest/v1/{table}",
+                    idempotent=True,
+                    params={"on_conflict": "slug"},
+                    headers=headers,
+                    data=json_dumps(chunk)
+                ) as resp:
+                    if resp.status in (200, 201, 204):
+                        return resp.status, ""
+                    error_text = await resp.text()
+                    return resp.status, f"HTTP {resp.status}: {error_text[:200]}"
+            except Exception as e:
+                return 0, str(e)
+
+    async def upsert_chunk(chunk: list[dict]) -> dict[str, str]:
+        status, error_msg = await post_rows(chunk)
+        if not error_msg:
+            return {}
+
+        if len(chunk) > 1 and 400 <= status < 500:
+            results = await asyncio.gather(*[post_rows([row]) for row in chunk])
+            return {row["slug"]: msg for row, (_, msg) in zip(chunk, results) if msg}
+
+        return {row["slug"]: error_msg for row in chunk}
+
+    failed = {}
+    for chunk_failures in await asyncio.gather(*[upsert_chunk(chunk) for chunk in chunks]):
+        failed.update(chunk_failures)
+    return failed
@@ -8,15 +8,30 @@ This module provides functions for:
 4. Bulk sync operations
 """
 
-from datetime import datetime
+import asyncio
+import html
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
-import aiohttp
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import SUPABASE_URL, get_supabase_headers, WORDPRESS_DEFAULT_AUTHOR_ID
+from config import (
+    SUPABASE_URL,
+    WORDPRESS_DEFAULT_AUTHOR_ID,
+    WORDPRESS_SYNC_CONCURRENCY,
+)
+from tools.http_session import get_http_session, json_loads, request_with_retry
+from tools.supabase_bulk import (
+    LOOKUP_CHUNK_SIZE,
+    in_filter,
+    fetch_rows_by_values,
+    get_rows_by_values,
+    supabase_headers,
+    upsert_rows,
+)
 from tools.wordpress_tools import (
     sync_category_to_wordpress,
     sync_post_to_wordpress,
@@ -36,68 +51,115 @@ from tools.wordpress_tools import (
 async def get_all_categories() -> list:
     """Fetch all categories from Supabase."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?select=*&order=sort_order,name",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?select=*&order=sort_order,name",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                return await resp.json(loads=json_loads)
+            return []
     except Exception as e:
         print(f"Error fetching categories: {e}")
         return []
 
 
+# Category rows by ID (plus slug -> ID), loaded with one get_all_categories()
+# call the first time a single category is looked up, instead of one request
+# per category. invalidate_category() drops a row once its sync fields change.
+_category_index: dict[str, dict] = {}
+_category_slug_to_id: dict[str, str] = {}
+_category_index_loaded = False
+
+
+async def _ensure_category_index() -> None:
+    """Load every category into _category_index, once per run."""
+    global _category_index_loaded
+
+    if _category_index_loaded:
+        return
+
+    for category in await get_all_categories():
+        _category_index[category['id']] = category
+        _category_slug_to_id[category['slug']] = category['id']
+    _category_index_loaded = True
+
+
+def invalidate_category(category_id: str) -> None:
+    """Drop a category row from the index so the next lookup re-reads it."""
+    category = _category_index.pop(category_id, None)
+    if category:
+        _category_slug_to_id.pop(category['slug'], None)
+
+
 async def get_category_by_slug(slug: str) -> Optional[dict]:
     """Fetch a single category by slug."""
+    await _ensure_category_index()
+    category_id = _category_slug_to_id.get(slug)
+    if category_id:
+        return _category_index[category_id]
+
+    # Not indexed (e.g. inserted after the index was loaded) - ask Supabase
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?slug=eq.{slug}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                categories = await resp.json(loads=json_loads)
+                return categories[0] if categories else None
+            return None
     except Exception:
         return None
 
 
 async def get_category_by_id(category_id: str) -> Optional[dict]:
     """Fetch a single category by ID."""
+    await _ensure_category_index()
+    if category_id in _category_index:
+        return _category_index[category_id]
+
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                categories = await resp.json(loads=json_loads)
+                return categories[0] if categories else None
+            return None
     except Exception:
         return None
 
 
+# Supabase category ID -> WordPress category ID, recorded when ensure_category_synced
+# reads it or update_category_wordpress_fields writes it. The category row is the
+# persistent record; this only saves re-reading that row for every post
+# of the category in one run.
+_category_wp_ids: dict[str, int] = {}
+
+
 async def update_category_wordpress_fields(category_id: str, wordpress_category_id: int) -> bool:
     """Update category with WordPress sync info."""
+    _category_wp_ids[category_id] = wordpress_category_id
+    invalidate_category(category_id)
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}",
-                headers=headers,
-                json={
-                    "wordpress_category_id": wordpress_category_id,
-                    "wordpress_synced_at": datetime.utcnow().isoformat(),
-                }
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}",
+            headers=headers,
+            json={
+                "wordpress_category_id": wordpress_category_id,
+                "wordpress_synced_at": datetime.utcnow().isoformat(),
+            }
+        ) as resp:
+            return resp.status in [200, 204]
     except Exception:
         return False
 
@@ -105,15 +167,17 @@ async def update_category_wordpress_fields(category_id: str, wordpress_category_
 async def get_all_posts() -> list:
     """Fetch all posts from Supabase with related data."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?select=*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)&order=updated_at.desc",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return []
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?select=*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)&order=updated_at.desc",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                # Whole table with content - parse the (already gunzipped)
+                # body bytes directly rather than decoding to str first
+                return json_loads(await resp.read())
+            return []
     except Exception as e:
         print(f"Error fetching posts: {e}")
         return []
@@ -122,16 +186,16 @@ async def get_all_posts() -> list:
 async def get_post_by_slug(slug: str) -> Optional[dict]:
     """Fetch a single post by slug with related data."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&select=*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&select=*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json(loads=json_loads)
+                return posts[0] if posts else None
+            return None
     except Exception:
         return None
 
@@ -139,16 +203,16 @@ async def get_post_by_slug(slug: str) -> Optional[dict]:
 async def get_post_by_id(post_id: str) -> Optional[dict]:
     """Fetch a single post by ID with related data."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}&select=*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json(loads=json_loads)
+                return posts[0] if posts else None
+            return None
     except Exception:
         return None
 
@@ -156,20 +220,46 @@ async def get_post_by_id(post_id: str) -> Optional[dict]:
 async def get_post_tags(post_id: str) -> list:
     """Fetch tags for a post."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}&select=blog_tags(name)",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    results = await resp.json()
-                    return [r['blog_tags']['name'] for r in results if r.get('blog_tags')]
-                return []
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}&select=blog_tags(name)",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                results = await resp.json(loads=json_loads)
+                return [r['blog_tags']['name'] for r in results if r.get('blog_tags')]
+            return []
     except Exception:
         return []
 
 
+async def get_post_tags_bulk(post_ids: list[str]) -> dict[str, list]:
+    """
+    Fetch tag names for many posts at once, keyed by post id.
+
+    One paged `post_id=in.(...)` query per chunk of posts instead of one
+    request per post. Pages are read until every relation is in, so a
+    post never comes back with tags cut off by Supabase's max_rows cap.
+    If the lookup fails, an empty dict is returned and callers fall back
+    to get_post_tags() per post rather than syncing with no tags.
+    """
+    try:
+        rows = await fetch_rows_by_values(
+            "blog_post_tags", "post_id", post_ids,
+            select="post_id,blog_tags(name)", order="post_id,tag_id",
+        )
+    except RuntimeError as e:
+        print(f"Error fetching post tags: {e}")
+        return {}
+
+    tags_by_post = {post_id: [] for post_id in post_ids if post_id}
+    for r in rows:
+        if r.get('blog_tags'):
+            tags_by_post[r['post_id']].append(r['blog_tags']['name'])
+    return tags_by_post
+
+
 async def update_post_wordpress_fields(
     post_id: str,
     wordpress_post_id: Optional[int] = None,
@@ -186,14 +276,14 @@ async def update_post_wordpress_fields(
         if error:
             update_data["wordpress_sync_error"] = error
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json=update_data
+        ) as resp:
+            return resp.status in [200, 204]
     except Exception:
         return False
 
@@ -202,6 +292,10 @@ async def update_post_wordpress_fields(
 # CATEGORY SYNC FUNCTIONS
 # =============================================================================
 
+# Max categories synced to WordPress at once (keeps load on the WP host modest)
+WORDPRESS_CATEGORY_SYNC_CONCURRENCY = 8
+
+
 async def sync_all_categories(force: bool = False) -> dict:
     """
     Sync all categories to WordPress.
@@ -225,52 +319,67 @@ async def sync_all_categories(force: bool = False) -> dict:
     else:
         print()
 
-    synced = 0
-    failed = 0
     skipped = 0
+    to_sync = []
 
     for cat in categories:
-        cat_id = cat['id']
-        name = cat['name']
-        slug = cat['slug']
-        description = cat.get('description', '')
-        existing_id = cat.get('wordpress_category_id')
-        seo = cat.get('seo')
-
         # Skip if already synced and not forcing
-        if existing_id and not force:
-            print(f"  [SKIP] {name} - already synced")
+        if cat.get('wordpress_category_id') and not force:
+            print(f"  [SKIP] {cat['name']} - already synced")
             skipped += 1
             continue
+        to_sync.append(cat)
 
-        # Print status
-        if force and existing_id:
-            print(f"  Syncing: {name} (force)...", end=" ")
+    semaphore = asyncio.Semaphore(WORDPRESS_CATEGORY_SYNC_CONCURRENCY)
+    results = await asyncio.gather(
+        *[_sync_category(cat, force, semaphore) for cat in to_sync],
+        return_exceptions=True,
+    )
+
+    synced = 0
+    failed = 0
+    for cat, ok in zip(to_sync, results):
+        if isinstance(ok, Exception):
+            print(f"  Syncing: {cat['name']}... FAILED: {ok}")
+            ok = False
+        if ok:
+            synced += 1
         else:
-            print(f"  Syncing: {name}...", end=" ")
+            failed += 1
 
+    return {"synced": synced, "failed": failed, "skipped": skipped}
+
+
+async def _sync_category(cat: dict, force: bool, semaphore: asyncio.Semaphore) -> bool:
+    """Sync one category for sync_all_categories and print its status line."""
+    cat_id = cat['id']
+    name = cat['name']
+    existing_id = cat.get('wordpress_category_id')
+    # Categories finish out of order, so the whole status line is printed at once
+    label = f"{name} (force)" if force and existing_id else name
+
+    async with semaphore:
         result = await sync_category_to_wordpress(
             category_id=cat_id,
             name=name,
-            slug=slug,
-            description=description,
+            slug=cat['slug'],
+            description=cat.get('description', ''),
             existing_wp_id=existing_id,
-            seo=seo,
+            seo=cat.get('seo'),
         )
 
-        if result.get("success"):
-            await update_category_wordpress_fields(cat_id, result["wordpress_category_id"])
-            seo_warning = result.get("seo_warning")
-            if seo_warning:
-                print(f"OK (ID: {result['wordpress_category_id']}) [SEO: {seo_warning}]")
-            else:
-                print(f"OK (ID: {result['wordpress_category_id']})")
-            synced += 1
-        else:
-            print(f"FAILED: {result.get('error', 'Unknown error')}")
-            failed += 1
+        if not result.get("success"):
+            print(f"  Syncing: {label}... FAILED: {result.get('error', 'Unknown error')}")
+            return False
 
-    return {"synced": synced, "failed": failed, "skipped": skipped}
+        await update_category_wordpress_fields(cat_id, result["wordpress_category_id"])
+
+    seo_warning = result.get("seo_warning")
+    if seo_warning:
+        print(f"  Syncing: {label}... OK (ID: {result['wordpress_category_id']}) [SEO: {seo_warning}]")
+    else:
+        print(f"  Syncing: {label}... OK (ID: {result['wordpress_category_id']})")
+    return True
 
 
 async def sync_category_by_slug(slug: str, force: bool = False) -> bool:
@@ -320,6 +429,12 @@ async def sync_category_by_slug(slug: str, force: bool = False) -> bool:
         return False
 
 
+# Category syncs started by ensure_category_synced and not finished yet, so
+# concurrent posts of a new category wait for one sync instead of each
+# creating the category
+_category_syncs_in_flight: dict[str, asyncio.Task] = {}
+
+
 async def ensure_category_synced(category_id: str) -> Optional[int]:
     """
     Ensure a category is synced to WordPress, syncing if needed.
@@ -330,6 +445,21 @@ async def ensure_category_synced(category_id: str) -> Optional[int]:
     Returns:
         WordPress category ID if successful, None otherwise
     """
+    if category_id in _category_wp_ids:
+        return _category_wp_ids[category_id]
+
+    task = _category_syncs_in_flight.get(category_id)
+    if task is None:
+        task = asyncio.create_task(_ensure_category_synced(category_id))
+        _category_syncs_in_flight[category_id] = task
+        task.add_done_callback(lambda _: _category_syncs_in_flight.pop(category_id, None))
+
+    # Shielded so one cancelled caller does not cancel the others' sync
+    return await asyncio.shield(task)
+
+
+async def _ensure_category_synced(category_id: str) -> Optional[int]:
+    """Look up and, if needed, sync one category for ensure_category_synced."""
     category = await get_category_by_id(category_id)
 
     if not category:
@@ -338,6 +468,7 @@ async def ensure_category_synced(category_id: str) -> Optional[int]:
     existing_id = category.get('wordpress_category_id')
 
     if existing_id:
+        _category_wp_ids[category_id] = existing_id
         return existing_id
 
     # Sync the category
@@ -402,10 +533,15 @@ async def sync_post_by_id(post_id: str, force: bool = False) -> bool:
     return result in ("synced", "skipped")
 
 
-async def _sync_single_post(post: dict, force: bool = False) -> str:
+async def _sync_single_post(post: dict, force: bool = False, tags: Optional[list] = None) -> str:
     """
     Internal function to sync a single post.
 
+    Args:
+        post: Post row with related category/author
+        force: Force re-sync even if up-to-date
+        tags: The post's tag names, if already fetched (looked up otherwise)
+
     Returns:
         "synced" if successfully synced
         "skipped" if post is up-to-date and not forced
@@ -416,17 +552,9 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
     slug = post['slug']
     status = post.get('status', 'draft')
     existing_wp_id = post.get('wordpress_post_id')
-    updated_at = post.get('updated_at', '')
-    synced_at = post.get('wordpress_synced_at', '')
 
     # Check if sync is needed
-    needs_sync = (
-        force or
-        not existing_wp_id or
-        (updated_at and (not synced_at or updated_at > synced_at))
-    )
-
-    if not needs_sync:
+    if not (force or _needs_sync(post)):
         visibility = get_wordpress_visibility_label(status)
         print(f"  [SKIP] {title[:50]} - up-to-date ({visibility})")
         return "skipped"
@@ -438,9 +566,19 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
         return "failed"
 
     wordpress_category_id = category.get('wordpress_category_id')
-    if not wordpress_category_id:
+    if wordpress_category_id:
+        if tags is None:
+            tags = await get_post_tags(post_id)
+    else:
         print(f"  Syncing category '{category['name']}' first...")
-        wordpress_category_id = await ensure_category_synced(category['id'])
+        if tags is None:
+            # The post's tags are read while the category syncs
+            wordpress_category_id, tags = await asyncio.gather(
+                ensure_category_synced(category['id']),
+                get_post_tags(post_id),
+            )
+        else:
+            wordpress_category_id = await ensure_category_synced(category['id'])
         if not wordpress_category_id:
             print(f"  [FAIL] {title[:50]} - category sync failed")
             return "failed"
@@ -450,12 +588,6 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
     # WordPress requires user ID, not name - use default
     author_id = WORDPRESS_DEFAULT_AUTHOR_ID
 
-    # Get tags
-    tags = await get_post_tags(post_id)
-
-    visibility = get_wordpress_visibility_label(status)
-    print(f"  Syncing: {title[:50]}... ({visibility})", end=" ")
-
     result = await sync_post_to_wordpress(
         post_id=post_id,
         title=title,
@@ -473,17 +605,84 @@ async def _sync_single_post(post: dict, force: bool = False) -> str:
         existing_wordpress_id=existing_wp_id,
     )
 
+    # Bulk syncs run posts concurrently, so the whole status line is printed at once
+    visibility = get_wordpress_visibility_label(status)
+    label = f"{title[:50]}... ({visibility})"
+
     if result.get("success"):
         await update_post_wordpress_fields(post_id, wordpress_post_id=result["wordpress_post_id"])
-        print("OK")
+        print(f"  Syncing: {label} OK")
         return "synced"
     else:
         error = result.get('error', 'Unknown error')
         await update_post_wordpress_fields(post_id, error=error)
-        print(f"FAILED: {error}")
+        print(f"  Syncing: {label} FAILED: {error}")
         return "failed"
 
 
+async def _sync_posts(posts: list, force: bool = False) -> dict:
+    """
+    Sync posts concurrently, at most WORDPRESS_SYNC_CONCURRENCY at a time.
+
+    Args:
+        posts: Posts to sync
+        force: Force re-sync even if post appears up-to-date
+
+    Returns:
+        dict with keys: synced, failed, skipped
+    """
+    semaphore = asyncio.Semaphore(max(1, WORDPRESS_SYNC_CONCURRENCY))
+
+    # Tags for every post that will actually be pushed, in a few bulk requests
+    tags_by_post = await get_post_tags_bulk(
+        [post['id'] for post in posts if force or _needs_sync(post)]
+    )
+
+    async def sync_one(post: dict) -> str:
+        async with semaphore:
+            return await _sync_single_post(post, force=force, tags=tags_by_post.get(post['id']))
+
+    results = await asyncio.gather(
+        *[sync_one(post) for post in posts],
+        return_exceptions=True,
+    )
+
+    counts = {"synced": 0, "failed": 0, "skipped": 0}
+    for post, result in zip(posts, results):
+        if isinstance(result, Exception):
+            print(f"  Syncing: {post['title'][:50]}... FAILED: {result}")
+            result = "failed"
+        counts[result] += 1
+
+    return counts
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(dt_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp once per distinct string (None if invalid)."""
+    try:
+        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    # Timestamps written without an offset are UTC (datetime.utcnow())
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _is_newer(updated_at: str, synced_at: str) -> bool:
+    """
+    Check whether updated_at is later than synced_at.
+
+    Compared as datetimes so "Z" vs "+00:00" suffixes and differing
+    fractional-second precision don't skew the result; falls back to a
+    string comparison if either value can't be parsed.
+    """
+    updated_dt = _parse_iso(updated_at)
+    synced_dt = _parse_iso(synced_at)
+    if updated_dt is None or synced_dt is None:
+        return updated_at > synced_at
+    return updated_dt > synced_dt
+
+
 def _needs_sync(post: dict) -> bool:
     """Check if a post needs syncing."""
     wordpress_post_id = post.get('wordpress_post_id')
@@ -495,16 +694,80 @@ def _needs_sync(post: dict) -> bool:
         return True
 
     # Updated since last sync
-    if updated_at and (not synced_at or updated_at > synced_at):
+    if updated_at and (not synced_at or _is_newer(updated_at, synced_at)):
         return True
 
     return False
 
 
+# Columns _needs_sync reads - enough to pick out stale posts without their content
+_SYNC_STATE_COLUMNS = "id,updated_at,wordpress_post_id,wordpress_synced_at"
+
+
 async def get_posts_needing_sync() -> list:
-    """Get all posts that need syncing to WordPress."""
-    posts = await get_all_posts()
-    return [p for p in posts if _needs_sync(p)]
+    """
+    Get all posts that need syncing to WordPress.
+
+    PostgREST filters can't compare two columns (updated_at vs
+    wordpress_synced_at), so the check runs on a light query of just the
+    sync-state columns; only the posts that need syncing are then fetched
+    in full, with content and related data.
+    """
+    try:
+        session = await get_http_session()
+        async with await request_with_retry(
+            session, "GET",
+            f"{SUPABASE_URL}/rest/v1/blog_posts",
+            params={"select": _SYNC_STATE_COLUMNS, "order": "updated_at.desc"},
+            headers=supabase_headers()
+        ) as resp:
+            if resp.status != 200:
+                print(f"Error fetching posts: HTTP {resp.status}")
+                return []
+            states = json_loads(await resp.read())
+    except Exception as e:
+        print(f"Error fetching posts: {e}")
+        return []
+
+    pending_ids = [state['id'] for state in states if _needs_sync(state)]
+    if not pending_ids:
+        return []
+
+    async def fetch_chunk(chunk: list[str]) -> list[dict]:
+        async with await request_with_retry(
+            session, "GET",
+            f"{SUPABASE_URL}/rest/v1/blog_posts",
+            params={
+                "id": in_filter(chunk),
+                "select": "*,blog_categories(id,slug,name,wordpress_category_id),blog_authors(id,slug,name)",
+            },
+            headers=supabase_headers()
+        ) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status}")
+            return json_loads(await resp.read())
+
+    results = await asyncio.gather(
+        *[
+            fetch_chunk(pending_ids[i:i + LOOKUP_CHUNK_SIZE])
+            for i in range(0, len(pending_ids), LOOKUP_CHUNK_SIZE)
+        ],
+        return_exceptions=True,
+    )
+
+    posts_by_id = {}
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error fetching posts: {result}")
+            continue
+        posts_by_id.update((post['id'], post) for post in result)
+
+    # Keep the most-recently-edited-first order of the state query, and
+    # re-check in case a post was synced between the two queries
+    return [
+        posts_by_id[post_id] for post_id in pending_ids
+        if post_id in posts_by_id and _needs_sync(posts_by_id[post_id])
+    ]
 
 
 async def sync_all_posts(force: bool = False) -> dict:
@@ -526,20 +789,7 @@ async def sync_all_posts(force: bool = False) -> dict:
 
     print(f"Found {len(posts)} post(s) to sync...\n")
 
-    synced = 0
-    failed = 0
-    skipped = 0
-
-    for post in posts:
-        result = await _sync_single_post(post, force=force)
-        if result == "synced":
-            synced += 1
-        elif result == "skipped":
-            skipped += 1
-        else:
-            failed += 1
-
-    return {"synced": synced, "failed": failed, "skipped": skipped}
+    return await _sync_posts(posts, force=force)
 
 
 async def sync_pending_posts() -> dict:
@@ -558,17 +808,7 @@ async def sync_pending_posts() -> dict:
 
     print(f"Found {len(posts)} post(s) needing sync...\n")
 
-    synced = 0
-    failed = 0
-
-    for post in posts:
-        result = await _sync_single_post(post, force=False)
-        if result == "synced":
-            synced += 1
-        else:
-            failed += 1
-
-    return {"synced": synced, "failed": failed, "skipped": 0}
+    return await _sync_posts(posts)
 
 
 async def sync_recent(n: int, force: bool = False) -> dict:
@@ -592,20 +832,7 @@ async def sync_recent(n: int, force: bool = False) -> dict:
 
     print(f"Syncing {len(posts)} most recent post(s)...\n")
 
-    synced = 0
-    failed = 0
-    skipped = 0
-
-    for post in posts:
-        result = await _sync_single_post(post, force=force)
-        if result == "synced":
-            synced += 1
-        elif result == "skipped":
-            skipped += 1
-        else:
-            failed += 1
-
-    return {"synced": synced, "failed": failed, "skipped": skipped}
+    return await _sync_posts(posts, force=force)
 
 
 # =============================================================================
@@ -616,11 +843,10 @@ def _format_datetime(dt_str: str) -> str:
     """Format datetime string for display."""
     if not dt_str:
         return "—"
-    try:
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except Exception:
+    dt = _parse_iso(dt_str)
+    if dt is None:
         return dt_str[:16] if len(dt_str) >= 16 else dt_str
+    return dt.strftime("%Y-%m-%d %H:%M")
 
 
 def _get_sync_status(post: dict) -> tuple:
@@ -636,7 +862,7 @@ def _get_sync_status(post: dict) -> tuple:
     if not wordpress_post_id:
         return ("NOT SYNCED", "")
 
-    if updated_at and synced_at and updated_at > synced_at:
+    if updated_at and synced_at and _is_newer(updated_at, synced_at):
         return ("STALE", "")
 
     return ("SYNCED", "")
@@ -650,10 +876,15 @@ async def show_sync_status() -> None:
         print("No posts found.")
         return
 
-    # Header
-    print()
-    print(f"{'TITLE':<42} {'STATUS':<10} {'WORDPRESS':<12} {'SYNC STATUS':<14} {'LAST EDIT':<18} {'LAST SYNC':<18}")
-    print("-" * 114)
+    # Rows are collected and written to stdout in one call, not one print per post
+    lines = [
+        "",
+        f"{'TITLE':<42} {'STATUS':<10} {'WORDPRESS':<12} {'SYNC STATUS':<14} {'LAST EDIT':<18} {'LAST SYNC':<18}",
+        "-" * 114,
+    ]
+
+    # Summary counts are tallied in the same pass so each post is checked once
+    synced_count = stale_count = not_synced_count = error_count = 0
 
     for post in posts:
         title = post.get('title', '')[:40]
@@ -663,6 +894,15 @@ async def show_sync_status() -> None:
         updated_at = _format_datetime(post.get('updated_at', ''))
         synced_at = _format_datetime(post.get('wordpress_synced_at', ''))
 
+        if not post.get('wordpress_post_id'):
+            not_synced_count += 1
+        elif _needs_sync(post):
+            stale_count += 1
+        else:
+            synced_count += 1
+        if post.get('wordpress_sync_error'):
+            error_count += 1
+
         # Display sync status
         if sync_status == "SYNCED":
             sync_display = "SYNCED"
@@ -673,17 +913,11 @@ async def show_sync_status() -> None:
         else:
             sync_display = "NOT SYNCED"
 
-        print(f"{title:<42} {status:<10} {wp_vis:<12} {sync_display:<14} {updated_at:<18} {synced_at:<18}")
-
-    print()
+        lines.append(f"{title:<42} {status:<10} {wp_vis:<12} {sync_display:<14} {updated_at:<18} {synced_at:<18}")
 
-    # Summary counts
-    synced_count = sum(1 for p in posts if p.get('wordpress_post_id') and not _needs_sync(p))
-    stale_count = sum(1 for p in posts if p.get('wordpress_post_id') and _needs_sync(p))
-    not_synced_count = sum(1 for p in posts if not p.get('wordpress_post_id'))
-    error_count = sum(1 for p in posts if p.get('wordpress_sync_error'))
-
-    print(f"Total: {len(posts)} | Synced: {synced_count} | Stale: {stale_count} | Not Synced: {not_synced_count} | Errors: {error_count}")
+    lines.append("")
+    lines.append(f"Total: {len(posts)} | Synced: {synced_count} | Stale: {stale_count} | Not Synced: {not_synced_count} | Errors: {error_count}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def show_category_sync_status() -> None:
@@ -694,10 +928,13 @@ async def show_category_sync_status() -> None:
         print("No categories found.")
         return
 
-    # Header
-    print()
-    print(f"{'NAME':<30} {'SLUG':<25} {'SYNC STATUS':<15} {'WP ID':<10} {'LAST SYNC':<18}")
-    print("-" * 100)
+    # Rows are collected and written to stdout in one call, not one print per category
+    lines = [
+        "",
+        f"{'NAME':<30} {'SLUG':<25} {'SYNC STATUS':<15} {'WP ID':<10} {'LAST SYNC':<18}",
+        "-" * 100,
+    ]
+    synced_count = 0
 
     for cat in categories:
         name = cat.get('name', '')[:28]
@@ -708,20 +945,20 @@ async def show_category_sync_status() -> None:
         if wp_id:
             sync_status = "SYNCED"
             wp_id_str = str(wp_id)
+            synced_count += 1
         else:
             sync_status = "NOT SYNCED"
             wp_id_str = "—"
             synced_at = "—"
 
-        print(f"{name:<30} {slug:<25} {sync_status:<15} {wp_id_str:<10} {synced_at:<18}")
-
-    print()
+        lines.append(f"{name:<30} {slug:<25} {sync_status:<15} {wp_id_str:<10} {synced_at:<18}")
 
     # Summary
-    synced_count = sum(1 for c in categories if c.get('wordpress_category_id'))
     not_synced_count = len(categories) - synced_count
 
-    print(f"Total: {len(categories)} | Synced: {synced_count} | Not Synced: {not_synced_count}")
+    lines.append("")
+    lines.append(f"Total: {len(categories)} | Synced: {synced_count} | Not Synced: {not_synced_count}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =============================================================================
@@ -730,65 +967,40 @@ async def show_category_sync_status() -> None:
 
 def _decode_html_entities(text: str) -> str:
     """Decode HTML entities in WordPress category names."""
-    import html
-    if not text:
+    # Most names carry no entities - skip unescape's regex scan for them
+    if not text or '&' not in text:
         return text
     return html.unescape(text)
 
 
-async def _get_category_by_slug_supabase(slug: str) -> Optional[dict]:
-    """Check if a category exists in Supabase by slug."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
-    except Exception:
-        return None
-
-
-async def _insert_category_supabase(category_data: dict) -> tuple[bool, str]:
-    """Insert a new category into Supabase.
+def _report_import_writes(
+    to_update: list[dict],
+    to_insert: list[dict],
+    update_failures: dict[str, str],
+    insert_failures: dict[str, str],
+    errors: list,
+) -> tuple[int, int]:
+    """Print the per-row result of a bulk import write. Returns (updated, imported)."""
+    updated = 0
+    imported = 0
 
-    Returns:
-        Tuple of (success, error_message)
-    """
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_categories",
-                headers=headers,
-                json=category_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    return True, ""
-                else:
-                    error_text = await resp.text()
-                    return False, f"HTTP {resp.status}: {error_text[:200]}"
-    except Exception as e:
-        return False, str(e)
+    for row in to_update:
+        if row["slug"] in update_failures:
+            errors.append(f"Failed to update {row['slug']}")
+        else:
+            print(f"  [UPDATE] {row['name']} ({row['slug']})")
+            updated += 1
+
+    for row in to_insert:
+        error_msg = insert_failures.get(row["slug"])
+        if error_msg:
+            print(f"  [FAIL] {row['name']} ({row['slug']}) - {error_msg}")
+            errors.append(f"Failed to import {row['slug']}: {error_msg}")
+        else:
+            print(f"  [IMPORT] {row['name']} ({row['slug']})")
+            imported += 1
 
-
-async def _update_category_supabase(category_id: str, category_data: dict) -> bool:
-    """Update an existing category in Supabase."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?id=eq.{category_id}",
-                headers=headers,
-                json=category_data
-            ) as resp:
-                return resp.status in [200, 204]
-    except Exception:
-        return False
+    return updated, imported
 
 
 async def import_categories_from_wordpress(force_pull: bool = False) -> dict:
@@ -815,10 +1027,23 @@ async def import_categories_from_wordpress(force_pull: bool = False) -> dict:
 
     print(f"Found {len(wp_categories)} categories in WordPress\n")
 
-    imported = 0
-    updated = 0
     skipped = 0
     errors = []
+    to_insert = []
+    to_update = []
+
+    # One bulk lookup for every category's existing Supabase row. Without a
+    # complete lookup, existing categories would be taken for new ones.
+    try:
+        existing_by_slug = await get_rows_by_values(
+            "blog_categories", "slug", [wp_cat.get("slug", "") for wp_cat in wp_categories], select="id,slug"
+        )
+    except RuntimeError as e:
+        print(f"Import aborted - could not check existing categories: {e}")
+        return {"imported": 0, "updated": 0, "skipped": 0, "errors": [str(e)]}
+
+    # Every row is written in the same bulk upsert, so they share one sync timestamp
+    now_iso = datetime.utcnow().isoformat()
 
     for wp_cat in wp_categories:
         wp_id = wp_cat.get("id")
@@ -831,47 +1056,44 @@ async def import_categories_from_wordpress(force_pull: bool = False) -> dict:
             continue
 
         # Check if category already exists in Supabase
-        existing = await _get_category_by_slug_supabase(slug)
+        existing = existing_by_slug.get(slug)
 
         if existing:
             if force_pull:
                 # Update existing category with WordPress data
                 update_data = {
+                    "slug": slug,
                     "name": name,
                     "wordpress_category_id": wp_id,
-                    "wordpress_synced_at": datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat(),
+                    "wordpress_synced_at": now_iso,
+                    "updated_at": now_iso,
                 }
                 # Only update description if WordPress has one
                 if description:
                     update_data["description"] = description
-
-                success = await _update_category_supabase(existing["id"], update_data)
-                if success:
-                    print(f"  [UPDATE] {name} ({slug})")
-                    updated += 1
-                else:
-                    errors.append(f"Failed to update {slug}")
+                to_update.append(update_data)
             else:
                 print(f"  [SKIP] {name} ({slug}) - already exists")
                 skipped += 1
         else:
             # Insert new category
-            insert_data = {
+            to_insert.append({
                 "slug": slug,
                 "name": name,
                 "description": description or None,
                 "wordpress_category_id": wp_id,
-                "wordpress_synced_at": datetime.utcnow().isoformat(),
-            }
-
-            success, error_msg = await _insert_category_supabase(insert_data)
-            if success:
-                print(f"  [IMPORT] {name} ({slug})")
-                imported += 1
-            else:
-                print(f"  [FAIL] {name} ({slug}) - {error_msg}")
-                errors.append(f"Failed to import {slug}: {error_msg}")
+                "wordpress_synced_at": now_iso,
+            })
+
+    # Write all changed and new categories in bulk.
+    # New rows never overwrite: a slug that turns out to exist is left as is
+    update_failures, insert_failures = await asyncio.gather(
+        upsert_rows("blog_categories", to_update),
+        upsert_rows("blog_categories", to_insert, ignore_duplicates=True),
+    )
+    updated, imported = _report_import_writes(
+        to_update, to_insert, update_failures, insert_failures, errors
+    )
 
     # Summary
     print()
@@ -893,57 +1115,6 @@ async def import_categories_from_wordpress(force_pull: bool = False) -> dict:
 # TAG IMPORT (WordPress → Supabase)
 # =============================================================================
 
-async def _get_tag_by_slug_supabase(slug: str) -> Optional[dict]:
-    """Check if a tag exists in Supabase by slug."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_tags?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    tags = await resp.json()
-                    return tags[0] if tags else None
-                return None
-    except Exception:
-        return None
-
-
-async def _insert_tag_supabase(tag_data: dict) -> tuple[bool, str]:
-    """Insert a new tag into Supabase. Returns (success, error_message)."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_tags",
-                headers=headers,
-                json=tag_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    return True, ""
-                else:
-                    error_text = await resp.text()
-                    return False, f"HTTP {resp.status}: {error_text[:200]}"
-    except Exception as e:
-        return False, str(e)
-
-
-async def _update_tag_supabase(tag_id: str, update_data: dict) -> bool:
-    """Update an existing tag in Supabase."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_tags?id=eq.{tag_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
-    except Exception:
-        return False
-
-
 async def import_tags_from_wordpress(force_pull: bool = False) -> dict:
     """
     Import tags from WordPress into Supabase.
@@ -968,10 +1139,23 @@ async def import_tags_from_wordpress(force_pull: bool = False) -> dict:
 
     print(f"Found {len(wp_tags)} tags in WordPress\n")
 
-    imported = 0
-    updated = 0
     skipped = 0
     errors = []
+    to_insert = []
+    to_update = []
+
+    # One bulk lookup for every tag's existing Supabase row. Without a
+    # complete lookup, existing tags would be taken for new ones.
+    try:
+        existing_by_slug = await get_rows_by_values(
+            "blog_tags", "slug", [wp_tag.get("slug", "") for wp_tag in wp_tags], select="id,slug"
+        )
+    except RuntimeError as e:
+        print(f"Import aborted - could not check existing tags: {e}")
+        return {"imported": 0, "updated": 0, "skipped": 0, "errors": [str(e)]}
+
+    # Every row is written in the same bulk upsert, so they share one sync timestamp
+    now_iso = datetime.utcnow().isoformat()
 
     for wp_tag in wp_tags:
         wp_id = wp_tag.get("id")
@@ -983,42 +1167,38 @@ async def import_tags_from_wordpress(force_pull: bool = False) -> dict:
             continue
 
         # Check if tag already exists in Supabase
-        existing = await _get_tag_by_slug_supabase(slug)
+        existing = existing_by_slug.get(slug)
 
         if existing:
             if force_pull:
                 # Update existing tag with WordPress data
-                update_data = {
+                to_update.append({
+                    "slug": slug,
                     "name": name,
                     "wordpress_tag_id": wp_id,
-                    "wordpress_synced_at": datetime.utcnow().isoformat(),
-                }
-
-                success = await _update_tag_supabase(existing["id"], update_data)
-                if success:
-                    print(f"  [UPDATE] {name} ({slug})")
-                    updated += 1
-                else:
-                    errors.append(f"Failed to update {slug}")
+                    "wordpress_synced_at": now_iso,
+                })
             else:
                 print(f"  [SKIP] {name} ({slug}) - already exists")
                 skipped += 1
         else:
             # Insert new tag
-            insert_data = {
+            to_insert.append({
                 "slug": slug,
                 "name": name,
                 "wordpress_tag_id": wp_id,
-                "wordpress_synced_at": datetime.utcnow().isoformat(),
-            }
-
-            success, error_msg = await _insert_tag_supabase(insert_data)
-            if success:
-                print(f"  [IMPORT] {name} ({slug})")
-                imported += 1
-            else:
-                print(f"  [FAIL] {name} ({slug}) - {error_msg}")
-                errors.append(f"Failed to import {slug}: {error_msg}")
+                "wordpress_synced_at": now_iso,
+            })
+
+    # Write all changed and new tags in bulk.
+    # New rows never overwrite: a slug that turns out to exist is left as is
+    update_failures, insert_failures = await asyncio.gather(
+        upsert_rows("blog_tags", to_update),
+        upsert_rows("blog_tags", to_insert, ignore_duplicates=True),
+    )
+    updated, imported = _report_import_writes(
+        to_update, to_insert, update_failures, insert_failures, errors
+    )
 
     # Summary
     print()
@@ -1085,16 +1265,16 @@ def _extract_tag_ids(wp_post: dict) -> list:
 async def _get_post_by_slug_supabase(slug: str) -> Optional[dict]:
     """Check if a post exists in Supabase by slug."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    posts = await resp.json()
-                    return posts[0] if posts else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?slug=eq.{slug}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                posts = await resp.json(loads=json_loads)
+                return posts[0] if posts else None
+            return None
     except Exception:
         return None
 
@@ -1102,16 +1282,16 @@ async def _get_post_by_slug_supabase(slug: str) -> Optional[dict]:
 async def _get_category_by_wordpress_id(wp_id: int) -> Optional[dict]:
     """Get Supabase category by WordPress ID."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_categories?wordpress_category_id=eq.{wp_id}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    categories = await resp.json()
-                    return categories[0] if categories else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_categories?wordpress_category_id=eq.{wp_id}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                categories = await resp.json(loads=json_loads)
+                return categories[0] if categories else None
+            return None
     except Exception:
         return None
 
@@ -1119,16 +1299,16 @@ async def _get_category_by_wordpress_id(wp_id: int) -> Optional[dict]:
 async def _get_tag_by_wordpress_id(wp_id: int) -> Optional[dict]:
     """Get Supabase tag by WordPress ID."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_tags?wordpress_tag_id=eq.{wp_id}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    tags = await resp.json()
-                    return tags[0] if tags else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_tags?wordpress_tag_id=eq.{wp_id}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                tags = await resp.json(loads=json_loads)
+                return tags[0] if tags else None
+            return None
     except Exception:
         return None
 
@@ -1137,16 +1317,16 @@ async def _get_default_author_id() -> Optional[str]:
     """Get the default author ID from Supabase."""
     from config import DEFAULT_AUTHOR_SLUG
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.get(
-                f"{SUPABASE_URL}/rest/v1/blog_authors?slug=eq.{DEFAULT_AUTHOR_SLUG}&limit=1",
-                headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    authors = await resp.json()
-                    return authors[0]["id"] if authors else None
-                return None
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.get(
+            f"{SUPABASE_URL}/rest/v1/blog_authors?slug=eq.{DEFAULT_AUTHOR_SLUG}&limit=1",
+            headers=headers
+        ) as resp:
+            if resp.status == 200:
+                authors = await resp.json(loads=json_loads)
+                return authors[0]["id"] if authors else None
+            return None
     except Exception:
         return None
 
@@ -1154,21 +1334,20 @@ async def _get_default_author_id() -> Optional[str]:
 async def _insert_post_supabase(post_data: dict) -> tuple[bool, str, Optional[str]]:
     """Insert a new post into Supabase. Returns (success, error_message, post_id)."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            headers["Prefer"] = "return=representation"
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_posts",
-                headers=headers,
-                json=post_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    result = await resp.json()
-                    post_id = result[0]["id"] if result else None
-                    return True, "", post_id
-                else:
-                    error_text = await resp.text()
-                    return False, f"HTTP {resp.status}: {error_text[:200]}", None
+        session = await get_http_session()
+        headers = {**supabase_headers(), "Prefer": "return=representation"}
+        async with session.post(
+            f"{SUPABASE_URL}/rest/v1/blog_posts",
+            headers=headers,
+            json=post_data
+        ) as resp:
+            if resp.status in [200, 201]:
+                result = await resp.json(loads=json_loads)
+                post_id = result[0]["id"] if result else None
+                return True, "", post_id
+            else:
+                error_text = await resp.text()
+                return False, f"HTTP {resp.status}: {error_text[:200]}", None
     except Exception as e:
         return False, str(e), None
 
@@ -1176,14 +1355,14 @@ async def _insert_post_supabase(post_data: dict) -> tuple[bool, str, Optional[st
 async def _update_post_supabase(post_id: str, update_data: dict) -> bool:
     """Update an existing post in Supabase."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json=update_data
+        ) as resp:
+            return resp.status in [200, 204]
     except Exception:
         return False
 
@@ -1196,15 +1375,15 @@ async def _create_post_tag_relations(post_id: str, tag_ids: list) -> int:
     created = 0
     for tag_id in tag_ids:
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = get_supabase_headers()
-                async with session.post(
-                    f"{SUPABASE_URL}/rest/v1/blog_post_tags",
-                    headers=headers,
-                    json={"post_id": post_id, "tag_id": tag_id}
-                ) as resp:
-                    if resp.status in [200, 201]:
-                        created += 1
+            session = await get_http_session()
+            headers = supabase_headers()
+            async with session.post(
+                f"{SUPABASE_URL}/rest/v1/blog_post_tags",
+                headers=headers,
+                json={"post_id": post_id, "tag_id": tag_id}
+            ) as resp:
+                if resp.status in [200, 201]:
+                    created += 1
         except Exception:
             pass
     return created
@@ -1213,13 +1392,13 @@ async def _create_post_tag_relations(post_id: str, tag_ids: list) -> int:
 async def _delete_post_tag_relations(post_id: str) -> bool:
     """Delete all post-tag relationships for a post."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.delete(
-                f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}",
-                headers=headers
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = supabase_headers()
+        async with session.delete(
+            f"{SUPABASE_URL}/rest/v1/blog_post_tags?post_id=eq.{post_id}",
+            headers=headers
+        ) as resp:
+            return resp.status in [200, 204]
     except Exception:
         return False
 
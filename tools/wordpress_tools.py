@@ -26,6 +26,7 @@ from config import (
     WORDPRESS_DEFAULT_AUTHOR_ID,
     WORDPRESS_SEO_PLUGIN,
 )
+from tools.http_session import get_http_session, request_with_retry
 
 # Import HTML renderer from shopify_tools (reuse existing implementation)
 from tools.shopify_tools import render_blocks_to_html
@@ -141,35 +142,40 @@ async def execute_wordpress_request(
     url = get_wordpress_api_url(endpoint)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            kwargs = {
-                "headers": headers,
-                "timeout": aiohttp.ClientTimeout(total=60),
-            }
-
-            if data and method in ("POST", "PUT", "PATCH"):
-                kwargs["json"] = data
-            if params:
-                kwargs["params"] = params
-
-            async with session.request(method, url, **kwargs) as resp:
-                # Handle different response types
-                if resp.status == 204:  # No content (successful DELETE)
-                    return {"success": True}
+        # Shared pooled session - keep-alive connections to the site are reused across calls
+        session = await get_http_session()
+        kwargs = {
+            "headers": headers,
+            "timeout": aiohttp.ClientTimeout(total=60),
+        }
 
-                try:
-                    result = await resp.json()
-                except:
-                    text = await resp.text()
-                    return {"error": f"Invalid JSON response: {text[:200]}"}
+        if data and method in ("POST", "PUT", "PATCH"):
+            kwargs["json"] = data
+        if params:
+            kwargs["params"] = params
+
+        # Rate-limited (429) responses are retried with jittered backoff,
+        # honoring Retry-After, so concurrent bulk syncs back off instead of
+        # failing posts outright. Unavailable (502-504) responses are only
+        # retried for GET/PUT/DELETE - a POST may already have created the post.
+        async with await request_with_retry(session, method, url, **kwargs) as resp:
+            # Handle different response types
+            if resp.status == 204:  # No content (successful DELETE)
+                return {"success": True}
+
+            try:
+                result = await resp.json()
+            except:
+                text = await resp.text()
+                return {"error": f"Invalid JSON response: {text[:200]}"}
 
-                # Check for WordPress error response
-                if resp.status >= 400:
-                    error_msg = result.get("message", str(result))
-                    error_code = result.get("code", "unknown")
-                    return {"error": f"{error_code}: {error_msg}"}
+            # Check for WordPress error response
+            if resp.status >= 400:
+                error_msg = result.get("message", str(result))
+                error_code = result.get("code", "unknown")
+                return {"error": f"{error_code}: {error_msg}"}
 
-                return result
+            return result
 
     except aiohttp.ClientError as e:
         return {"error": f"Network error: {str(e)}"}
@@ -576,59 +582,61 @@ async def upload_image_to_wordpress(
         return None
 
     try:
-        # Download image from source URL
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                image_url,
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as resp:
-                if resp.status != 200:
-                    print(f"Failed to download image: HTTP {resp.status}")
-                    return None
-
-                image_data = await resp.read()
-                content_type = resp.headers.get("Content-Type", "image/jpeg")
+        # Download image from source URL (the shared session is reused for the upload)
+        session = await get_http_session()
+        async with session.get(
+            image_url,
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as resp:
+            if resp.status != 200:
+                print(f"Failed to download image: HTTP {resp.status}")
+                return None
+
+            image_data = await resp.read()
+            content_type = resp.headers.get("Content-Type", "image/jpeg")
 
         # Upload to WordPress
         auth_header = get_wordpress_auth_header()
         upload_url = get_wordpress_api_url("media")
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": auth_header,
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Type": content_type,
-            }
-
-            async with session.post(
-                upload_url,
-                headers=headers,
-                data=image_data,
-                timeout=aiohttp.ClientTimeout(total=120)
-            ) as resp:
-                if resp.status not in (200, 201):
-                    error_text = await resp.text()
-                    print(f"Failed to upload image: {error_text[:200]}")
-                    return None
-
-                result = await resp.json()
-                attachment_id = result.get("id")
-
-                # Update alt text and source meta if we got an ID
-                if attachment_id and (alt_text or image_url):
-                    meta_update = {}
-                    if alt_text:
-                        meta_update["alt_text"] = alt_text
-                    # Store source URL for deduplication
-                    meta_update["_supabase_source_url"] = image_url
-
-                    await execute_wordpress_request(
-                        f"media/{attachment_id}",
-                        method="POST",
-                        data=meta_update
-                    )
+        headers = {
+            "Authorization": auth_header,
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Type": content_type,
+        }
 
-                return attachment_id
+        # Only a 429 is retried - replaying after a 5xx could upload a duplicate
+        async with await request_with_retry(
+            session,
+            "POST",
+            upload_url,
+            headers=headers,
+            data=image_data,
+            timeout=aiohttp.ClientTimeout(total=120)
+        ) as resp:
+            if resp.status not in (200, 201):
+                error_text = await resp.text()
+                print(f"Failed to upload image: {error_text[:200]}")
+                return None
+
+            result = await resp.json()
+            attachment_id = result.get("id")
+
+            # Update alt text and source meta if we got an ID
+            if attachment_id and (alt_text or image_url):
+                meta_update = {}
+                if alt_text:
+                    meta_update["alt_text"] = alt_text
+                # Store source URL for deduplication
+                meta_update["_supabase_source_url"] = image_url
+
+                await execute_wordpress_request(
+                    f"media/{attachment_id}",
+                    method="POST",
+                    data=meta_update
+                )
+
+            return attachment_id
 
     except Exception as e:
         print(f"Error uploading image: {e}")
@@ -849,31 +857,33 @@ async def update_yoast_term_seo(
     url = f"{WORDPRESS_URL.rstrip('/')}/wp-json/blog-generator/v1/yoast-term-seo"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                headers=headers,
-                json=request_data,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                if resp.status == 404:
-                    # Custom endpoint not installed
-                    return {
-                        "success": False,
-                        "error": "Yoast endpoint not installed. See docs/setup/wordpress/yoast-category-seo-endpoint.php"
-                    }
-
-                try:
-                    result = await resp.json()
-                except:
-                    text = await resp.text()
-                    return {"success": False, "error": f"Invalid response: {text[:100]}"}
+        session = await get_http_session()
+        async with await request_with_retry(
+            session,
+            "POST",
+            url,
+            headers=headers,
+            json=request_data,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status == 404:
+                # Custom endpoint not installed
+                return {
+                    "success": False,
+                    "error": "Yoast endpoint not installed. See docs/setup/wordpress/yoast-category-seo-endpoint.php"
+                }
+
+            try:
+                result = await resp.json()
+            except:
+                text = await resp.text()
+                return {"success": False, "error": f"Invalid response: {text[:100]}"}
 
-                if resp.status >= 400:
-                    error_msg = result.get("message", str(result))
-                    return {"success": False, "error": error_msg}
+            if resp.status >= 400:
+                error_msg = result.get("message", str(result))
+                return {"success": False, "error": error_msg}
 
-                return {"success": True, "updated": result.get("updated", False)}
+            return {"success": True, "updated": result.get("updated", False)}
 
     except aiohttp.ClientError as e:
         return {"success": False, "error": f"Network error: {str(e)}"}
@@ -1046,6 +1056,7 @@ async def sync_post_to_wordpress(
     scheduled_at: Optional[str] = None,
     tags: Optional[list] = None,
     existing_wordpress_id: Optional[int] = None,
+    body_html: Optional[str] = None,
 ) -> dict:
     """
     Sync a blog post to WordPress.
@@ -1065,12 +1076,14 @@ async def sync_post_to_wordpress(
         scheduled_at: ISO 8601 datetime for scheduled posts
         tags: List of tag names
         existing_wordpress_id: Existing WordPress post ID if updating
+        body_html: Already-rendered `content`, if the caller has it
 
     Returns:
         dict with keys: success, wordpress_post_id, error
     """
     # Render content blocks to HTML
-    body_html = render_blocks_to_html(content)
+    if body_html is None:
+        body_html = render_blocks_to_html(content)
 
     # Map status
     wp_status = get_wordpress_status(status)
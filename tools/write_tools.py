@@ -7,7 +7,6 @@ and manage relationships between them.
 
 import json
 from typing import Any
-import aiohttp
 import sys
 import os
 
@@ -23,6 +22,7 @@ from config import (
     WORDPRESS_SYNC_ON_PUBLISH,
     ENABLE_LINK_BUILDING,
 )
+from tools.http_session import get_http_session
 
 
 async def create_blog_post(args: dict[str, Any]) -> dict[str, Any]:
@@ -56,161 +56,169 @@ async def create_blog_post(args: dict[str, Any]) -> dict[str, Any]:
         if args.get("scheduled_at"):
             post_data["scheduled_at"] = args["scheduled_at"]
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-
+        session = await get_http_session()
+        headers = get_supabase_headers()
+
+        async with session.post(
+            f"{SUPABASE_URL}/rest/v1/blog_posts",
+            headers=headers,
+            json=post_data
+        ) as resp:
+            if resp.status not in [200, 201]:
+                error = await resp.text()
+                return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
+
+            result = await resp.json()
+            created_post = result[0] if isinstance(result, list) else result
+            post_id = created_post['id']
+
+        # Link tags if provided (saves a separate tool call)
+        tag_ids = args.get("tag_ids", [])
+        tags_linked = 0
+        if tag_ids:
+            links = [{"post_id": post_id, "tag_id": tag_id} for tag_id in tag_ids]
             async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_posts",
+                f"{SUPABASE_URL}/rest/v1/blog_post_tags",
                 headers=headers,
-                json=post_data
+                json=links
             ) as resp:
-                if resp.status not in [200, 201]:
-                    error = await resp.text()
-                    return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
-
-                result = await resp.json()
-                created_post = result[0] if isinstance(result, list) else result
-                post_id = created_post['id']
-
-            # Link tags if provided (saves a separate tool call)
-            tag_ids = args.get("tag_ids", [])
-            tags_linked = 0
-            if tag_ids:
-                links = [{"post_id": post_id, "tag_id": tag_id} for tag_id in tag_ids]
-                async with session.post(
-                    f"{SUPABASE_URL}/rest/v1/blog_post_tags",
-                    headers=headers,
-                    json=links
-                ) as resp:
-                    if resp.status in [200, 201]:
-                        tags_linked = len(tag_ids)
-
-            result_text = f"Created: {post_id} ({created_post['slug']})" + (f" +{tags_linked} tags" if tags_linked else "")
-
-            # Auto-sync to Shopify if enabled
-            if ENABLE_SHOPIFY_SYNC and SHOPIFY_SYNC_ON_PUBLISH:
-                try:
-                    from tools.shopify_sync import ensure_category_synced, get_post_tags, update_post_shopify_fields
-                    from tools.shopify_tools import sync_post_to_shopify, get_shopify_visibility_label
-
-                    category_id = args.get("category_id")
-                    shopify_blog_gid = None
-
-                    if category_id:
-                        shopify_blog_gid = await ensure_category_synced(category_id)
-
-                    if shopify_blog_gid:
-                        # Get tag names from the tags we just linked
-                        tag_names = []
-                        if tag_ids:
-                            tag_names = await get_post_tags(post_id)
-
-                        # Get author name
-                        author_name = None
-                        author_id = args.get("author_id")
-                        if author_id:
-                            async with session.get(
-                                f"{SUPABASE_URL}/rest/v1/blog_authors?id=eq.{author_id}&select=name&limit=1",
-                                headers=headers
-                            ) as author_resp:
-                                if author_resp.status == 200:
-                                    authors = await author_resp.json()
-                                    if authors:
-                                        author_name = authors[0].get('name')
-
-                        status = args.get("status", DEFAULT_STATUS)
-                        sync_result = await sync_post_to_shopify(
-                            post_id=post_id,
-                            title=args["title"],
-                            slug=args["slug"],
-                            excerpt=args["excerpt"],
-                            content=args["content"],
-                            status=status,
-                            shopify_blog_gid=shopify_blog_gid,
-                            author_name=author_name,
-                            featured_image=args.get("featured_image"),
-                            featured_image_alt=args.get("featured_image_alt"),
-                            seo=args.get("seo"),
-                            scheduled_at=args.get("scheduled_at"),
-                            tags=tag_names,
-                        )
-
-                        if sync_result.get("success"):
-                            await update_post_shopify_fields(post_id, shopify_article_id=sync_result["shopify_article_id"])
-                            visibility = get_shopify_visibility_label(status)
-                            result_text += f" | Synced to Shopify ({visibility})"
-                        else:
-                            await update_post_shopify_fields(post_id, error=sync_result.get("error"))
-                            result_text += f" | Shopify sync failed: {sync_result.get('error', 'Unknown')[:50]}"
+                if resp.status in [200, 201]:
+                    tags_linked = len(tag_ids)
+
+        result_text = f"Created: {post_id} ({created_post['slug']})" + (f" +{tags_linked} tags" if tags_linked else "")
+
+        # Render the content once and share it between the Shopify and WordPress syncs
+        body_html = None
+        if (ENABLE_SHOPIFY_SYNC and SHOPIFY_SYNC_ON_PUBLISH) or (ENABLE_WORDPRESS_SYNC and WORDPRESS_SYNC_ON_PUBLISH):
+            from tools.shopify_tools import render_blocks_to_html
+            body_html = render_blocks_to_html(args["content"])
+
+        # Auto-sync to Shopify if enabled
+        if ENABLE_SHOPIFY_SYNC and SHOPIFY_SYNC_ON_PUBLISH:
+            try:
+                from tools.shopify_sync import ensure_category_synced, get_post_tags, update_post_shopify_fields
+                from tools.shopify_tools import sync_post_to_shopify, get_shopify_visibility_label
+
+                category_id = args.get("category_id")
+                shopify_blog_gid = None
+
+                if category_id:
+                    shopify_blog_gid = await ensure_category_synced(category_id)
+
+                if shopify_blog_gid:
+                    # Get tag names from the tags we just linked
+                    tag_names = []
+                    if tag_ids:
+                        tag_names = await get_post_tags(post_id)
+
+                    # Get author name
+                    author_name = None
+                    author_id = args.get("author_id")
+                    if author_id:
+                        async with session.get(
+                            f"{SUPABASE_URL}/rest/v1/blog_authors?id=eq.{author_id}&select=name&limit=1",
+                            headers=headers
+                        ) as author_resp:
+                            if author_resp.status == 200:
+                                authors = await author_resp.json()
+                                if authors:
+                                    author_name = authors[0].get('name')
+
+                    status = args.get("status", DEFAULT_STATUS)
+                    sync_result = await sync_post_to_shopify(
+                        post_id=post_id,
+                        title=args["title"],
+                        slug=args["slug"],
+                        excerpt=args["excerpt"],
+                        content=args["content"],
+                        status=status,
+                        shopify_blog_gid=shopify_blog_gid,
+                        author_name=author_name,
+                        featured_image=args.get("featured_image"),
+                        featured_image_alt=args.get("featured_image_alt"),
+                        seo=args.get("seo"),
+                        scheduled_at=args.get("scheduled_at"),
+                        tags=tag_names,
+                        body_html=body_html,
+                    )
+
+                    if sync_result.get("success"):
+                        await update_post_shopify_fields(post_id, shopify_article_id=sync_result["shopify_article_id"])
+                        visibility = get_shopify_visibility_label(status)
+                        result_text += f" | Synced to Shopify ({visibility})"
                     else:
-                        result_text += " | Shopify: no category synced"
-
-                except Exception as sync_error:
-                    result_text += f" | Shopify sync error: {str(sync_error)[:50]}"
-
-            # Auto-sync to WordPress if enabled
-            if ENABLE_WORDPRESS_SYNC and WORDPRESS_SYNC_ON_PUBLISH:
-                try:
-                    from tools.wordpress_sync import ensure_category_synced as wp_ensure_category_synced, get_post_tags as wp_get_post_tags, update_post_wordpress_fields
-                    from tools.wordpress_tools import sync_post_to_wordpress, get_wordpress_visibility_label
-
-                    category_id = args.get("category_id")
-                    wordpress_category_id = None
-
-                    if category_id:
-                        wordpress_category_id = await wp_ensure_category_synced(category_id)
-
-                    if wordpress_category_id:
-                        # Get tag names from the tags we just linked
-                        tag_names = []
-                        if tag_ids:
-                            tag_names = await wp_get_post_tags(post_id)
-
-                        status = args.get("status", DEFAULT_STATUS)
-                        wp_sync_result = await sync_post_to_wordpress(
-                            post_id=post_id,
-                            title=args["title"],
-                            slug=args["slug"],
-                            excerpt=args["excerpt"],
-                            content=args["content"],
-                            status=status,
-                            wordpress_category_id=wordpress_category_id,
-                            featured_image=args.get("featured_image"),
-                            featured_image_alt=args.get("featured_image_alt"),
-                            seo=args.get("seo"),
-                            scheduled_at=args.get("scheduled_at"),
-                            tags=tag_names,
-                        )
-
-                        if wp_sync_result.get("success"):
-                            await update_post_wordpress_fields(post_id, wordpress_post_id=wp_sync_result["wordpress_post_id"])
-                            visibility = get_wordpress_visibility_label(status)
-                            result_text += f" | WP synced ({visibility})"
-                        else:
-                            await update_post_wordpress_fields(post_id, error=wp_sync_result.get("error"))
-                            result_text += f" | WP sync failed: {wp_sync_result.get('error', 'Unknown')[:50]}"
+                        await update_post_shopify_fields(post_id, error=sync_result.get("error"))
+                        result_text += f" | Shopify sync failed: {sync_result.get('error', 'Unknown')[:50]}"
+                else:
+                    result_text += " | Shopify: no category synced"
+
+            except Exception as sync_error:
+                result_text += f" | Shopify sync error: {str(sync_error)[:50]}"
+
+        # Auto-sync to WordPress if enabled
+        if ENABLE_WORDPRESS_SYNC and WORDPRESS_SYNC_ON_PUBLISH:
+            try:
+                from tools.wordpress_sync import ensure_category_synced as wp_ensure_category_synced, get_post_tags as wp_get_post_tags, update_post_wordpress_fields
+                from tools.wordpress_tools import sync_post_to_wordpress, get_wordpress_visibility_label
+
+                category_id = args.get("category_id")
+                wordpress_category_id = None
+
+                if category_id:
+                    wordpress_category_id = await wp_ensure_category_synced(category_id)
+
+                if wordpress_category_id:
+                    # Get tag names from the tags we just linked
+                    tag_names = []
+                    if tag_ids:
+                        tag_names = await wp_get_post_tags(post_id)
+
+                    status = args.get("status", DEFAULT_STATUS)
+                    wp_sync_result = await sync_post_to_wordpress(
+                        post_id=post_id,
+                        title=args["title"],
+                        slug=args["slug"],
+                        excerpt=args["excerpt"],
+                        content=args["content"],
+                        status=status,
+                        wordpress_category_id=wordpress_category_id,
+                        featured_image=args.get("featured_image"),
+                        featured_image_alt=args.get("featured_image_alt"),
+                        seo=args.get("seo"),
+                        scheduled_at=args.get("scheduled_at"),
+                        tags=tag_names,
+                        body_html=body_html,
+                    )
+
+                    if wp_sync_result.get("success"):
+                        await update_post_wordpress_fields(post_id, wordpress_post_id=wp_sync_result["wordpress_post_id"])
+                        visibility = get_wordpress_visibility_label(status)
+                        result_text += f" | WP synced ({visibility})"
                     else:
-                        result_text += " | WP: no category synced"
-
-                except Exception as wp_sync_error:
-                    result_text += f" | WP sync error: {str(wp_sync_error)[:50]}"
-
-            # Auto-extract and save links if enabled
-            if ENABLE_LINK_BUILDING:
-                try:
-                    from tools.link_tools import save_post_links
-                    links_saved = await save_post_links(post_id, args["content"])
-                    if links_saved > 0:
-                        result_text += f" +{links_saved} links"
-                except Exception:
-                    pass  # Link tracking is non-critical, don't fail post creation
-
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": result_text
-                }]
-            }
+                        await update_post_wordpress_fields(post_id, error=wp_sync_result.get("error"))
+                        result_text += f" | WP sync failed: {wp_sync_result.get('error', 'Unknown')[:50]}"
+                else:
+                    result_text += " | WP: no category synced"
+
+            except Exception as wp_sync_error:
+                result_text += f" | WP sync error: {str(wp_sync_error)[:50]}"
+
+        # Auto-extract and save links if enabled
+        if ENABLE_LINK_BUILDING:
+            try:
+                from tools.link_tools import save_post_links
+                links_saved = await save_post_links(post_id, args["content"])
+                if links_saved > 0:
+                    result_text += f" +{links_saved} links"
+            except Exception:
+                pass  # Link tracking is non-critical, don't fail post creation
+
+        return {
+            "content": [{
+                "type": "text",
+                "text": result_text
+            }]
+        }
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -225,20 +233,20 @@ async def create_category(args: dict[str, Any]) -> dict[str, Any]:
         if args.get("seo"):
             category_data["seo"] = args["seo"]
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_categories",
-                headers=headers,
-                json=category_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    result = await resp.json()
-                    created = result[0] if isinstance(result, list) else result
-                    return {"content": [{"type": "text", "text": f"Created category: {created['id']} ({created['slug']})"}]}
-                else:
-                    error = await resp.text()
-                    return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.post(
+            f"{SUPABASE_URL}/rest/v1/blog_categories",
+            headers=headers,
+            json=category_data
+        ) as resp:
+            if resp.status in [200, 201]:
+                result = await resp.json()
+                created = result[0] if isinstance(result, list) else result
+                return {"content": [{"type": "text", "text": f"Created category: {created['id']} ({created['slug']})"}]}
+            else:
+                error = await resp.text()
+                return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -249,20 +257,20 @@ async def create_tag(args: dict[str, Any]) -> dict[str, Any]:
     try:
         tag_data = {"slug": args["slug"], "name": args["name"]}
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_tags",
-                headers=headers,
-                json=tag_data
-            ) as resp:
-                if resp.status in [200, 201]:
-                    result = await resp.json()
-                    created = result[0] if isinstance(result, list) else result
-                    return {"content": [{"type": "text", "text": f"Created tag: {created['id']} ({created['slug']})"}]}
-                else:
-                    error = await resp.text()
-                    return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.post(
+            f"{SUPABASE_URL}/rest/v1/blog_tags",
+            headers=headers,
+            json=tag_data
+        ) as resp:
+            if resp.status in [200, 201]:
+                result = await resp.json()
+                created = result[0] if isinstance(result, list) else result
+                return {"content": [{"type": "text", "text": f"Created tag: {created['id']} ({created['slug']})"}]}
+            else:
+                error = await resp.text()
+                return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -279,18 +287,18 @@ async def link_tags_to_post(args: dict[str, Any]) -> dict[str, Any]:
 
         links = [{"post_id": post_id, "tag_id": tag_id} for tag_id in tag_ids]
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.post(
-                f"{SUPABASE_URL}/rest/v1/blog_post_tags",
-                headers=headers,
-                json=links
-            ) as resp:
-                if resp.status in [200, 201]:
-                    return {"content": [{"type": "text", "text": f"Linked {len(tag_ids)} tags"}]}
-                else:
-                    error = await resp.text()
-                    return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.post(
+            f"{SUPABASE_URL}/rest/v1/blog_post_tags",
+            headers=headers,
+            json=links
+        ) as resp:
+            if resp.status in [200, 201]:
+                return {"content": [{"type": "text", "text": f"Linked {len(tag_ids)} tags"}]}
+            else:
+                error = await resp.text()
+                return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -306,21 +314,21 @@ async def update_post_status(args: dict[str, Any]) -> dict[str, Any]:
         if status not in ["draft", "published", "scheduled", "archived"]:
             return {"content": [{"type": "text", "text": f"Invalid status: {status}"}], "is_error": True}
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json={
-                    "status": status,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-            ) as resp:
-                if resp.status in [200, 204]:
-                    return {"content": [{"type": "text", "text": f"Updated: {post_id} → {status}"}]}
-                else:
-                    error = await resp.text()
-                    return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json={
+                "status": status,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
+        ) as resp:
+            if resp.status in [200, 204]:
+                return {"content": [{"type": "text", "text": f"Updated: {post_id} → {status}"}]}
+            else:
+                error = await resp.text()
+                return {"content": [{"type": "text", "text": f"Error: {error}"}], "is_error": True}
 
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "is_error": True}
@@ -337,14 +345,14 @@ async def update_post_image(post_id: str, image_url: str, alt_text: str = None)
         if alt_text:
             update_data["featured_image_alt"] = alt_text
 
-        async with aiohttp.ClientSession() as session:
-            headers = get_supabase_headers()
-            async with session.patch(
-                f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
-                headers=headers,
-                json=update_data
-            ) as resp:
-                return resp.status in [200, 204]
+        session = await get_http_session()
+        headers = get_supabase_headers()
+        async with session.patch(
+            f"{SUPABASE_URL}/rest/v1/blog_posts?id=eq.{post_id}",
+            headers=headers,
+            json=update_data
+        ) as resp:
+            return resp.status in [200, 204]
     except Exception:
         return False
 